@@ -8,6 +8,7 @@ from .git_ops import (
     configure_gitignore,
     setup_remote,
     initial_commit,
+    initial_commit_with_gitignore,
     get_repo_status,
     pull_changes,
     push_changes,
@@ -26,6 +27,7 @@ from .git_ops import (
     
     # Utilities
     quick_sync,
+    quick_sync_many,
     get_git_info,
 )
 
@@ -37,6 +39,7 @@ __all__ = [
     "configure_gitignore",
     "setup_remote",
     "initial_commit",
+    "initial_commit_with_gitignore",
     "get_repo_status",
     "pull_changes",
     "push_changes",
@@ -55,5 +58,6 @@ __all__ = [
     
     # Utilities
     "quick_sync",
+    "quick_sync_many",
     "get_git_info",
 ]
\ No newline at end of file
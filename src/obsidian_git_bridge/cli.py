@@ -1,22 +1,74 @@
 """CLI entry point for Obsidian Git Bridge."""
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.traceback import install as install_traceback
 
 from . import __version__
-from .wrappers import GitOperations, ObsidianConfig, VPSSetupGenerator
-from .doctor import Doctor
 
-install_traceback()
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=None)
+def _get_console() -> "Console":
+    """Create the shared Rich console on first use (keeps --help fast)."""
+    from rich.console import Console
+    from rich.traceback import install as install_traceback
+    
+    install_traceback()
+    return Console()
+
+
+def _emit(lines: list[str]) -> None:
+    """Write a block of Rich-markup lines in one go.
+    
+    Markup is parsed once for the whole block; when stdout isn't a terminal
+    (cron logs, pipes) it is stripped and written as plain text.
+    """
+    from rich.text import Text
+    
+    console = _get_console()
+    block = "\n".join(lines)
+    if console.is_terminal:
+        console.print(block, highlight=False)
+    else:
+        sys.stdout.write(Text.from_markup(block).plain + "\n")
+        sys.stdout.flush()
+
+
+def _vault_cache_file() -> Path:
+    """Return the file holding the last auto-detected vault path."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "obsidian-git-bridge" / "vault"
+
+
+def _load_cached_vault() -> Optional[Path]:
+    """Return the cached vault path if it still exists."""
+    try:
+        path = Path(_vault_cache_file().read_text(encoding="utf-8").strip())
+    except OSError:
+        return None
+    return path if path.is_dir() else None
+
+
+def _store_cached_vault(path: Path) -> None:
+    """Persist an auto-detected vault path; failures are ignored."""
+    cache_file = _vault_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(f"{path}\n", encoding="utf-8")
+    except OSError:
+        pass
 
 
 def get_vault_path(vault_path: str | None) -> Path:
     """Resolve vault path from argument or auto-detect."""
+    console = _get_console()
     if vault_path:
         path = Path(vault_path).expanduser().resolve()
         if not path.exists():
@@ -24,10 +76,18 @@ def get_vault_path(vault_path: str | None) -> Path:
             sys.exit(1)
         return path
     
+    # Last auto-detected vault (saves a scan on repeated cron runs)
+    cached = _load_cached_vault()
+    if cached:
+        console.print(f"[green]Auto-detected vault: {cached}[/green]")
+        return cached
+    
     # Auto-detect
+    from .wrappers import ObsidianConfig
     config = ObsidianConfig()
     detected = config.detect_vault_path()
     if detected:
+        _store_cached_vault(detected)
         console.print(f"[green]Auto-detected vault: {detected}[/green]")
         return detected
     
@@ -52,12 +112,15 @@ def cli(ctx: click.Context, vault_path: str | None, verbose: bool) -> None:
 @click.pass_context
 def init(ctx: click.Context, gitignore: bool) -> None:
     """Initialize Git repository in vault."""
+    from .wrappers import GitOperations, ObsidianConfig
+    
+    console = _get_console()
     vault = get_vault_path(ctx.obj["vault_path"])
     verbose = ctx.obj["verbose"]
     
-    git_ops = GitOperations(vault, verbose=verbose)
+    git_ops = GitOperations.for_vault(vault, verbose=verbose)
     
-    if git_ops.is_git_repo():
+    if git_ops.probe()["is_repo"]:
         console.print(f"[yellow]Vault already initialized: {vault}[/yellow]")
         return
     
@@ -65,9 +128,17 @@ def init(ctx: click.Context, gitignore: bool) -> None:
     console.print(f"[green]Initialized Git repo in: {vault}[/green]")
     
     if gitignore:
+        from .git_ops import GitError
+        
         obsidian_config = ObsidianConfig()
         obsidian_config.create_gitignore(vault)
         console.print("[green]Created Obsidian .gitignore[/green]")
+        
+        try:
+            result = git_ops.commit_gitignore()
+            console.print(f"[green]{result['message']}[/green]")
+        except GitError as e:
+            console.print(f"[yellow]Could not commit .gitignore: {e.details or e.message}[/yellow]")
 
 
 @cli.command(name="setup-remote")
@@ -82,12 +153,15 @@ def setup_remote(
     auth: str | None
 ) -> None:
     """Configure GitHub/GitLab remote."""
+    from .wrappers import GitOperations
+    
+    console = _get_console()
     vault = get_vault_path(ctx.obj["vault_path"])
     verbose = ctx.obj["verbose"]
     
-    git_ops = GitOperations(vault, verbose=verbose)
+    git_ops = GitOperations.for_vault(vault, verbose=verbose)
     
-    if not git_ops.is_git_repo():
+    if not git_ops.probe()["is_repo"]:
         console.print("[red]Error: Not a Git repository. Run 'init' first.[/red]")
         sys.exit(1)
     
@@ -103,14 +177,18 @@ def setup_remote(
     console.print(f"[green]Added remote '{name}': {remote_url}[/green]")
     
     if auth == "https":
-        console.print("[yellow]Note: Configure credentials with: git config credential.helper store[/yellow]")
+        console.print(
+            "[yellow]Note: Configure credentials with: git config credential.helper store[/yellow]"
+        )
     else:
         console.print("[green]SSH authentication configured[/green]")
 
 
 @cli.command(name="setup-vps")
 @click.option("--output", "-o", type=Path, help="Output directory for scripts")
-@click.option("--cron-schedule", default="*/15 * * * *", help="Cron schedule (default: every 15 min)")
+@click.option(
+    "--cron-schedule", default="*/15 * * * *", help="Cron schedule (default: every 15 min)"
+)
 @click.pass_context
 def setup_vps(
     ctx: click.Context, 
@@ -118,6 +196,9 @@ def setup_vps(
     cron_schedule: str
 ) -> None:
     """Generate VPS setup instructions and scripts."""
+    from .wrappers import VPSSetupGenerator
+    
+    console = _get_console()
     vault = get_vault_path(ctx.obj["vault_path"])
     
     if output is None:
@@ -135,44 +216,53 @@ def setup_vps(
 
 
 @cli.command()
+@click.option("--untracked", is_flag=True, help="Also list untracked files (walks the whole vault)")
 @click.pass_context
-def status(ctx: click.Context) -> None:
+def status(ctx: click.Context, untracked: bool) -> None:
     """Check sync status of vault."""
+    from .wrappers import GitOperations
+    
+    console = _get_console()
     vault = get_vault_path(ctx.obj["vault_path"])
     verbose = ctx.obj["verbose"]
     
-    git_ops = GitOperations(vault, verbose=verbose)
+    git_ops = GitOperations.for_vault(vault, verbose=verbose)
     
-    if not git_ops.is_git_repo():
+    if not git_ops.probe()["is_repo"]:
         console.print("[red]Error: Not a Git repository.[/red]")
         sys.exit(1)
     
-    status_info = git_ops.get_status()
+    status_info = git_ops.get_status(include_untracked=untracked)
+    
+    from rich.markup import escape
     
-    console.print(f"\n[bold]Vault:[/bold] {vault}")
-    console.print(f"[bold]Branch:[/bold] {status_info['branch']}")
-    console.print(f"[bold]Remote:[/bold] {status_info['remote'] or 'Not configured'}")
+    lines = [
+        f"\n[bold]Vault:[/bold] {escape(str(vault))}",
+        f"[bold]Branch:[/bold] {status_info['branch']}",
+        f"[bold]HEAD:[/bold] {status_info['head'] or 'No commits yet'}",
+        f"[bold]Remote:[/bold] {status_info['remote'] or 'Not configured'}",
+    ]
     
     if status_info["ahead"]:
-        console.print(f"[yellow]Ahead by {status_info['ahead']} commit(s)[/yellow]")
+        lines.append(f"[yellow]Ahead by {status_info['ahead']} commit(s)[/yellow]")
     if status_info["behind"]:
-        console.print(f"[yellow]Behind by {status_info['behind']} commit(s)[/yellow]")
+        lines.append(f"[yellow]Behind by {status_info['behind']} commit(s)[/yellow]")
     
     if status_info["modified"]:
-        console.print(f"\n[bold]Modified files ({len(status_info['modified'])}):[/bold]")
-        for f in status_info["modified"][:10]:
-            console.print(f"  • {f}")
+        lines.append(f"\n[bold]Modified files ({len(status_info['modified'])}):[/bold]")
+        lines.extend(f"  • {escape(f)}" for f in status_info["modified"][:10])
         if len(status_info["modified"]) > 10:
-            console.print(f"  ... and {len(status_info['modified']) - 10} more")
+            lines.append(f"  ... and {len(status_info['modified']) - 10} more")
     else:
-        console.print("\n[green]No uncommitted changes[/green]")
+        lines.append("\n[green]No uncommitted changes[/green]")
     
     if status_info["untracked"]:
-        console.print(f"\n[bold]Untracked files ({len(status_info['untracked'])}):[/bold]")
-        for f in status_info["untracked"][:5]:
-            console.print(f"  • {f}")
+        lines.append(f"\n[bold]Untracked files ({len(status_info['untracked'])}):[/bold]")
+        lines.extend(f"  • {escape(f)}" for f in status_info["untracked"][:5])
         if len(status_info["untracked"]) > 5:
-            console.print(f"  ... and {len(status_info['untracked']) - 5} more")
+            lines.append(f"  ... and {len(status_info['untracked']) - 5} more")
+    
+    _emit(lines)
 
 
 @cli.command()
@@ -180,6 +270,9 @@ def status(ctx: click.Context) -> None:
 @click.pass_context
 def doctor(ctx: click.Context, fix: bool) -> None:
     """Diagnose common issues with vault Git setup."""
+    from .doctor import Doctor
+    
+    console = _get_console()
     vault = get_vault_path(ctx.obj["vault_path"])
     verbose = ctx.obj["verbose"]
     
@@ -190,51 +283,55 @@ def doctor(ctx: click.Context, fix: bool) -> None:
         console.print("[green]✓ All checks passed![/green]")
         return
     
-    console.print(f"\n[yellow]Found {len(issues)} issue(s):[/yellow]")
+    from rich.markup import escape
+    
+    lines = [f"\n[yellow]Found {len(issues)} issue(s):[/yellow]"]
     for issue in issues:
         status = "[green]✓ Fixed[/green]" if issue.get("fixed") else "[red]✗[/red]"
-        console.print(f"{status} {issue['message']}")
+        lines.append(f"{status} {escape(issue['message'])}")
+    _emit(lines)
 
 
 @cli.command(name="sync-now")
-@click.option("--message", "-m", default="Auto-sync from obsidian-git-bridge", help="Commit message")
+@click.option(
+    "--message", "-m", default="Auto-sync from obsidian-git-bridge", help="Commit message"
+)
 @click.option("--push", is_flag=True, default=True, help="Push after commit")
 @click.pass_context
 def sync_now(ctx: click.Context, message: str, push: bool) -> None:
     """Manual sync trigger - commit and push changes."""
+    from .wrappers import GitOperations
+    
+    console = _get_console()
     vault = get_vault_path(ctx.obj["vault_path"])
     verbose = ctx.obj["verbose"]
     
-    git_ops = GitOperations(vault, verbose=verbose)
+    git_ops = GitOperations.for_vault(vault, verbose=verbose)
     
-    if not git_ops.is_git_repo():
+    if not git_ops.probe()["is_repo"]:
         console.print("[red]Error: Not a Git repository.[/red]")
         sys.exit(1)
     
-    # Pull first to avoid conflicts
-    try:
-        git_ops.pull()
-        console.print("[green]Pulled latest changes[/green]")
-    except Exception as e:
-        if verbose:
-            console.print(f"[yellow]Pull warning: {e}[/yellow]")
+    # Pull, commit and push in one git pipeline
+    result = git_ops.sync_pipeline(message, push=push)
     
-    # Stage and commit
-    result = git_ops.commit_all(message)
+    if result["pulled"]:
+        console.print("[green]Pulled latest changes[/green]")
+    elif verbose and result["warning"]:
+        console.print(f"[yellow]Pull warning: {result['warning']}[/yellow]")
     
     if result["committed"]:
         console.print(f"[green]Committed: {result['message']}[/green]")
-    else:
+    elif result["nothing_to_commit"]:
         console.print("[blue]No changes to commit[/blue]")
     
-    # Push if enabled
-    if push:
-        try:
-            git_ops.push()
-            console.print("[green]Pushed to remote[/green]")
-        except Exception as e:
-            console.print(f"[red]Push failed: {e}[/red]")
-            sys.exit(1)
+    if not result["success"]:
+        step = (result["failed_step"] or "sync").capitalize()
+        console.print(f"[red]{step} failed: {result['error']}[/red]")
+        sys.exit(1)
+    
+    if result["pushed"]:
+        console.print("[green]Pushed to remote[/green]")
 
 
 def main() -> None:
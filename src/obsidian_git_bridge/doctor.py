@@ -1,9 +1,88 @@
 """Doctor module for diagnosing common issues."""
 
+import configparser
 import logging
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
+from typing import Iterator, Optional
 
-from git import Repo, GitCommandError
+from .git_ops import _GIT, _GIT_READ, _git_env
+
+# Files above this size with a media/archive extension are flagged
+LARGE_FILE_THRESHOLD = 10 * 1024 * 1024
+_LARGE_EXTS = (".mp4", ".mov", ".avi", ".pdf", ".zip", ".dmg", ".iso")
+_LARGE_EXTS_BYTES = tuple(os.fsencode(ext) for ext in _LARGE_EXTS)
+_SEP_BYTES = os.fsencode(os.sep)
+
+
+def _exists(path: str) -> bool:
+    """Check a path with a bare os.stat (no Path object)."""
+    try:
+        os.stat(path)
+        return True
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _walk_bytes(root: bytes, prefix: bytes = b"") -> Iterator[bytes]:
+    """Yield file paths under `root` (relative, as bytes), skipping .git."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != b".git":
+                        yield from _walk_bytes(entry.path, prefix + entry.name + _SEP_BYTES)
+                elif entry.is_file():
+                    yield prefix + entry.name
+    except OSError:
+        return
+
+
+def _load_git_config(*paths: str) -> configparser.ConfigParser:
+    """Parse Git config files with configparser; missing files are skipped.
+    
+    Raises configparser.Error for syntax configparser can't handle.
+    """
+    # Git allows bare boolean keys, repeated keys/sections and literal '%'
+    parser = configparser.ConfigParser(strict=False, interpolation=None, allow_no_value=True)
+    parser.read(paths, encoding="utf-8")
+    return parser
+
+
+def _config_sections(parser: configparser.ConfigParser, name: str) -> list[str]:
+    """Return section names matching `name` or `name "subsection"` (case-insensitive)."""
+    return [s for s in parser.sections() if s.split(" ", 1)[0].lower() == name]
+
+
+def _read_user_identity(vault: Path) -> tuple[Optional[str], Optional[str]]:
+    """
+    Resolve user.name and user.email the way git does.
+    
+    One `git config` call covers every source configparser can't follow:
+    system and global files, GIT_CONFIG_GLOBAL, and [include]/[includeIf]
+    sections. A missing or hanging git reports no identity.
+    """
+    try:
+        result = subprocess.run(
+            [*_GIT_READ, "-C", str(vault), "config", "-z", "--get-regexp",
+             r"^user\.(name|email)$"],
+            capture_output=True,
+            env=_git_env(),
+            timeout=10
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None, None
+    
+    identity: dict[str, str] = {}
+    # "key\nvalue" records; the last value wins, as for `git config key`
+    for record in result.stdout.split(b"\x00"):
+        key, _, value = record.partition(b"\n")
+        if value:
+            identity[key.decode("utf-8", "replace")] = value.decode("utf-8", "replace")
+    return identity.get("user.name"), identity.get("user.email")
 
 
 class Doctor:
@@ -19,127 +98,161 @@ class Doctor:
     
     def run_checks(self, fix: bool = False) -> list[dict]:
         """Run all diagnostic checks."""
-        self.issues = []
+        checks = (
+            self._check_repo_metadata,
+            self._check_gitignore_exists,
+            self._check_ssh_key,
+            self._check_large_files,
+        )
         
-        self._check_git_initialized()
-        self._check_gitignore_exists()
-        self._check_remote_configured()
-        self._check_user_config()
-        self._check_ssh_key()
-        self._check_large_files()
+        # Checks are independent and I/O-bound (stat, git, tree walk)
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check) for check in checks]
+            self.issues = list(chain.from_iterable(f.result() for f in futures))
         
         if fix:
             self._attempt_fixes()
         
         return self.issues
     
-    def _check_git_initialized(self) -> None:
-        """Check if Git repository is initialized."""
-        git_dir = self.vault_path / ".git"
-        if not git_dir.exists():
-            self.issues.append({
+    def _check_repo_metadata(self) -> list[dict]:
+        """Check repository initialization, remotes, and user config."""
+        issues: list[dict] = []
+        git_dir = f"{self.vault_path}{os.sep}.git"
+        if not _exists(git_dir):
+            issues.append({
                 "severity": "error",
                 "message": "Git repository not initialized",
                 "fixable": True,
                 "fix_action": "init",
             })
-    
-    def _check_gitignore_exists(self) -> None:
-        """Check if .gitignore exists."""
-        gitignore = self.vault_path / ".gitignore"
-        if not gitignore.exists():
-            self.issues.append({
-                "severity": "warning",
-                "message": ".gitignore not found (Obsidian workspace files may be tracked)",
-                "fixable": True,
-                "fix_action": "gitignore",
-            })
-    
-    def _check_remote_configured(self) -> None:
-        """Check if remote repository is configured."""
-        git_dir = self.vault_path / ".git"
-        if not git_dir.exists():
-            return
+            return issues
         
+        # Remotes come from .git/config alone, read directly; the identity
+        # may come from included or system files, so git resolves it
         try:
-            repo = Repo(self.vault_path)
-            remotes = list(repo.remotes)
-            if not remotes:
-                self.issues.append({
-                    "severity": "warning",
-                    "message": "No remote repository configured",
-                    "fixable": False,
-                    "fix_action": None,
-                })
-        except GitCommandError as e:
-            self.issues.append({
+            local = _load_git_config(f"{git_dir}{os.sep}config")
+        except configparser.Error as e:
+            issues.append({
                 "severity": "error",
-                "message": f"Git error: {e}",
+                "message": f"Could not parse Git config: {e}",
                 "fixable": False,
                 "fix_action": None,
             })
+            return issues
+        
+        user_name, user_email = _read_user_identity(self.vault_path)
+        
+        has_remote = any(
+            local.has_option(section, "url") for section in _config_sections(local, "remote")
+        )
+        
+        if not has_remote:
+            issues.append({
+                "severity": "warning",
+                "message": "No remote repository configured",
+                "fixable": False,
+                "fix_action": None,
+            })
+        
+        if not user_name:
+            issues.append({
+                "severity": "warning",
+                "message": "Git user.name not configured",
+                "fixable": True,
+                "fix_action": "user_config",
+            })
+        
+        if not user_email:
+            issues.append({
+                "severity": "warning",
+                "message": "Git user.email not configured",
+                "fixable": True,
+                "fix_action": "user_config",
+            })
+        
+        return issues
     
-    def _check_user_config(self) -> None:
-        """Check if Git user is configured."""
-        git_dir = self.vault_path / ".git"
-        if not git_dir.exists():
-            return
+    def _check_gitignore_exists(self) -> list[dict]:
+        """Check if .gitignore exists."""
+        issues: list[dict] = []
+        if not _exists(f"{self.vault_path}{os.sep}.gitignore"):
+            issues.append({
+                "severity": "warning",
+                "message": ".gitignore not found (Obsidian workspace files may be tracked)",
+                "fixable": True,
+                "fix_action": "gitignore",
+            })
         
-        try:
-            repo = Repo(self.vault_path)
-            config = repo.config_reader()
-            
-            try:
-                config.get_value("user", "name")
-            except Exception:
-                self.issues.append({
-                    "severity": "warning",
-                    "message": "Git user.name not configured",
-                    "fixable": True,
-                    "fix_action": "user_config",
-                })
-            
-            try:
-                config.get_value("user", "email")
-            except Exception:
-                self.issues.append({
-                    "severity": "warning",
-                    "message": "Git user.email not configured",
-                    "fixable": True,
-                    "fix_action": "user_config",
-                })
-        except GitCommandError:
-            pass
+        return issues
     
-    def _check_ssh_key(self) -> None:
+    def _check_ssh_key(self) -> list[dict]:
         """Check if SSH key exists."""
-        ssh_dir = Path.home() / ".ssh"
-        ssh_keys = list(ssh_dir.glob("id_*"))
+        issues: list[dict] = []
+        # Stop at the first id_* entry instead of globbing the whole directory
+        try:
+            with os.scandir(os.path.join(os.path.expanduser("~"), ".ssh")) as entries:
+                has_key = any(entry.name.startswith("id_") for entry in entries)
+        except OSError:
+            has_key = False
         
-        if not ssh_keys:
-            self.issues.append({
+        if not has_key:
+            issues.append({
                 "severity": "info",
                 "message": "No SSH keys found (required for SSH authentication)",
                 "fixable": False,
                 "fix_action": None,
             })
+        
+        return issues
     
-    def _check_large_files(self) -> None:
+    def _check_large_files(self) -> list[dict]:
         """Check for large files that shouldn't be in Git."""
-        large_extensions = {".mp4", ".mov", ".avi", ".pdf", ".zip", ".dmg", ".iso"}
+        issues: list[dict] = []
         large_files: list[Path] = []
         
-        for ext in large_extensions:
-            large_files.extend(self.vault_path.rglob(f"*{ext}"))
+        vault = os.fsencode(self.vault_path)
+        
+        for rel_path in self._list_vault_files():
+            # One C-level suffix check per path; matches VIDEO.MP4 too
+            if not rel_path.lower().endswith(_LARGE_EXTS_BYTES):
+                continue
+            try:
+                size = os.stat(os.path.join(vault, rel_path)).st_size
+            except OSError:
+                continue
+            if size > LARGE_FILE_THRESHOLD:
+                # Only the few survivors become Path objects
+                large_files.append(Path(os.fsdecode(rel_path)))
         
         if large_files:
-            self.issues.append({
+            issues.append({
                 "severity": "warning",
                 "message": f"Found {len(large_files)} large file(s) that may not belong in Git",
                 "fixable": False,
                 "fix_action": None,
-                "details": [str(f.relative_to(self.vault_path)) for f in large_files[:5]],
+                "details": [str(f) for f in large_files[:5]],
             })
+        
+        return issues
+    
+    def _list_vault_files(self) -> Iterator[bytes]:
+        """List vault files relative to the vault root, honoring .gitignore if possible."""
+        try:
+            result = subprocess.run(
+                [*_GIT_READ, "-C", str(self.vault_path), "ls-files", "-z",
+                 "--cached", "--others", "--exclude-standard"],
+                capture_output=True,
+                env=_git_env(),
+                timeout=60
+            )
+            if result.returncode == 0:
+                return (p for p in result.stdout.split(b"\x00") if p)
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            pass
+        
+        # Not a Git repository (or Git unavailable): walk the tree once
+        return _walk_bytes(os.fsencode(self.vault_path))
     
     def _attempt_fixes(self) -> None:
         """Attempt to fix auto-fixable issues."""
@@ -150,24 +263,29 @@ class Doctor:
             action = issue.get("fix_action")
             
             if action == "init":
-                from .git_ops import GitOperations
+                from .wrappers import GitOperations
                 git_ops = GitOperations(self.vault_path)
                 git_ops.init_repo()
                 issue["fixed"] = True
             
             elif action == "gitignore":
-                from .obsidian_config import ObsidianConfig
+                from .wrappers import ObsidianConfig
                 config = ObsidianConfig()
                 config.create_gitignore(self.vault_path)
                 issue["fixed"] = True
             
             elif action == "user_config":
-                try:
-                    repo = Repo(self.vault_path)
-                    config = repo.config_writer()
-                    config.set_value("user", "name", "Obsidian Git Bridge")
-                    config.set_value("user", "email", "bridge@obsidian.local")
-                    config.release()
+                results = [
+                    subprocess.run(
+                        [_GIT, "-C", str(self.vault_path), "config", "--local", key, value],
+                        capture_output=True,
+                        env=_git_env(),
+                        timeout=10
+                    )
+                    for key, value in (
+                        ("user.name", "Obsidian Git Bridge"),
+                        ("user.email", "bridge@obsidian.local"),
+                    )
+                ]
+                if all(r.returncode == 0 for r in results):
                     issue["fixed"] = True
-                except GitCommandError:
-                    pass
@@ -2,30 +2,203 @@
 Git operations module for obsidian-git-bridge.
 
 Provides core Git functionality for managing Obsidian vaults with Git version control.
-Uses GitPython as the primary interface with subprocess fallback for edge cases.
+Init, remote setup, pull and push always run git directly; GitPython,
+when installed (the optional "gitpython" extra), is used for the initial
+commit.
+Status reads the repository in-process through pygit2 when the optional
+"pygit2" extra is installed, and runs `git status` otherwise.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import re
+import select
+import shlex
+import shutil
+import signal
+import stat
 import subprocess
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import IO, Any, Callable, Optional, Sequence, Tuple, TypeVar, Union, cast
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Try to import GitPython
-try:
-    import git
-    from git import GitCommandError, InvalidGitRepositoryError, NoSuchPathError
-    GITPYTHON_AVAILABLE = True
-except ImportError:
-    GITPYTHON_AVAILABLE = False
-    logger.warning("GitPython not available, using subprocess fallback only")
+
+@lru_cache(maxsize=None)
+def _gitpython() -> Any:
+    """Import GitPython on first use; None if it isn't installed.
+    
+    Deferred so callers that never touch a Repo (gitignore, status via
+    porcelain) don't pay GitPython's import cost.
+    """
+    try:
+        import git
+    except ImportError:
+        logger.debug("GitPython not available, using subprocess fallback only")
+        return None
+    return git
+
+
+@lru_cache(maxsize=None)
+def _pygit2() -> Any:
+    """Import pygit2 on first use; None if it isn't installed."""
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `git_ops.GITPYTHON_AVAILABLE` working without importing eagerly
+    if name == "GITPYTHON_AVAILABLE":
+        return _gitpython() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Resolve git once so each spawn skips the PATH search; a missing git still
+# surfaces as FileNotFoundError -> GitNotInstalledError on first use
+_GIT = shutil.which("git") or "git"
+
+# Prefix for read-only spawns: never take .git/index.lock, even if a caller's
+# environment drops GIT_OPTIONAL_LOCKS
+_GIT_READ = (_GIT, "--no-optional-locks")
+
+# Applied to every git spawn: fail instead of blocking on credential
+# prompts, skip optional index locks (no contention with concurrent
+# readers), and keep the messages we match on in the C locale
+_GIT_ENV_OVERRIDES = {
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_TERMINAL_PROMPT": "0",
+    "LC_ALL": "C",
+}
+
+# Upper bound for network operations run through GitPython, in seconds
+_NETWORK_TIMEOUT = 120
+
+
+def _git_env() -> dict[str, str]:
+    """Return the environment for git subprocesses."""
+    return {**os.environ, **_GIT_ENV_OVERRIDES}
+
+
+def _run(args: Any, **kwargs: Any) -> subprocess.CompletedProcess:
+    """subprocess.run for git spawns: stdin from /dev/null, no fd sweep.
+    
+    With close_fds=False (and no cwd/shell), CPython spawns through
+    posix_spawn instead of fork+exec. Descriptors Python opens are
+    non-inheritable (PEP 446), so nothing extra leaks into git.
+    """
+    kwargs.setdefault("stdin", subprocess.DEVNULL)
+    return subprocess.run(args, close_fds=False, **kwargs)
+
+
+_HAS_POSIX_SPAWN = hasattr(os, "posix_spawnp") and hasattr(select, "poll")
+
+
+def _fast_git(args: Sequence[str], timeout: float) -> tuple[int, bytes]:
+    """
+    Run a read-only git command and return (returncode, stdout).
+    
+    For hot, polled calls: spawns with os.posix_spawnp and reads a pipe
+    directly, skipping the Popen/communicate machinery. stdin and stderr
+    go to /dev/null. Falls back to _run where posix_spawn is unavailable.
+    
+    Raises:
+        subprocess.TimeoutExpired: git ran longer than `timeout` (it is killed)
+    """
+    env = _git_env()
+    if not _HAS_POSIX_SPAWN:
+        result = _run(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                      env=env, timeout=timeout)
+        return result.returncode, result.stdout
+    
+    r, w = os.pipe()
+    try:
+        try:
+            pid = os.posix_spawnp(args[0], list(args), env, file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_DUP2, w, 1),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ])
+        finally:
+            os.close(w)
+        
+        poller = select.poll()
+        poller.register(r, select.POLLIN)
+        deadline = time.monotonic() + timeout
+        chunks = []
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not poller.poll(remaining * 1000):
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                raise subprocess.TimeoutExpired(list(args), timeout)
+            chunk = os.read(r, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(r)
+    
+    _, wait_status = os.waitpid(pid, 0)
+    if os.WIFEXITED(wait_status):
+        return os.WEXITSTATUS(wait_status), b"".join(chunks)
+    return -os.WTERMSIG(wait_status), b"".join(chunks)
+
+
+# Reuse one SSH connection across fetch/pull/push (and across runs within
+# ControlPersist); %C keeps the socket path short
+_SSH_MUX_COMMAND = (
+    "ssh -o ControlMaster=auto -o ControlPath=~/.ssh/ogb-%C -o ControlPersist=60s"
+)
+
+
+@lru_cache(maxsize=None)
+def _has_ssh_command_config(vault: str) -> bool:
+    """Check whether core.sshCommand is set (GIT_SSH_COMMAND would override it)."""
+    try:
+        result = _run(
+            [*_GIT_READ, "-C", vault, "config", "--get", "core.sshCommand"],
+            capture_output=True,
+            env=_git_env(),
+            timeout=5
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return True
+    return result.returncode == 0
+
+
+def _network_env(vault: str) -> dict[str, str]:
+    """Return the environment for git spawns that talk to a remote.
+    
+    Adds SSH connection multiplexing unless the user already chose an SSH
+    command (GIT_SSH_COMMAND, GIT_SSH or core.sshCommand) or there is no
+    ~/.ssh to hold the control socket.
+    """
+    env = _git_env()
+    if "GIT_SSH_COMMAND" in env or "GIT_SSH" in env:
+        return env
+    if not os.path.isdir(os.path.expanduser("~/.ssh")) or _has_ssh_command_config(vault):
+        return env
+    env["GIT_SSH_COMMAND"] = _SSH_MUX_COMMAND
+    return env
+
+
+def _normalize(vault_path: Union[str, Path]) -> tuple[Path, str]:
+    """Return the vault as a Path and its str form, built once per API call."""
+    path = vault_path if isinstance(vault_path, Path) else Path(vault_path)
+    return path, os.fspath(path)
 
 
 class GitError(Exception):
@@ -67,9 +240,13 @@ class PushRejectedError(GitError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class RepoStatus:
-    """Represents the status of a Git repository."""
+    """Represents the status of a Git repository.
+    
+    Instances are immutable (and may be shared through the status cache),
+    so the derived flags and the rendered string are computed only once.
+    """
     
     is_git_repo: bool
     branch: Optional[str] = None
@@ -82,24 +259,27 @@ class RepoStatus:
     upstream_branch: Optional[str] = None
     can_fast_forward: bool = False
     has_conflicts: bool = False
+    truncated: bool = False
+    # Derived in __post_init__ / on first str(); not part of the value
+    _is_clean: bool = field(default=False, init=False, repr=False, compare=False)
+    _str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
-        if self.untracked_files is None:
-            self.untracked_files = []
-        if self.modified_files is None:
-            self.modified_files = []
-        if self.staged_files is None:
-            self.staged_files = []
+        # Frozen: fill defaults and derived flags via object.__setattr__
+        for name in ("untracked_files", "modified_files", "staged_files"):
+            if getattr(self, name) is None:
+                object.__setattr__(self, name, [])
+        object.__setattr__(self, "_is_clean", not (
+            self.has_uncommitted_changes
+            or self.untracked_files
+            or self.modified_files
+            or self.staged_files
+        ))
     
     @property
     def is_clean(self) -> bool:
         """Check if the working directory is clean."""
-        return (
-            not self.has_uncommitted_changes
-            and not self.untracked_files
-            and not self.modified_files
-            and not self.staged_files
-        )
+        return self._is_clean
     
     @property
     def needs_push(self) -> bool:
@@ -112,6 +292,13 @@ class RepoStatus:
         return self.commits_behind > 0
     
     def __str__(self) -> str:
+        rendered = self._str
+        if rendered is None:
+            rendered = self._render()
+            object.__setattr__(self, "_str", rendered)
+        return rendered
+    
+    def _render(self) -> str:
         if not self.is_git_repo:
             return "Not a Git repository"
         
@@ -144,12 +331,19 @@ class RepoStatus:
         return "\n".join(lines)
 
 
-def _check_git_installed() -> None:
-    """Check if Git is installed and available in PATH."""
+@lru_cache(maxsize=None)
+def _git_version() -> str:
+    """
+    Return `git --version` output, running git at most once per process.
+    
+    Only a successful lookup is cached; failures raise GitNotInstalledError
+    and are retried on the next call.
+    """
     try:
-        subprocess.run(
-            ["git", "--version"],
+        result = _run(
+            [_GIT, "--version"],
             capture_output=True,
+            env=_git_env(),
             check=True,
             timeout=10
         )
@@ -167,38 +361,111 @@ def _check_git_installed() -> None:
         raise GitNotInstalledError(
             f"Git check failed: {e.stderr.decode() if e.stderr else 'unknown error'}"
         )
+    # _run is untyped past subprocess.run's overloads; no text=, so bytes
+    version: bytes = result.stdout
+    return version.decode().strip()
+
+
+def _check_git_installed() -> None:
+    """Check if Git is installed and available in PATH."""
+    _git_version()
+
+
+def _git_version_tuple() -> tuple[int, int]:
+    """(major, minor) of the installed git; (0, 0) if it can't be parsed."""
+    match = re.search(r"(\d+)\.(\d+)", _git_version())
+    return (int(match[1]), int(match[2])) if match else (0, 0)
+
+
+def _init_flags() -> tuple[str, ...]:
+    """
+    Flags for `git init`.
+    
+    An empty --template skips copying the sample hooks and info files, and
+    --initial-branch=main (git 2.28+) silences git's default-branch hint.
+    Each is passed only while the user's init.templateDir or
+    init.defaultBranch is unset, so configured choices still win. Not
+    cached: one config read per init, and the config may change meanwhile.
+    """
+    configured: set[str] = set()
+    try:
+        result = _run(
+            [*_GIT_READ, "config", "-z", "--get-regexp",
+             r"^init\.(templatedir|defaultbranch)$"],
+            capture_output=True,
+            env=_git_env(),
+            timeout=10
+        )
+        # "key\nvalue" records; keys come back lowercased
+        configured = {
+            record.partition(b"\n")[0].decode("utf-8", "replace")
+            for record in result.stdout.split(b"\x00") if record
+        }
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    
+    flags: tuple[str, ...] = ("--quiet",)
+    if "init.templatedir" not in configured:
+        flags += ("--template=",)
+    if "init.defaultbranch" not in configured and _git_version_tuple() >= (2, 28):
+        flags += ("--initial-branch=main",)
+    return flags
 
 
-def _is_git_repo(vault_path: Union[str, Path]) -> bool:
-    """Check if a directory is a Git repository."""
-    path = Path(vault_path)
-    git_dir = path / ".git"
+def _is_git_repo(vault_path: Union[str, Path], *, allow_bare: bool = False) -> bool:
+    """
+    Check if a directory is a Git repository.
+    
+    A .git directory, or a .git file (worktrees, submodules), is detected
+    without spawning git. Only with `allow_bare` is `git rev-parse`
+    consulted, for bare repositories and vaults nested in another work tree;
+    that is reserved for admin flows (init, remote setup), never polling.
+    """
+    path, path_str = _normalize(vault_path)
     
-    if git_dir.exists() and git_dir.is_dir():
+    # One stat for both cases; follows a symlinked .git like Path.is_dir()
+    try:
+        mode = os.stat(os.path.join(path_str, ".git")).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        mode = 0
+    if stat.S_ISDIR(mode) or stat.S_ISREG(mode):
         return True
     
-    # Also check with git command for worktrees
+    if not allow_bare:
+        return False
+    
+    # Not memoized: the answer for a nested vault flips when an ancestor
+    # runs `git init` or drops its .git, which the vault's own stat misses
     try:
-        result = subprocess.run(
-            ["git", "-C", str(path), "rev-parse", "--git-dir"],
-            capture_output=True,
-            check=True,
+        returncode, stdout = _fast_git(
+            [*_GIT_READ, "-C", path_str, "rev-parse", "--git-dir"],
             timeout=5
         )
-        return bool(result.stdout.strip())
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         return False
+    return returncode == 0 and bool(stdout.strip())
+
+
+# Long-lived GitPython Repo per vault (config, refs and GitPython's own
+# persistent cat-file processes are reused across calls)
+_REPO_POOL: dict[str, Any] = {}
+_REPO_POOL_LOCK = threading.Lock()
 
 
 def _get_repo(vault_path: Union[str, Path], must_exist: bool = True) -> Any:
-    """Get a GitPython Repo object for the given path."""
-    if not GITPYTHON_AVAILABLE:
+    """Get the shared GitPython Repo object for the given path.
+    
+    Public functions validate the vault up front and pass must_exist=False
+    so the existence probe isn't repeated.
+    """
+    gitpython = _gitpython()
+    if gitpython is None:
         raise GitError(
             "GitPython is not available",
             "Install with: pip install GitPython"
         )
     
-    path = Path(vault_path)
+    path, path_str = _normalize(vault_path)
     
     if must_exist and not _is_git_repo(path):
         raise NotAGitRepoError(
@@ -206,20 +473,186 @@ def _get_repo(vault_path: Union[str, Path], must_exist: bool = True) -> Any:
             "Run init_git_repo() first to initialize"
         )
     
+    key = os.path.abspath(path_str)
+    with _REPO_POOL_LOCK:
+        repo = _REPO_POOL.get(key)
+        if repo is not None and os.path.isdir(repo.git_dir):
+            return repo
+    
     try:
-        return git.Repo(path)
-    except InvalidGitRepositoryError:
+        repo = gitpython.Repo(path_str)
+        repo.git.update_environment(**_GIT_ENV_OVERRIDES)
+    except gitpython.InvalidGitRepositoryError:
         raise NotAGitRepoError(
             f"'{path}' is not a valid Git repository",
             "The .git directory may be corrupted"
         )
-    except NoSuchPathError:
+    except gitpython.NoSuchPathError:
         raise GitError(
             f"Path does not exist: {path}",
             "Create the directory before initializing Git"
         )
+    
+    with _REPO_POOL_LOCK:
+        stale = _REPO_POOL.get(key)
+        _REPO_POOL[key] = repo
+    if stale is not None:
+        stale.close()
+    return repo
+
+
+class _CatFileBatch:
+    """
+    Long-lived ``git cat-file --batch`` process for object lookups.
+
+    Keeps a single git process open per repository so repeated object reads
+    (HEAD resolution, blob/tree reads) avoid a fork/exec per query.
+    """
+
+    def __init__(self, vault_path: Union[str, Path]) -> None:
+        self.path = str(vault_path)
+        self._lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen[bytes]] = None
+        # (stdin, stdout) of the running process, set together with _proc
+        self._pipes: Optional[tuple[IO[bytes], IO[bytes]]] = None
 
+    def _ensure_started(self) -> tuple[IO[bytes], IO[bytes]]:
+        if self._proc is None or self._pipes is None or self._proc.poll() is not None:
+            proc = subprocess.Popen(
+                [*_GIT_READ, "-C", self.path, "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                env=_git_env(),
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
+            # Both are pipes (never None) since they were requested above
+            self._proc = proc
+            self._pipes = (cast(IO[bytes], proc.stdin), cast(IO[bytes], proc.stdout))
+        return self._pipes
+
+    def read_object(self, rev: str) -> Optional[tuple[str, str, bytes]]:
+        """
+        Read an object through the batch process.
+
+        Args:
+            rev: Any revision ``cat-file`` accepts (``HEAD``, ``<sha>:<path>``, ...)
+
+        Returns:
+            Tuple of (sha, type, content), or None if the object is missing
+        """
+        with self._lock:
+            stdin, stdout = self._ensure_started()
+            try:
+                stdin.write(rev.encode("utf-8") + b"\n")
+                stdin.flush()
+                header = stdout.readline()
+            except (BrokenPipeError, OSError):
+                self.close()
+                return None
+
+            header = header.rstrip(b"\n")
+            # "<rev> missing" / "<rev> ambiguous" (rev may contain spaces),
+            # or the process died
+            if not header or header.endswith((b" missing", b" ambiguous")):
+                return None
+            parts = header.rsplit(b" ", 2)
+            if len(parts) != 3:
+                return None
+
+            sha, obj_type, size = parts
+            content = stdout.read(int(size))
+            stdout.read(1)  # Trailing newline after content
+            return sha.decode("ascii"), obj_type.decode("ascii"), content
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Resolve a revision to its full object SHA, or None if missing."""
+        obj = self.read_object(rev)
+        return obj[0] if obj else None
+
+    def close(self) -> None:
+        """Terminate the batch process."""
+        proc, self._proc = self._proc, None
+        pipes, self._pipes = self._pipes, None
+        if proc is None or pipes is None:
+            return
+        try:
+            pipes[0].close()
+            proc.wait(timeout=5)
+        except Exception:
+            proc.kill()
+
+
+_CAT_FILE_POOL: dict[str, _CatFileBatch] = {}
+_CAT_FILE_POOL_LOCK = threading.Lock()
+
+
+def _cat_file(vault_path: Union[str, Path]) -> _CatFileBatch:
+    """Get the shared cat-file batch process for a repository."""
+    key = os.path.abspath(vault_path)
+    with _CAT_FILE_POOL_LOCK:
+        batch = _CAT_FILE_POOL.get(key)
+        if batch is None:
+            batch = _CAT_FILE_POOL[key] = _CatFileBatch(key)
+        return batch
+
+
+@atexit.register
+def _close_cat_file_pool() -> None:
+    with _CAT_FILE_POOL_LOCK:
+        for batch in _CAT_FILE_POOL.values():
+            batch.close()
+        _CAT_FILE_POOL.clear()
+    with _REPO_POOL_LOCK:
+        for repo in _REPO_POOL.values():
+            repo.close()
+        _REPO_POOL.clear()
 
+
+# Opt-in in-process cache for get_repo_status(max_age=...). Entries are
+# keyed by (vault, include_untracked, ahead_behind, max_files) and stamped
+# with the mtimes of .git/index and the vault root; a matching entry
+# younger than the caller's max_age is served as-is.
+_StatusKey = Tuple[str, bool, bool, Optional[int]]
+_STATUS_CACHE: dict[_StatusKey, tuple[float, "RepoStatus", tuple]] = {}
+_STATUS_GENERATION: dict[str, int] = {}
+_STATUS_LOCK = threading.Lock()
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _status_stamp(vault: str) -> tuple[Optional[int], ...]:
+    """Return the (index, vault root) mtimes that validate a cache entry."""
+    stamp: list[Optional[int]] = []
+    for stamp_path in (os.path.join(vault, ".git", "index"), vault):
+        try:
+            stamp.append(os.stat(stamp_path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def _invalidate_status(vault_path: Union[str, Path]) -> None:
+    """Drop cached statuses for a vault and fence off in-flight refreshes."""
+    vault = os.path.abspath(vault_path)
+    with _STATUS_LOCK:
+        _STATUS_GENERATION[vault] = _STATUS_GENERATION.get(vault, 0) + 1
+        for key in [k for k in _STATUS_CACHE if k[0] == vault]:
+            del _STATUS_CACHE[key]
+
+
+def _invalidates_status(func: _F) -> _F:
+    """Invalidate the status cache after a write operation, even if it fails."""
+    @wraps(func)
+    def wrapper(vault_path: Union[str, Path], *args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(vault_path, *args, **kwargs)
+        finally:
+            _invalidate_status(vault_path)
+    return wrapper  # type: ignore[return-value]
+
+
+@_invalidates_status
 def init_git_repo(vault_path: Union[str, Path]) -> dict[str, Any]:
     """
     Initialize a Git repository in the given vault path.
@@ -228,7 +661,9 @@ def init_git_repo(vault_path: Union[str, Path]) -> dict[str, Any]:
         vault_path: Path to the Obsidian vault directory
         
     Returns:
-        Dict with success status and message
+        Dict with success status and message; `git_dir` is the vault's .git
+        path, or None for a bare repository or a vault nested in another
+        work tree
         
     Raises:
         GitNotInstalledError: If Git is not installed
@@ -236,51 +671,55 @@ def init_git_repo(vault_path: Union[str, Path]) -> dict[str, Any]:
     """
     _check_git_installed()
     
-    path = Path(vault_path)
+    path, path_str = _normalize(vault_path)
     
     # Create directory if it doesn't exist
-    if not path.exists():
+    try:
+        os.stat(path_str)
+    except FileNotFoundError:
         logger.info(f"Creating directory: {path}")
         path.mkdir(parents=True, exist_ok=True)
     
+    git_dir = os.path.join(path_str, ".git")
+    
     # Check if already a git repo
-    if _is_git_repo(path):
+    if _is_git_repo(path, allow_bare=True):
         logger.info(f"Git repository already exists at: {path}")
         return {
             "success": True,
             "message": "Git repository already initialized",
-            "path": str(path),
-            "was_already_init": True
+            "path": path_str,
+            "was_already_init": True,
+            "git_dir": git_dir if os.path.lexists(git_dir) else None
         }
     
     try:
-        if GITPYTHON_AVAILABLE:
-            repo = git.Repo.init(path)
-            logger.info(f"Initialized Git repository at: {path}")
-        else:
-            # Subprocess fallback
-            result = subprocess.run(
-                ["git", "init", str(path)],
-                capture_output=True,
-                check=True,
-                text=True,
-                timeout=30
-            )
-            logger.info(f"Initialized Git repository at: {path}")
-            logger.debug(f"Git init output: {result.stdout}")
+        # Always plain git: GitPython's Repo.init spawns the same command
+        # but rejects --template as an unsafe option
+        result = _run(
+            [_GIT, "init", *_init_flags(), path_str],
+            capture_output=True,
+            env=_git_env(),
+            check=True,
+            text=True,
+            timeout=30
+        )
+        logger.info(f"Initialized Git repository at: {path}")
+        logger.debug(f"Git init output: {result.stdout}")
         
         return {
             "success": True,
             "message": "Git repository initialized successfully",
-            "path": str(path),
-            "was_already_init": False
+            "path": path_str,
+            "was_already_init": False,
+            "git_dir": git_dir
         }
         
     except Exception as e:
         raise GitError(
             f"Failed to initialize Git repository: {e}",
             "Check directory permissions and disk space"
-        )
+        ) from e
 
 
 # Obsidian-specific .gitignore content
@@ -341,7 +780,15 @@ build/
 # Add your own patterns below
 """
 
+# Encoded once; configure_gitignore writes bytes
+_DEFAULT_GITIGNORE_BYTES = DEFAULT_GITIGNORE.encode("utf-8")
+_DEFAULT_GITIGNORE_LINES = DEFAULT_GITIGNORE.strip().count("\n") + 1
+_DEFAULT_GITIGNORE_PATTERNS = tuple(
+    line for line in DEFAULT_GITIGNORE.splitlines() if line and not line.startswith("#")
+)
+
 
+@_invalidates_status
 def configure_gitignore(
     vault_path: Union[str, Path],
     custom_patterns: Optional[list[str]] = None,
@@ -356,16 +803,24 @@ def configure_gitignore(
         overwrite: Whether to overwrite existing .gitignore
         
     Returns:
-        Dict with success status and details
+        Dict with success status and details; when the file is written,
+        `content` holds the text and `patterns` the ignore patterns in it,
+        so callers needn't read it back
         
     Raises:
         GitError: If writing fails
     """
-    path = Path(vault_path)
+    path, _ = _normalize(vault_path)
     gitignore_path = path / ".gitignore"
     
     # Check if already exists and shouldn't overwrite
-    if gitignore_path.exists() and not overwrite:
+    try:
+        os.stat(gitignore_path)
+        exists = True
+    except FileNotFoundError:
+        exists = False
+    
+    if exists and not overwrite:
         logger.info(f".gitignore already exists at: {gitignore_path}")
         return {
             "success": True,
@@ -374,16 +829,27 @@ def configure_gitignore(
             "created": False
         }
     
-    # Build content
-    content = DEFAULT_GITIGNORE
+    # Build content; the common case writes the pre-encoded constant as-is
+    text = DEFAULT_GITIGNORE
+    content = _DEFAULT_GITIGNORE_BYTES
+    patterns_count = _DEFAULT_GITIGNORE_LINES
     
     if custom_patterns:
-        content += "\n# Custom patterns\n"
-        for pattern in custom_patterns:
-            content += f"{pattern}\n"
+        extra = "\n# Custom patterns\n" + "".join(f"{pattern}\n" for pattern in custom_patterns)
+        text += extra
+        content += extra.encode("utf-8")
+        # Blank separator + header + one line per pattern
+        patterns_count += 2 + len(custom_patterns)
     
     try:
-        gitignore_path.write_text(content, encoding="utf-8")
+        # Bare open/write/close, no buffered file object
+        fd = os.open(gitignore_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(content)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         logger.info(f"Created .gitignore at: {gitignore_path}")
         
         return {
@@ -391,16 +857,157 @@ def configure_gitignore(
             "message": ".gitignore created successfully",
             "path": str(gitignore_path),
             "created": True,
-            "patterns_count": len(content.strip().split('\n'))
+            "patterns_count": patterns_count,
+            "patterns": [*_DEFAULT_GITIGNORE_PATTERNS, *(custom_patterns or ())],
+            "content": text
         }
         
     except Exception as e:
         raise GitError(
             f"Failed to create .gitignore: {e}",
             "Check directory permissions"
+        ) from e
+
+
+# Machine-local Obsidian state, excluded per clone via .git/info/exclude
+DEFAULT_INFO_EXCLUDE = """# Local Obsidian state (added by obsidian-git-bridge)
+.obsidian/workspace.json
+.obsidian/workspace-mobile.json
+.obsidian/workspaces.json
+.obsidian/cache
+.trash/
+"""
+
+
+@_invalidates_status
+def initial_commit_with_gitignore(
+    vault_path: Union[str, Path],
+    message: str = "chore: add gitignore"
+) -> dict[str, Any]:
+    """
+    Commit .gitignore right after init and exclude local Obsidian state.
+    
+    Appends DEFAULT_INFO_EXCLUDE to .git/info/exclude, then stages and
+    commits .gitignore in a single shell invocation. Nothing is committed
+    when there is nothing staged (no .gitignore, or it is already
+    committed).
+    
+    Args:
+        vault_path: Path to the Git repository
+        message: Commit message
+        
+    Returns:
+        Dict with success status and the new commit SHA (None if nothing
+        was committed)
+        
+    Raises:
+        NotAGitRepoError: If not a Git repository
+        GitError: If the exclude file can't be written or the commit fails
+    """
+    _check_git_installed()
+    
+    path, path_str = _normalize(vault_path)
+    if not _is_git_repo(path):
+        raise NotAGitRepoError(
+            f"'{path_str}' is not a Git repository",
+            "Run init_git_repo() first"
+        )
+    
+    exclude_path = path / ".git" / "info" / "exclude"
+    try:
+        try:
+            existing = exclude_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            existing = ""
+        if DEFAULT_INFO_EXCLUDE not in existing:
+            exclude_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(exclude_path, "a", encoding="utf-8") as f:
+                if existing and not existing.endswith("\n"):
+                    f.write("\n")
+                f.write(DEFAULT_INFO_EXCLUDE)
+    except OSError as e:
+        raise GitError(
+            f"Failed to update {exclude_path}: {e}",
+            "Check directory permissions"
+        )
+    
+    git = shlex.quote(_GIT)
+    steps = []
+    if (path / ".gitignore").exists():
+        steps.append(f"{git} add -- .gitignore || exit 1")
+    steps += [
+        # Also correct on an unborn branch: compares against the empty tree
+        f"if {git} diff --cached --quiet; then exit 0; fi",
+        f"{git} commit -q -m {shlex.quote(message)} || exit 1",
+        f"{git} rev-parse HEAD",
+    ]
+    
+    result = _run(
+        "\n".join(steps),
+        shell=True,
+        cwd=path,
+        capture_output=True,
+        env=_git_env(),
+        text=True,
+        timeout=30
+    )
+    if result.returncode != 0:
+        raise GitError(
+            "Failed to commit .gitignore",
+            result.stderr.strip() or "Check git user.name/user.email configuration"
         )
+    
+    if not result.stdout.strip():
+        return {
+            "success": True,
+            "message": "Nothing to commit: .gitignore is missing or already committed",
+            "path": path_str,
+            "commit_sha": None
+        }
+    
+    commit_sha = result.stdout.strip().splitlines()[-1]
+    logger.info(f"Committed .gitignore: {commit_sha[:8]}")
+    
+    return {
+        "success": True,
+        "message": f"Committed .gitignore ({commit_sha[:8]})",
+        "path": path_str,
+        "commit_sha": commit_sha
+    }
+
+
+# HTTPS remote on a known host -> (host, owner/repo) for rewriting to SSH
+_HTTPS_TO_SSH = re.compile(r"^https://(github\.com|gitlab\.com|bitbucket\.org)/(.+?)(?:\.git)?/?$")
+
+
+def _remote_config(path_str: str) -> dict[str, dict[str, str]]:
+    """
+    Read every remote.* key of the repository config in one git call.
+    
+    Returns:
+        Mapping of remote name to its settings (first value per key), e.g.
+        {"origin": {"url": ..., "fetch": ...}}; empty if there are none
+    """
+    result = _run(
+        [*_GIT_READ, "-C", path_str, "config", "--local", "-z",
+         "--get-regexp", r"^remote\."],
+        capture_output=True,
+        env=_git_env(),
+        timeout=10
+    )
+    remotes: dict[str, dict[str, str]] = {}
+    # No matching keys exits 1 with empty output
+    for record in result.stdout.split(b"\x00"):
+        if not record:
+            continue
+        key, _, value = record.partition(b"\n")
+        # remote.<name>.<var>; the name itself may contain dots
+        name, _, var = key.decode("utf-8", "replace")[len("remote."):].rpartition(".")
+        remotes.setdefault(name, {}).setdefault(var, value.decode("utf-8", "replace"))
+    return remotes
 
 
+@_invalidates_status
 def setup_remote(
     vault_path: Union[str, Path],
     remote_url: str,
@@ -417,18 +1024,20 @@ def setup_remote(
         auth_method: Authentication method ('ssh' or 'https')
         
     Returns:
-        Dict with success status and details
+        Dict with success status and details; `all_remotes` maps every
+        configured remote to its URL after the change
         
     Raises:
         NotAGitRepoError: If not a Git repository
-        RemoteAlreadyExistsError: If remote already exists
-        GitError: If setup fails
+        GitError: If the auth method is unknown or git fails to add or
+            update the remote
     """
     _check_git_installed()
     
-    if not _is_git_repo(vault_path):
+    path, path_str = _normalize(vault_path)
+    if not _is_git_repo(path, allow_bare=True):
         raise NotAGitRepoError(
-            f"'{vault_path}' is not a Git repository",
+            f"'{path_str}' is not a Git repository",
             "Run init_git_repo() first"
         )
     
@@ -437,12 +1046,9 @@ def setup_remote(
     
     if auth_method == "ssh":
         # Convert HTTPS to SSH if needed
-        if url.startswith("https://github.com/"):
-            path = url.replace("https://github.com/", "")
-            url = f"git@github.com:{path}"
-        elif url.startswith("https://gitlab.com/"):
-            path = url.replace("https://gitlab.com/", "")
-            url = f"git@gitlab.com:{path}"
+        match = _HTTPS_TO_SSH.match(url)
+        if match:
+            url = f"git@{match[1]}:{match[2]}.git"
     elif auth_method == "https":
         # Keep as HTTPS, but warn about credentials
         pass
@@ -453,93 +1059,70 @@ def setup_remote(
         )
     
     try:
-        if GITPYTHON_AVAILABLE:
-            repo = _get_repo(vault_path)
-            
-            # Check if remote already exists
-            try:
-                existing = repo.remote(remote_name)
-                existing_url = list(existing.urls)[0] if existing.urls else None
-                
-                if existing_url == url:
-                    return {
-                        "success": True,
-                        "message": f"Remote '{remote_name}' already exists with same URL",
-                        "remote_name": remote_name,
-                        "url": url,
-                        "created": False
-                    }
-                else:
-                    # Update existing remote
-                    existing.set_url(url)
-                    logger.info(f"Updated remote '{remote_name}' to: {url}")
-                    return {
-                        "success": True,
-                        "message": f"Remote '{remote_name}' updated",
-                        "remote_name": remote_name,
-                        "url": url,
-                        "created": False,
-                        "updated": True
-                    }
-            except ValueError:
-                # Remote doesn't exist, create it
-                repo.create_remote(remote_name, url)
-                logger.info(f"Added remote '{remote_name}': {url}")
+        # One config read decides add/update/noop (GitPython would spawn
+        # `git remote get-url` for the same answer)
+        remotes = {
+            name: settings.get("url") for name, settings in _remote_config(path_str).items()
+        }
+        
+        if remote_name not in remotes:
+            _run(
+                [_GIT, "-C", path_str, "remote", "add", remote_name, url],
+                capture_output=True,
+                env=_git_env(),
+                check=True,
+                timeout=10
+            )
+            logger.info(f"Added remote '{remote_name}': {url}")
+        elif remotes[remote_name] == url:
+            return {
+                "success": True,
+                "message": f"Remote '{remote_name}' already exists with same URL",
+                "remote_name": remote_name,
+                "url": url,
+                "created": False,
+                "all_remotes": remotes
+            }
         else:
-            # Subprocess fallback
-            # Check if remote exists
-            result = subprocess.run(
-                ["git", "-C", str(vault_path), "remote", "get-url", remote_name],
+            # Update
+            _run(
+                [_GIT, "-C", path_str, "remote", "set-url", remote_name, url],
                 capture_output=True,
-                text=True,
+                env=_git_env(),
+                check=True,
                 timeout=10
             )
-            
-            if result.returncode == 0:
-                existing_url = result.stdout.strip()
-                if existing_url == url:
-                    return {
-                        "success": True,
-                        "message": f"Remote '{remote_name}' already exists with same URL",
-                        "remote_name": remote_name,
-                        "url": url,
-                        "created": False
-                    }
-                else:
-                    # Update
-                    subprocess.run(
-                        ["git", "-C", str(vault_path), "remote", "set-url", remote_name, url],
-                        capture_output=True,
-                        check=True,
-                        timeout=10
-                    )
-                    return {
-                        "success": True,
-                        "message": f"Remote '{remote_name}' updated",
-                        "remote_name": remote_name,
-                        "url": url,
-                        "created": False,
-                        "updated": True
-                    }
+            logger.info(f"Updated remote '{remote_name}' to: {url}")
+            remotes[remote_name] = url
+            return {
+                "success": True,
+                "message": f"Remote '{remote_name}' updated",
+                "remote_name": remote_name,
+                "url": url,
+                "created": False,
+                "updated": True,
+                "all_remotes": remotes
+            }
         
+        remotes[remote_name] = url
         return {
             "success": True,
             "message": f"Remote '{remote_name}' added successfully",
             "remote_name": remote_name,
             "url": url,
             "auth_method": auth_method,
-            "created": True
+            "created": True,
+            "all_remotes": remotes
         }
         
-    except RemoteAlreadyExistsError:
-        raise
     except Exception as e:
         raise GitError(
             f"Failed to setup remote: {e}",
             "Check the remote URL and your network connection"
-        )
+        ) from e
 
 
+@_invalidates_status
 def initial_commit(
     vault_path: Union[str, Path],
     message: str = "Initial commit: Obsidian vault setup",
@@ -562,46 +1145,45 @@ def initial_commit(
     """
     _check_git_installed()
     
-    if not _is_git_repo(vault_path):
+    path, path_str = _normalize(vault_path)
+    if not _is_git_repo(path):
         raise NotAGitRepoError(
-            f"'{vault_path}' is not a Git repository",
+            f"'{path_str}' is not a Git repository",
             "Run init_git_repo() first"
         )
     
-    path = Path(vault_path)
-    
     try:
-        if GITPYTHON_AVAILABLE:
-            repo = _get_repo(vault_path)
+        gitpython = _gitpython()
+        if gitpython is not None:
+            repo = _get_repo(path, must_exist=False)
             
-            # Check if there are any commits already
-            try:
-                repo.head.commit
-                has_commits = True
-            except ValueError:
-                has_commits = False
+            # Check if there are any commits already (persistent cat-file
+            # lookup instead of hydrating a Commit object)
+            has_commits = _cat_file(path).resolve("HEAD") is not None
             
             if has_commits and not repo.is_dirty(untracked_files=True):
                 return {
                     "success": True,
                     "message": "No changes to commit",
-                    "path": str(path),
+                    "path": path_str,
                     "committed": False
                 }
             
             # Configure git user if not set (required for commit)
             config = repo.config_reader()
-            try:
-                config.get_value("user", "name")
-            except Exception:
-                repo.config_writer().set_value("user", "name", "Obsidian Git Bridge").release()
-                logger.info("Set default git user.name")
+            defaults = {}
+            for option, value in (("name", "Obsidian Git Bridge"), ("email", "vault@obsidian.git")):
+                try:
+                    config.get_value("user", option)
+                except Exception:
+                    defaults[option] = value
             
-            try:
-                config.get_value("user", "email")
-            except Exception:
-                repo.config_writer().set_value("user", "email", "vault@obsidian.git").release()
-                logger.info("Set default git user.email")
+            # One writer session: .git/config is parsed and written once
+            if defaults:
+                with repo.config_writer() as writer:
+                    for option, value in defaults.items():
+                        writer.set_value("user", option, value)
+                        logger.info(f"Set default git user.{option}")
             
             # Stage all files
             repo.git.add(A=True)
@@ -617,7 +1199,7 @@ def initial_commit(
                 return {
                     "success": True,
                     "message": "No changes to commit",
-                    "path": str(path),
+                    "path": path_str,
                     "committed": False
                 }
             
@@ -628,12 +1210,12 @@ def initial_commit(
                     origin = repo.remote("origin")
                     # Get current branch
                     branch = repo.active_branch.name
-                    origin.push(refspec=f"{branch}:{branch}")
+                    origin.push(refspec=f"{branch}:{branch}", kill_after_timeout=_NETWORK_TIMEOUT)
                     logger.info(f"Pushed to origin/{branch}")
                     pushed = True
                 except ValueError:
                     logger.warning("No origin remote configured, skipping push")
-                except GitCommandError as e:
+                except gitpython.GitCommandError as e:
                     if "rejected" in str(e).lower():
                         raise PushRejectedError(
                             "Push was rejected by remote",
@@ -645,75 +1227,48 @@ def initial_commit(
                     )
             
         else:
-            # Subprocess fallback
-            # Check if there are changes
-            status_result = subprocess.run(
-                ["git", "-C", str(path), "status", "--porcelain"],
+            # Subprocess fallback: default the identity, stage, commit and
+            # read back the SHA in one shell; stdout is empty when there
+            # was nothing to commit
+            git = shlex.quote(_GIT)
+            steps = [
+                f"{git} config user.name >/dev/null"
+                f" || {git} config user.name 'Obsidian Git Bridge' || exit 1",
+                f"{git} config user.email >/dev/null"
+                f" || {git} config user.email 'vault@obsidian.git' || exit 1",
+                f"{git} add -A || exit 1",
+                f"if {git} diff --cached --quiet; then exit 0; fi",
+                f"{git} commit -q -m {shlex.quote(message)} && {git} rev-parse HEAD",
+            ]
+            commit_result = _run(
+                "\n".join(steps),
+                shell=True,
+                cwd=path,
                 capture_output=True,
+                env=_git_env(),
                 text=True,
-                check=True,
-                timeout=10
+                timeout=60
             )
+            if commit_result.returncode != 0:
+                raise GitError(f"Commit failed: {commit_result.stderr.strip()}")
             
-            if not status_result.stdout.strip():
+            commit_sha = commit_result.stdout.strip() or None
+            if commit_sha is None:
                 return {
                     "success": True,
                     "message": "No changes to commit",
-                    "path": str(path),
+                    "path": path_str,
                     "committed": False
                 }
-            
-            # Configure git user if needed
-            for key, default in [("user.name", "Obsidian Git Bridge"), ("user.email", "vault@obsidian.git")]:
-                result = subprocess.run(
-                    ["git", "-C", str(path), "config", key],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if not result.stdout.strip():
-                    subprocess.run(
-                        ["git", "-C", str(path), "config", key, default],
-                        capture_output=True,
-                        check=True,
-                        timeout=5
-                    )
-            
-            # Stage and commit
-            subprocess.run(
-                ["git", "-C", str(path), "add", "-A"],
-                capture_output=True,
-                check=True,
-                timeout=30
-            )
-            
-            commit_result = subprocess.run(
-                ["git", "-C", str(path), "commit", "-m", message],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=30
-            )
-            
             committed = True
-            commit_sha = None
-            
-            # Extract commit SHA
-            sha_result = subprocess.run(
-                ["git", "-C", str(path), "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if sha_result.returncode == 0:
-                commit_sha = sha_result.stdout.strip()
             
             # Push if requested
             pushed = False
             if push:
-                push_result = subprocess.run(
-                    ["git", "-C", str(path), "push", "origin", "HEAD"],
+                push_result = _run(
+                    [_GIT, "-C", path_str, "push", "origin", "HEAD"],
                     capture_output=True,
+                    env=_network_env(path_str),
                     text=True,
                     timeout=60
                 )
@@ -724,7 +1279,8 @@ def initial_commit(
                         "Push was rejected by remote",
                         "Pull changes first to resolve any conflicts"
                     )
-                elif "authentication" in push_result.stderr.lower() or "permission" in push_result.stderr.lower():
+                elif any(marker in push_result.stderr.lower()
+                         for marker in ("authentication", "permission")):
                     raise AuthenticationError(
                         "Authentication failed during push",
                         "Check your SSH keys or credentials"
@@ -733,7 +1289,7 @@ def initial_commit(
         return {
             "success": True,
             "message": "Initial commit created successfully",
-            "path": str(path),
+            "path": path_str,
             "committed": committed,
             "commit_sha": commit_sha[:8] if commit_sha else None,
             "pushed": pushed,
@@ -748,223 +1304,356 @@ def initial_commit(
         raise GitError(
             f"Failed to create initial commit: {e}",
             "Check git configuration and repository status"
-        )
+        ) from e
+
 
+# Byte values of porcelain v2 record kinds
+_V2_ORDINARY, _V2_RENAMED, _V2_UNMERGED, _V2_UNTRACKED, _V2_HEADER = b"12u?#"
+_V2_UNCHANGED = ord(".")
+# "1 XY sub mH mI mW " is fixed width; object names start here
+_V2_HASH_OFFSET = 31
 
-def get_repo_status(vault_path: Union[str, Path]) -> RepoStatus:
+
+def _parse_status_v2(output: bytes, limit: Optional[int] = None) -> dict[str, Any]:
     """
-    Get the status of a Git repository.
+    Parse `git status --porcelain=v2 --branch -z` output.
+    
+    Records are scanned in place by NUL offset; only paths are sliced out
+    and decoded, so large change sets don't allocate per-field strings.
     
     Args:
-        vault_path: Path to the Git repository
+        output: Raw NUL-delimited status output
+        limit: Keep at most this many paths per file list; paths past it
+            are skipped without decoding and `truncated` is set
         
     Returns:
-        RepoStatus object with detailed status
-        
-    Raises:
-        NotAGitRepoError: If not a Git repository
+        Dictionary of RepoStatus keyword arguments (without is_git_repo)
     """
-    _check_git_installed()
+    branch = None
+    upstream_branch = None
+    commits_ahead = 0
+    commits_behind = 0
+    untracked: list[str] = []
+    modified: list[str] = []
+    staged: list[str] = []
+    has_conflicts = False
+    counts_known = False
+    dirty = False
+    truncated = False
+    cap = limit if limit is not None else -1
     
-    path = Path(vault_path)
+    find = output.find
+    end = len(output)
+    pos = 0
+    while pos < end:
+        nul = find(b"\x00", pos)
+        if nul < 0:
+            nul = end
+        if nul == pos:
+            pos += 1
+            continue
+        kind = output[pos]
+        
+        if kind == _V2_ORDINARY or kind == _V2_RENAMED:
+            x, y = output[pos + 2], output[pos + 3]
+            # Hash width depends on the object format (SHA-1 or SHA-256)
+            hash_start = pos + _V2_HASH_OFFSET
+            path_start = hash_start + 2 * (find(b" ", hash_start) - hash_start + 1)
+            if kind == _V2_RENAMED:
+                # Skip the "Xscore" field; the original path is the next record
+                path_start = find(b" ", path_start) + 1
+            dirty = True
+            add_staged = x != _V2_UNCHANGED
+            add_modified = y != _V2_UNCHANGED
+            if add_staged and len(staged) == cap:
+                add_staged, truncated = False, True
+            if add_modified and len(modified) == cap:
+                add_modified, truncated = False, True
+            if add_staged or add_modified:
+                filename = os.fsdecode(output[path_start:nul])
+                if add_staged:
+                    staged.append(filename)
+                if add_modified:
+                    modified.append(filename)
+            if kind == _V2_RENAMED:
+                nul = find(b"\x00", nul + 1)
+                if nul < 0:
+                    nul = end
+        elif kind == _V2_UNTRACKED:
+            dirty = True
+            if len(untracked) == cap:
+                truncated = True
+            else:
+                untracked.append(os.fsdecode(output[pos + 2:nul]))
+        elif kind == _V2_UNMERGED:
+            has_conflicts = True
+        elif kind == _V2_HEADER:
+            # Branch headers: "# branch.<key> <value>"
+            _, key, value = output[pos:nul].split(b" ", 2)
+            if key == b"branch.head":
+                branch = None if value == b"(detached)" else os.fsdecode(value)
+            elif key == b"branch.upstream":
+                upstream_branch = os.fsdecode(value)
+            elif key == b"branch.ab":
+                # "+? -?" under --no-ahead-behind: differs, counts unknown
+                ahead, behind = value.split(b" ")
+                if ahead != b"+?":
+                    commits_ahead = int(ahead)
+                    commits_behind = -int(behind)
+                    counts_known = True
+        
+        pos = nul + 1
+    
+    return {
+        "branch": branch,
+        "has_uncommitted_changes": dirty,
+        "untracked_files": untracked,
+        "modified_files": modified,
+        "staged_files": staged,
+        "commits_ahead": commits_ahead,
+        "commits_behind": commits_behind,
+        "upstream_branch": upstream_branch,
+        # Fast-forward is possible when the upstream contains every local commit
+        "can_fast_forward": upstream_branch is not None and counts_known and commits_ahead == 0,
+        "has_conflicts": has_conflicts,
+        "truncated": truncated,
+    }
+
+
+def _status_pygit2(
+    vault: str,
+    include_untracked: bool,
+    ahead_behind: bool,
+    limit: Optional[int] = None
+) -> Optional[dict[str, Any]]:
+    """
+    Read status in-process with libgit2, skipping the git spawn.
+    
+    Returns the same keyword arguments as _parse_status_v2, or None when
+    pygit2 is unavailable or the repository can't be read with it (the
+    caller then falls back to `git status`). libgit2 doesn't pair renames,
+    so a staged rename lists both the old and the new path as staged.
+    """
+    pygit2 = _pygit2()
+    if pygit2 is None:
+        return None
+    
+    try:
+        repo = pygit2.Repository(vault)
+        
+        branch = upstream_branch = None
+        commits_ahead = commits_behind = 0
+        counts_known = False
+        if not repo.head_is_detached:
+            # HEAD's symbolic target also names an unborn branch
+            head_target = repo.references["HEAD"].target
+            branch = head_target[len("refs/heads/"):]
+            if not repo.head_is_unborn:
+                local = repo.branches.local.get(branch)
+                upstream = local.upstream if local is not None else None
+                if upstream is not None:
+                    upstream_branch = upstream.shorthand
+                    if local.target == upstream.target:
+                        counts_known = True
+                    elif ahead_behind:
+                        commits_ahead, commits_behind = repo.ahead_behind(
+                            local.target, upstream.target
+                        )
+                        counts_known = True
+        
+        flags = repo.status(untracked_files="all" if include_untracked else "no")
+    except (pygit2.GitError, KeyError, TypeError, ValueError) as e:
+        logger.debug(f"pygit2 status failed, using git status: {e}")
+        return None
+    
+    index_bits = (
+        pygit2.GIT_STATUS_INDEX_NEW | pygit2.GIT_STATUS_INDEX_MODIFIED
+        | pygit2.GIT_STATUS_INDEX_DELETED | pygit2.GIT_STATUS_INDEX_RENAMED
+        | pygit2.GIT_STATUS_INDEX_TYPECHANGE
+    )
+    worktree_bits = (
+        pygit2.GIT_STATUS_WT_MODIFIED | pygit2.GIT_STATUS_WT_DELETED
+        | pygit2.GIT_STATUS_WT_RENAMED | pygit2.GIT_STATUS_WT_TYPECHANGE
+    )
+    untracked: list[str] = []
+    modified: list[str] = []
+    staged: list[str] = []
+    has_conflicts = False
+    dirty = False
+    truncated = False
+    cap = limit if limit is not None else -1
+    
+    for filename, flag in flags.items():
+        if flag & pygit2.GIT_STATUS_IGNORED or flag == pygit2.GIT_STATUS_CURRENT:
+            continue
+        if flag & pygit2.GIT_STATUS_CONFLICTED:
+            has_conflicts = True
+            continue
+        dirty = True
+        # Not exclusive: `git rm --cached` leaves INDEX_DELETED | WT_NEW
+        if flag & pygit2.GIT_STATUS_WT_NEW:
+            if len(untracked) == cap:
+                truncated = True
+            else:
+                untracked.append(filename)
+        if flag & index_bits:
+            if len(staged) == cap:
+                truncated = True
+            else:
+                staged.append(filename)
+        if flag & worktree_bits:
+            if len(modified) == cap:
+                truncated = True
+            else:
+                modified.append(filename)
+    
+    return {
+        "branch": branch,
+        "has_uncommitted_changes": dirty,
+        "untracked_files": untracked,
+        "modified_files": modified,
+        "staged_files": staged,
+        "commits_ahead": commits_ahead,
+        "commits_behind": commits_behind,
+        "upstream_branch": upstream_branch,
+        "can_fast_forward": upstream_branch is not None and counts_known and commits_ahead == 0,
+        "has_conflicts": has_conflicts,
+        "truncated": truncated,
+    }
+
+
+def get_repo_status(
+    vault_path: Union[str, Path],
+    include_untracked: bool = True,
+    ahead_behind: bool = True,
+    fetch: bool = False,
+    max_files: Optional[int] = None,
+    max_age: Optional[float] = None
+) -> RepoStatus:
+    """
+    Get the status of a Git repository.
+    
+    Args:
+        vault_path: Path to the Git repository
+        include_untracked: Whether to list untracked files. Skipping them
+            avoids walking the whole working tree on large vaults.
+        ahead_behind: Whether to count commits ahead of/behind upstream.
+            When False the counts stay 0 and can_fast_forward is only set
+            if the branch matches its upstream exactly.
+        fetch: Whether to fetch from the remote first so ahead/behind
+            reflect the remote's current state. Off by default: status is
+            otherwise a local-only query against the last fetch.
+        max_files: Cap each file list at this many entries, for callers
+            that only need a preview; `truncated` is set when paths were
+            dropped. has_uncommitted_changes always reflects every file.
+        max_age: Accept a cached status up to this many seconds old. Off
+            by default, so every call runs git status. The cache is only
+            dropped when the index or vault root changes or a write
+            operation in this module runs: edits to tracked files and new
+            files in subdirectories go unseen until max_age passes. A
+            cached RepoStatus may be shared, so don't mutate it.
+        
+    Returns:
+        RepoStatus object with detailed status
+        
+    Raises:
+        NotAGitRepoError: If not a Git repository
+    """
+    _check_git_installed()
+    
+    path, path_str = _normalize(vault_path)
     
     # Quick check first
     if not _is_git_repo(path):
         return RepoStatus(is_git_repo=False)
     
-    try:
-        if GITPYTHON_AVAILABLE:
-            try:
-                repo = _get_repo(vault_path)
-            except NotAGitRepoError:
-                return RepoStatus(is_git_repo=False)
-            
-            # Get branch info
-            try:
-                branch = repo.active_branch.name
-            except TypeError:
-                branch = None  # Detached HEAD
-            
-            # Get upstream info
-            upstream_branch = None
-            commits_ahead = 0
-            commits_behind = 0
-            can_fast_forward = False
-            
-            if branch:
-                try:
-                    upstream = repo.active_branch.tracking_branch()
-                    if upstream:
-                        upstream_branch = upstream.name
-                        
-                        # Fetch to get accurate counts
-                        try:
-                            repo.remotes.origin.fetch()
-                        except Exception:
-                            pass  # May fail without network
-                        
-                        # Get ahead/behind counts
-                        local_commit = repo.active_branch.commit
-                        remote_commit = upstream.commit
-                        
-                        commits_ahead = sum(1 for _ in repo.iter_commits(f"{upstream.name}..{branch}"))
-                        commits_behind = sum(1 for _ in repo.iter_commits(f"{branch}..{upstream.name}"))
-                        
-                        # Check if fast-forward is possible
-                        try:
-                            repo.git.merge_base("--is-ancestor", branch, upstream.name)
-                            can_fast_forward = True
-                        except GitCommandError:
-                            can_fast_forward = False
-                            
-                except Exception:
-                    pass
-            
-            # Get working directory status
-            untracked = repo.untracked_files
-            
-            modified = []
-            staged = []
-            has_conflicts = False
-            
-            # Check if repo has any commits (not empty)
-            has_commits = False
-            try:
-                repo.head.commit
-                has_commits = True
-            except ValueError:
-                pass  # No commits yet
-            
-            for item in repo.index.diff(None):  # Unstaged changes
-                if item.change_type in ['M', 'T']:
-                    modified.append(item.a_path)
-            
-            # Staged changes - compare against HEAD if exists, otherwise everything is staged
-            if has_commits:
-                for item in repo.index.diff("HEAD"):  # Staged changes
-                    if item.change_type in ['A', 'M', 'D', 'R', 'T']:
-                        staged.append(item.a_path)
-            else:
-                # No commits yet - everything in index is staged
-                for entry in repo.index.entries.keys():
-                    staged.append(entry[0])
-            
-            # Check for conflicts
-            try:
-                conflicts = repo.index.unmerged_blobs()
-                has_conflicts = bool(conflicts)
-            except Exception:
-                pass
-            
-            has_changes = bool(untracked or modified or staged)
-            
-            return RepoStatus(
-                is_git_repo=True,
-                branch=branch,
-                has_uncommitted_changes=has_changes,
-                untracked_files=untracked,
-                modified_files=modified,
-                staged_files=staged,
-                commits_ahead=commits_ahead,
-                commits_behind=commits_behind,
-                upstream_branch=upstream_branch,
-                can_fast_forward=can_fast_forward,
-                has_conflicts=has_conflicts
-            )
-            
-        else:
-            # Subprocess fallback
-            # Get branch
-            branch_result = subprocess.run(
-                ["git", "-C", str(path), "branch", "--show-current"],
+    if fetch:
+        try:
+            _run(
+                [_GIT, "-C", path_str, "fetch", "--quiet"],
                 capture_output=True,
-                text=True,
-                timeout=5
+                env=_network_env(path_str),
+                timeout=_NETWORK_TIMEOUT
             )
-            branch = branch_result.stdout.strip() if branch_result.returncode == 0 else None
-            
-            # Get status in porcelain format
-            status_result = subprocess.run(
-                ["git", "-C", str(path), "status", "--porcelain", "-b"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            untracked = []
-            modified = []
-            staged = []
-            upstream_branch = None
-            commits_ahead = 0
-            commits_behind = 0
-            has_conflicts = False
-            
-            if status_result.returncode == 0:
-                lines = status_result.stdout.strip().split('\n')
-                for line in lines:
-                    if not line:
-                        continue
-                    
-                    # Parse branch info from first line
-                    if line.startswith("##"):
-                        parts = line[3:].split('...')
-                        if len(parts) > 1:
-                            upstream_branch = parts[1].split(' [')[0]
-                            # Parse ahead/behind
-                            if '[' in line:
-                                status_part = line[line.find('[')+1:line.find(']')]
-                                if 'ahead' in status_part:
-                                    try:
-                                        commits_ahead = int(status_part.split('ahead ')[1].split(',')[0])
-                                    except (IndexError, ValueError):
-                                        pass
-                                if 'behind' in status_part:
-                                    try:
-                                        commits_behind = int(status_part.split('behind ')[1].split(',')[0])
-                                    except (IndexError, ValueError):
-                                        pass
-                        continue
-                    
-                    # Parse file status
-                    if len(line) >= 2:
-                        index_status = line[0]
-                        worktree_status = line[1]
-                        filename = line[3:]
-                        
-                        if index_status == '?' and worktree_status == '?':
-                            untracked.append(filename)
-                        elif index_status in 'AMDRTC' and worktree_status == ' ':
-                            staged.append(filename)
-                        elif index_status in ' MD' or worktree_status in 'MD':
-                            modified.append(filename)
-                        elif index_status == 'U' or worktree_status == 'U' or index_status == worktree_status == 'D':
-                            has_conflicts = True
-            
-            has_changes = bool(untracked or modified or staged)
-            
-            return RepoStatus(
-                is_git_repo=True,
-                branch=branch,
-                has_uncommitted_changes=has_changes,
-                untracked_files=untracked,
-                modified_files=modified,
-                staged_files=staged,
-                commits_ahead=commits_ahead,
-                commits_behind=commits_behind,
-                upstream_branch=upstream_branch,
-                has_conflicts=has_conflicts
-            )
-            
-    except NotAGitRepoError:
-        return RepoStatus(is_git_repo=False)
+        except subprocess.TimeoutExpired:
+            logger.warning("Fetch timed out, reporting last-fetched upstream state")
+        # Remote-tracking refs moved without touching the cache stamp
+        _invalidate_status(path)
+    
+    key = (os.path.abspath(path_str), include_untracked, ahead_behind, max_files)
+    stamp = _status_stamp(key[0])
+    with _STATUS_LOCK:
+        entry = _STATUS_CACHE.get(key)
+        generation = _STATUS_GENERATION.get(key[0], 0)
+    
+    if max_age is not None and entry is not None and entry[2] == stamp:
+        fetched_at, status, _ = entry
+        if time.monotonic() - fetched_at < max_age:
+            return status
+    
+    try:
+        refreshed = _refresh_repo_status(key, stamp, generation, cache=max_age is not None)
     except Exception as e:
         logger.error(f"Error getting repo status: {e}")
         return RepoStatus(is_git_repo=False)
+    
+    return refreshed if refreshed is not None else RepoStatus(is_git_repo=True)
+
+
+def _refresh_repo_status(
+    key: _StatusKey,
+    stamp: tuple,
+    generation: int,
+    cache: bool = True
+) -> Optional[RepoStatus]:
+    """
+    Compute a status and, with `cache`, store it unless the vault was
+    written meanwhile.
+    
+    Returns:
+        The new RepoStatus, or None if git status failed (nothing is cached)
+    """
+    vault, include_untracked, ahead_behind, max_files = key
+    
+    # No fetch: counts are against the last-fetched upstream, callers
+    # wanting fresh ones pull first
+    fields = _status_pygit2(vault, include_untracked, ahead_behind, max_files)
+    if fields is None:
+        # One porcelain v2 call covers branch, upstream, ahead/behind and
+        # file states
+        returncode, stdout = _fast_git(
+            [*_GIT_READ, "-C", vault, "status",
+             "--porcelain=v2", "--branch", "-z",
+             f"--untracked-files={'all' if include_untracked else 'no'}",
+             "--ahead-behind" if ahead_behind else "--no-ahead-behind"],
+            timeout=10
+        )
+        if returncode != 0:
+            return None
+        fields = _parse_status_v2(stdout, max_files)
+    
+    status = RepoStatus(is_git_repo=True, **fields)
+    if cache:
+        with _STATUS_LOCK:
+            if _STATUS_GENERATION.get(vault, 0) == generation:
+                _STATUS_CACHE[key] = (time.monotonic(), status, stamp)
+    return status
+
+
+# stderr fragments that mean the remote refused us rather than the pull failing
+_AUTH_ERROR_MARKERS = ("authentication", "could not read from remote", "permission denied")
 
 
+def _is_auth_error(stderr: str) -> bool:
+    error = stderr.lower()
+    return any(marker in error for marker in _AUTH_ERROR_MARKERS)
+
+
+@_invalidates_status
 def pull_changes(
     vault_path: Union[str, Path],
-    rebase: bool = True
+    rebase: bool = True,
+    prefetch: bool = False
 ) -> dict[str, Any]:
     """
     Pull changes from remote with optional rebase.
@@ -972,6 +1661,8 @@ def pull_changes(
     Args:
         vault_path: Path to the Git repository
         rebase: Whether to use rebase (default) or merge
+        prefetch: Run a separate `git fetch origin` first. `git pull`
+            already fetches, so this only costs an extra round-trip.
         
     Returns:
         Dict with success status and details
@@ -984,178 +1675,205 @@ def pull_changes(
     """
     _check_git_installed()
     
-    if not _is_git_repo(vault_path):
+    path, path_str = _normalize(vault_path)
+    if not _is_git_repo(path):
         raise NotAGitRepoError(
-            f"'{vault_path}' is not a Git repository",
+            f"'{path_str}' is not a Git repository",
             "Run init_git_repo() first"
         )
     
-    path = Path(vault_path)
-    
     try:
-        if GITPYTHON_AVAILABLE:
-            repo = _get_repo(vault_path)
-            
-            # Check for uncommitted changes
-            if repo.is_dirty(untracked_files=False):
-                raise GitError(
-                    "Cannot pull with uncommitted changes",
-                    "Commit or stash your changes first"
-                )
-            
-            # Get current branch
-            try:
-                branch = repo.active_branch.name
-            except TypeError:
-                raise GitError(
-                    "Cannot pull in detached HEAD state",
-                    "Checkout a branch first"
-                )
-            
-            # Fetch first
-            try:
-                repo.remotes.origin.fetch()
-            except GitCommandError as e:
-                if "authentication" in str(e).lower():
-                    raise AuthenticationError(
-                        "Authentication failed during fetch",
-                        "Check your SSH keys or credentials"
-                    )
-                raise
-            
-            # Check if we can fast-forward
-            upstream = repo.active_branch.tracking_branch()
-            if not upstream:
-                raise GitError(
-                    "No upstream branch configured",
-                    "Set upstream with: git branch --set-upstream-to=origin/" + branch
-                )
-            
-            # Pull with rebase or merge
-            try:
-                if rebase:
-                    repo.git.pull("origin", branch, "--rebase")
-                    logger.info(f"Pulled with rebase from origin/{branch}")
-                else:
-                    repo.git.pull("origin", branch)
-                    logger.info(f"Pulled from origin/{branch}")
-                    
-            except GitCommandError as e:
-                error_msg = str(e).lower()
-                
-                if "conflict" in error_msg:
-                    # Abort the rebase if it failed
-                    try:
-                        repo.git.rebase("--abort")
-                    except Exception:
-                        pass
-                    raise MergeConflictError(
-                        "Pull resulted in merge conflicts",
-                        "Resolve conflicts manually and continue"
-                    )
-                elif "authentication" in error_msg:
-                    raise AuthenticationError(
-                        "Authentication failed",
-                        "Check your SSH keys or credentials"
-                    )
-                else:
-                    raise GitError(f"Pull failed: {e}")
-            
-        else:
-            # Subprocess fallback
-            # Check for uncommitted changes
-            status_result = subprocess.run(
-                ["git", "-C", str(path), "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                timeout=10
+        # Uncommitted changes, branch and upstream from one status call;
+        # untracked files don't block a pull
+        status_result = _run(
+            [*_GIT_READ, "-C", path_str, "status", "--porcelain=v2", "--branch",
+             "-z", "--untracked-files=no", "--no-ahead-behind"],
+            capture_output=True,
+            env=_git_env(),
+            timeout=10
+        )
+        local = _parse_status_v2(status_result.stdout)
+        
+        if local["has_uncommitted_changes"]:
+            raise GitError(
+                "Cannot pull with uncommitted changes",
+                "Commit or stash your changes first"
             )
-            
-            if status_result.stdout.strip():
-                raise GitError(
-                    "Cannot pull with uncommitted changes",
-                    "Commit or stash your changes first"
-                )
-            
-            # Get branch
-            branch_result = subprocess.run(
-                ["git", "-C", str(path), "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                timeout=5
+        
+        branch = local["branch"]
+        if branch is None:
+            raise GitError(
+                "Cannot pull in detached HEAD state",
+                "Checkout a branch first"
             )
-            branch = branch_result.stdout.strip()
-            
-            # Fetch
-            fetch_result = subprocess.run(
-                ["git", "-C", str(path), "fetch", "origin"],
+        
+        if local["upstream_branch"] is None:
+            raise GitError(
+                "No upstream branch configured",
+                "Set upstream with: git branch --set-upstream-to=origin/" + branch
+            )
+        
+        if prefetch:
+            fetch_result = _run(
+                [_GIT, "-C", path_str, "fetch", "origin"],
                 capture_output=True,
+                env=_network_env(path_str),
                 text=True,
                 timeout=60
             )
             
             if fetch_result.returncode != 0:
-                if "authentication" in fetch_result.stderr.lower():
+                if _is_auth_error(fetch_result.stderr):
                     raise AuthenticationError(
                         "Authentication failed during fetch",
                         "Check your SSH keys or credentials"
                     )
                 raise GitError(f"Fetch failed: {fetch_result.stderr}")
+        
+        # Pull (fetches itself)
+        pull_cmd = [_GIT, "-C", path_str, "pull", "origin", branch]
+        if rebase:
+            pull_cmd.append("--rebase")
+        
+        pull_result = _run(
+            pull_cmd,
+            capture_output=True,
+            env=_network_env(path_str),
+            text=True,
+            timeout=120
+        )
+        
+        if pull_result.returncode != 0:
+            error = pull_result.stderr.lower()
             
-            # Pull
-            pull_cmd = ["git", "-C", str(path), "pull", "origin", branch]
-            if rebase:
-                pull_cmd.append("--rebase")
-            
-            pull_result = subprocess.run(
-                pull_cmd,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            
-            if pull_result.returncode != 0:
-                error = pull_result.stderr.lower()
-                
-                if "conflict" in error:
-                    # Abort rebase
-                    subprocess.run(
-                        ["git", "-C", str(path), "rebase", "--abort"],
-                        capture_output=True,
-                        timeout=10
-                    )
-                    raise MergeConflictError(
-                        "Pull resulted in merge conflicts",
-                        "Resolve conflicts manually and continue"
-                    )
-                elif "authentication" in error:
-                    raise AuthenticationError(
-                        "Authentication failed",
-                        "Check your SSH keys or credentials"
-                    )
-                else:
-                    raise GitError(f"Pull failed: {pull_result.stderr}")
+            if "conflict" in error:
+                # Abort rebase
+                _run(
+                    [_GIT, "-C", path_str, "rebase", "--abort"],
+                    capture_output=True,
+                    env=_git_env(),
+                    timeout=10
+                )
+                raise MergeConflictError(
+                    "Pull resulted in merge conflicts",
+                    "Resolve conflicts manually and continue"
+                )
+            elif _is_auth_error(error):
+                raise AuthenticationError(
+                    "Authentication failed",
+                    "Check your SSH keys or credentials"
+                )
+            else:
+                raise GitError(f"Pull failed: {pull_result.stderr}")
         
         return {
             "success": True,
             "message": "Pull completed successfully",
-            "path": str(path),
+            "path": path_str,
             "rebase": rebase
         }
         
-    except MergeConflictError:
-        raise
-    except AuthenticationError:
-        raise
     except GitError:
         raise
     except Exception as e:
         raise GitError(
             f"Failed to pull changes: {e}",
             "Check your network connection and remote configuration"
-        )
+        ) from e
+
+
+_AUTOSYNC_FMT = "%Y-%m-%d %H:%M"
+
+
+def _default_sync_message() -> str:
+    """Return the timestamped commit message used when none is given."""
+    return f"Vault sync: {datetime.now().strftime(_AUTOSYNC_FMT)}"
 
 
+def _commits_to_push(vault: str) -> Optional[int]:
+    """Count commits on HEAD missing from its upstream; None if unknown (no upstream)."""
+    result = _run(
+        [*_GIT_READ, "-C", vault, "rev-list", "--count", "@{u}..HEAD"],
+        capture_output=True,
+        env=_git_env(),
+        timeout=10
+    )
+    if result.returncode != 0:
+        return None
+    return int(result.stdout)
+
+
+# Hooks `git commit` runs; if any is enabled the plumbing commit is skipped
+_COMMIT_HOOKS = ("pre-commit", "prepare-commit-msg", "commit-msg", "post-commit")
+
+
+def _clean_message(message: str) -> str:
+    """Tidy a message as `git commit -m` does: trailing and repeated blank lines go."""
+    lines: list[str] = []
+    for line in message.splitlines():
+        line = line.rstrip()
+        if line or (lines and lines[-1]):
+            lines.append(line)
+    while lines and not lines[-1]:
+        lines.pop()
+    return "\n".join(lines)
+
+
+def _fast_commit(path: Path, message: str) -> Optional[str]:
+    """
+    Stage everything and commit via plumbing, in one shell.
+    
+    `add -A` is the only index write; the commit is built with write-tree,
+    commit-tree and update-ref, so porcelain commit's second index refresh
+    and hook setup are skipped. When a commit hook is enabled in the hooks
+    directory (core.hooksPath included), plain `git commit` runs instead
+    so the hook still sees the commit.
+    
+    Returns:
+        The new commit SHA, or None if there was nothing to commit
+        
+    Raises:
+        GitError: If staging or committing fails
+    """
+    cleaned = _clean_message(message)
+    if not cleaned:
+        raise GitError("Commit failed: empty commit message")
+    
+    git = shlex.quote(_GIT)
+    msg = shlex.quote(cleaned)
+    reflog = shlex.quote("commit: " + cleaned.split("\n", 1)[0])
+    steps = [
+        f"{git} add -A || exit 1",
+        # Also correct on an unborn branch: compares against the empty tree
+        f"if {git} diff --cached --quiet; then exit 0; fi",
+        f"hooks=$({git} rev-parse --git-path hooks) || exit 1",
+        f"for hook in {' '.join(_COMMIT_HOOKS)}; do",
+        '  if [ -x "$hooks/$hook" ]; then',
+        f"    {git} commit -q -m {shlex.quote(message)} || exit 1",
+        f"    exec {git} rev-parse HEAD",
+        "  fi",
+        "done",
+        f"tree=$({git} write-tree) || exit 1",
+        f"parent=$({git} rev-parse -q --verify HEAD)",
+        f'commit=$({git} commit-tree "$tree" ${{parent:+-p "$parent"}} -m {msg}) || exit 1',
+        f'{git} update-ref -m {reflog} HEAD "$commit" $parent || exit 1',
+        'echo "$commit"',
+    ]
+    result = _run(
+        "\n".join(steps),
+        shell=True,
+        cwd=path,
+        capture_output=True,
+        env=_git_env(),
+        text=True,
+        timeout=60
+    )
+    if result.returncode != 0:
+        raise GitError(f"Commit failed: {result.stderr.strip()}")
+    return result.stdout.strip() or None
+
+
+@_invalidates_status
 def push_changes(
     vault_path: Union[str, Path],
     message: Optional[str] = None,
@@ -1164,6 +1882,11 @@ def push_changes(
     """
     Commit changes and push to remote.
     
+    The commit is written with plumbing (write-tree/commit-tree), which
+    skips porcelain `git commit`'s hook machinery; it falls back to
+    `git commit` whenever a pre-commit, prepare-commit-msg, commit-msg or
+    post-commit hook is enabled, so vaults relying on hooks keep them.
+    
     Args:
         vault_path: Path to the Git repository
         message: Commit message (auto-generated if None)
@@ -1180,153 +1903,156 @@ def push_changes(
     """
     _check_git_installed()
     
-    if not _is_git_repo(vault_path):
+    path, path_str = _normalize(vault_path)
+    if not _is_git_repo(path):
         raise NotAGitRepoError(
-            f"'{vault_path}' is not a Git repository",
+            f"'{path_str}' is not a Git repository",
             "Run init_git_repo() first"
         )
     
-    path = Path(vault_path)
-    
     # Auto-generate message if not provided
     if message is None:
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        message = f"Vault sync: {timestamp}"
+        message = _default_sync_message()
     
     try:
-        if GITPYTHON_AVAILABLE:
-            repo = _get_repo(vault_path)
-            
-            # Check for changes
-            if not repo.is_dirty(untracked_files=True):
-                # Still try to push in case there are unpushed commits
-                logger.info("No local changes to commit")
-                committed = False
-            else:
-                # Stage all
-                repo.git.add(A=True)
-                
-                # Commit
-                commit = repo.index.commit(message)
-                logger.info(f"Created commit: {commit.hexsha[:8]} - {message}")
-                committed = True
-            
-            # Push
-            try:
-                origin = repo.remote("origin")
-                
-                if push_all_branches:
-                    origin.push(all=True)
-                    logger.info("Pushed all branches")
-                else:
-                    branch = repo.active_branch.name
-                    origin.push(refspec=f"{branch}:{branch}")
-                    logger.info(f"Pushed {branch} to origin")
-                    
-            except GitCommandError as e:
-                error_msg = str(e).lower()
-                
-                if "rejected" in error_msg:
-                    raise PushRejectedError(
-                        "Push was rejected by remote",
-                        "Pull changes first to resolve any conflicts"
-                    )
-                elif "authentication" in error_msg or "permission" in error_msg:
-                    raise AuthenticationError(
-                        "Authentication failed during push",
-                        "Check your SSH keys or credentials"
-                    )
-                else:
-                    raise GitError(f"Push failed: {e}")
-                    
+        sha = _fast_commit(path, message)
+        committed = sha is not None
+        if sha is not None:
+            logger.info(f"Created commit: {sha[:8]} - {message}")
+        elif not push_all_branches and _commits_to_push(path_str) == 0:
+            # Idle sync: skip the network round-trip entirely
+            return {
+                "success": True,
+                "message": "Already up to date",
+                "path": path_str,
+                "committed": False,
+                "pushed": False,
+                "commit_message": None
+            }
+        
+        # Push
+        push_cmd = [_GIT, "-C", path_str, "push"]
+        if push_all_branches:
+            push_cmd.append("--all")
         else:
-            # Subprocess fallback
-            # Check for changes
-            status_result = subprocess.run(
-                ["git", "-C", str(path), "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            push_cmd.extend(["origin", "HEAD"])
+        
+        push_result = _run(
+            push_cmd,
+            capture_output=True,
+            env=_network_env(path_str),
+            text=True,
+            timeout=60
+        )
+        
+        if push_result.returncode != 0:
+            error = push_result.stderr.lower()
             
-            committed = False
-            if status_result.stdout.strip():
-                # Stage and commit
-                subprocess.run(
-                    ["git", "-C", str(path), "add", "-A"],
-                    capture_output=True,
-                    check=True,
-                    timeout=30
+            if "rejected" in error:
+                raise PushRejectedError(
+                    "Push was rejected by remote",
+                    "Pull changes first to resolve any conflicts"
                 )
-                
-                subprocess.run(
-                    ["git", "-C", str(path), "commit", "-m", message],
-                    capture_output=True,
-                    check=True,
-                    timeout=30
+            elif "authentication" in error or "permission" in error:
+                raise AuthenticationError(
+                    "Authentication failed during push",
+                    "Check your SSH keys or credentials"
                 )
-                committed = True
-                logger.info(f"Created commit: {message}")
-            
-            # Push
-            push_cmd = ["git", "-C", str(path), "push"]
-            if push_all_branches:
-                push_cmd.append("--all")
             else:
-                push_cmd.extend(["origin", "HEAD"])
-            
-            push_result = subprocess.run(
-                push_cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if push_result.returncode != 0:
-                error = push_result.stderr.lower()
-                
-                if "rejected" in error:
-                    raise PushRejectedError(
-                        "Push was rejected by remote",
-                        "Pull changes first to resolve any conflicts"
-                    )
-                elif "authentication" in error or "permission" in error:
-                    raise AuthenticationError(
-                        "Authentication failed during push",
-                        "Check your SSH keys or credentials"
-                    )
-                else:
-                    raise GitError(f"Push failed: {push_result.stderr}")
+                raise GitError(f"Push failed: {push_result.stderr}")
         
         return {
             "success": True,
             "message": "Changes pushed successfully",
-            "path": str(path),
+            "path": path_str,
             "committed": committed,
             "pushed": True,
             "commit_message": message if committed else None
         }
         
-    except PushRejectedError:
-        raise
-    except AuthenticationError:
-        raise
     except GitError:
         raise
     except Exception as e:
         raise GitError(
             f"Failed to push changes: {e}",
             "Check your network connection and remote configuration"
-        )
+        ) from e
 
 
 # Convenience functions for CLI usage
 
+def _quick_sync_fast(path: Path, path_str: str, message: str) -> set[str]:
+    """
+    Run fetch, commit, rebase and push as one shell invocation.
+    
+    The network-bound fetch runs in the background while local changes are
+    staged and committed (fetch only touches objects and remote refs, never
+    the index); the rebase onto the fetched branch and the push then run
+    serially. That is `git pull --rebase` split so the round-trip overlaps
+    the local work.
+    
+    Returns the steps that completed ("committed", "pulled", "pushed"), so
+    the caller can resume from the one that failed; empty if the shell
+    could not be started. On timeout the whole process group is killed,
+    background fetch included.
+    """
+    git = shlex.quote(_GIT)
+    steps = [
+        f"branch=$({git} symbolic-ref --short -q HEAD) || exit 1",
+        # No auto-gc from the background fetch while add and commit write
+        f'{git} -c gc.auto=0 fetch -q origin "$branch" & fetch=$!',
+        f"{git} add -A || {{ wait; exit 1; }}",
+        f"if ! {git} diff --cached --quiet; then",
+        f"  {git} commit -q -m {shlex.quote(message)} || {{ wait; exit 1; }}",
+        "  echo committed",
+        "fi",
+        'wait "$fetch" || exit 1',
+        f"{git} rebase -q FETCH_HEAD || {{ {git} rebase --abort; exit 1; }}",
+        "echo pulled",
+        f"{git} push -q origin HEAD || exit 1",
+        "echo pushed",
+    ]
+    try:
+        proc = subprocess.Popen(
+            "\n".join(steps),
+            shell=True,
+            cwd=path,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=_network_env(path_str),
+            start_new_session=True
+        )
+    except OSError:
+        return set()
+    try:
+        stdout, stderr = proc.communicate(timeout=2 * _NETWORK_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        stdout, stderr = proc.communicate()
+    
+    done = set(stdout.decode("utf-8", "replace").split())
+    if "pushed" not in done:
+        logger.debug(
+            f"Fast sync stopped after {sorted(done) or 'no steps'}, resuming step by step: "
+            f"{stderr.decode('utf-8', 'replace').strip()}"
+        )
+    return done
+
+
+@_invalidates_status
 def quick_sync(vault_path: Union[str, Path], message: Optional[str] = None) -> dict[str, Any]:
     """
     Quick sync: pull, commit, push in one operation.
     
+    The happy path runs as a single shell pipeline; if a step fails, the
+    sync resumes from that step through pull_changes/push_changes so the
+    error is reported with the usual exception types. A commit the
+    pipeline already made is still reported as committed.
+    
     Args:
         vault_path: Path to the Git repository
         message: Commit message
@@ -1334,32 +2060,121 @@ def quick_sync(vault_path: Union[str, Path], message: Optional[str] = None) -> d
     Returns:
         Dict with combined operation results
     """
-    results = {
+    path, path_str = _normalize(vault_path)
+    if message is None:
+        message = _default_sync_message()
+    
+    done = _quick_sync_fast(path, path_str, message) if _is_git_repo(path) else set()
+    committed = "committed" in done
+    
+    results: dict[str, Any] = {
         "success": False,
         "operations": {},
-        "path": str(vault_path)
+        "path": path_str
     }
     
-    # Pull first
-    try:
-        pull_result = pull_changes(vault_path)
-        results["operations"]["pull"] = pull_result
-    except GitError as e:
-        results["operations"]["pull"] = {"error": str(e), "details": e.details}
-        return results
+    # Pull first, unless the pipeline already rebased onto the remote
+    if "pulled" in done:
+        results["operations"]["pull"] = {
+            "success": True,
+            "message": "Pull completed successfully",
+            "path": path_str,
+            "rebase": True
+        }
+    else:
+        try:
+            results["operations"]["pull"] = pull_changes(path)
+        except GitError as e:
+            results["operations"]["pull"] = {"error": str(e), "details": e.details}
+            if committed:
+                results["operations"]["push"] = {
+                    "committed": True, "pushed": False, "commit_message": message
+                }
+            return results
     
     # Then push (commits if needed)
-    try:
-        push_result = push_changes(vault_path, message=message)
-        results["operations"]["push"] = push_result
-        results["success"] = True
-    except GitError as e:
-        results["operations"]["push"] = {"error": str(e), "details": e.details}
-        return results
+    if "pushed" in done:
+        push_result = {
+            "success": True,
+            "message": "Changes pushed successfully",
+            "path": path_str,
+            "committed": committed,
+            "pushed": True,
+            "commit_message": message if committed else None
+        }
+    else:
+        try:
+            push_result = push_changes(path, message=message)
+        except GitError as e:
+            results["operations"]["push"] = {
+                "error": str(e), "details": e.details, "committed": committed
+            }
+            return results
+        if committed:
+            push_result = {**push_result, "committed": True, "commit_message": message}
+    results["operations"]["push"] = push_result
+    results["success"] = True
     
     return results
 
 
+def quick_sync_many(
+    vault_paths: Sequence[Union[str, Path]],
+    message: Optional[str] = None,
+    workers: Optional[int] = None,
+    processes: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Run quick_sync over several vaults concurrently.
+    
+    Each sync is dominated by git subprocesses and network I/O, so threads
+    are the default; pass processes=True to use a process pool instead.
+    A failure in one vault is reported in its result and does not stop
+    the others.
+    
+    Args:
+        vault_paths: Paths to the Git repositories
+        message: Commit message shared by all vaults
+        workers: Pool size (default: min(8, len(vault_paths)))
+        processes: Use a ProcessPoolExecutor instead of threads
+        
+    Returns:
+        One quick_sync result dict per vault, in input order
+    """
+    if not vault_paths:
+        return []
+    if message is None:
+        message = _default_sync_message()
+    
+    # Imported here: the process pool pulls in multiprocessing at import time
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    
+    pool: Union[type[ThreadPoolExecutor], type[ProcessPoolExecutor]] = (
+        ProcessPoolExecutor if processes else ThreadPoolExecutor
+    )
+    results: list[dict[str, Any]] = []
+    with pool(max_workers=workers or min(8, len(vault_paths))) as executor:
+        futures = [executor.submit(quick_sync, p, message) for p in vault_paths]
+        for vault_path, future in zip(vault_paths, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"quick_sync failed for {vault_path}: {e}")
+                results.append({
+                    "success": False,
+                    "operations": {},
+                    "path": _normalize(vault_path)[1],
+                    "error": str(e),
+                    "details": getattr(e, "details", None),
+                })
+    
+    return results
+
+
+# "name<TAB>url (fetch)" lines of `git remote -v`; one per remote
+_REMOTE_FETCH_LINE = re.compile(rb"^([^\t\n]+)\t(.*) \(fetch\)$", re.M)
+
+
 def get_git_info(vault_path: Union[str, Path]) -> dict[str, Any]:
     """
     Get comprehensive Git information about a vault.
@@ -1370,57 +2185,53 @@ def get_git_info(vault_path: Union[str, Path]) -> dict[str, Any]:
     Returns:
         Dict with git information
     """
+    path, path_str = _normalize(vault_path)
     info = {
-        "path": str(vault_path),
+        "path": path_str,
         "is_git_repo": False,
         "git_installed": False,
         "git_version": None,
         "repo": None
     }
     
-    # Check git installation
+    # Check git installation (cached after the first successful lookup)
     try:
-        result = subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            info["git_installed"] = True
-            info["git_version"] = result.stdout.strip()
-    except Exception:
+        info["git_version"] = _git_version()
+        info["git_installed"] = True
+    except GitNotInstalledError:
         pass
     
     # Check if it's a repo
-    status = get_repo_status(vault_path)
+    status = get_repo_status(path)
     info["is_git_repo"] = status.is_git_repo
     info["status"] = status
     
     if status.is_git_repo and info["git_installed"]:
         # Get remotes
         try:
-            if GITPYTHON_AVAILABLE:
-                repo = _get_repo(vault_path)
+            if _gitpython() is not None:
+                repo = _get_repo(path, must_exist=False)
+                # Each access to r.urls runs git config; read it once
                 info["remotes"] = [
-                    {"name": r.name, "url": list(r.urls)[0] if r.urls else None}
+                    {"name": r.name, "url": next(iter(r.urls), None)}
                     for r in repo.remotes
                 ]
             else:
-                result = subprocess.run(
-                    ["git", "-C", str(vault_path), "remote", "-v"],
+                result = _run(
+                    [*_GIT_READ, "-C", path_str, "remote", "-v"],
                     capture_output=True,
-                    text=True,
+                    env=_git_env(),
                     timeout=5
                 )
                 if result.returncode == 0:
-                    remotes = {}
-                    for line in result.stdout.strip().split('\n'):
-                        if line:
-                            parts = line.split()
-                            if len(parts) >= 2:
-                                remotes[parts[0]] = parts[1]
-                    info["remotes"] = [{"name": k, "url": v} for k, v in remotes.items()]
+                    # Only the matched names/URLs are decoded
+                    info["remotes"] = [
+                        {
+                            "name": name.decode("utf-8", "replace"),
+                            "url": url.decode("utf-8", "replace"),
+                        }
+                        for name, url in _REMOTE_FETCH_LINE.findall(result.stdout)
+                    ]
         except Exception as e:
             info["remotes_error"] = str(e)
     
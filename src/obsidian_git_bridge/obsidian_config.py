@@ -10,12 +10,20 @@ from __future__ import annotations
 
 import json
 import os
+import stat
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None  # type: ignore[assignment]
+
 
 # Common Obsidian vault locations to check
 DEFAULT_VAULT_PATHS: Sequence[str] = [
@@ -54,6 +62,9 @@ DEFAULT_OBSIDIAN_GIT_CONFIG = {
     "gitDir": "",
 }
 
+# Read-only view used internally: merged into each data.json, never mutated
+_DEFAULT_CONFIG_VIEW = MappingProxyType(DEFAULT_OBSIDIAN_GIT_CONFIG)
+
 
 class VaultError(Exception):
     """Raised when there's an issue with the Obsidian vault."""
@@ -77,11 +88,9 @@ def find_vault_path() -> str | None:
         Path to the detected vault, or None if no vault found.
     """
     for path in DEFAULT_VAULT_PATHS:
-        expanded_path = Path(path).expanduser()
-        if expanded_path.exists() and expanded_path.is_dir():
-            # Check if it looks like an Obsidian vault
-            if _is_vault_directory(expanded_path):
-                return str(expanded_path)
+        expanded_path = os.path.expanduser(path)
+        if os.path.isdir(expanded_path) and _is_vault_directory(Path(expanded_path)):
+            return expanded_path
     return None
 
 
@@ -97,20 +106,17 @@ def _is_vault_directory(path: Path) -> bool:
     Returns:
         True if the directory appears to be an Obsidian vault.
     """
-    # Check for .obsidian config directory
-    obsidian_dir = path / ".obsidian"
-    if obsidian_dir.exists() and obsidian_dir.is_dir():
-        return True
+    key = os.fspath(path)
 
-    # Check for markdown files (vault likely contains notes)
+    # Check for .obsidian config directory (one stat), then stop at the
+    # first markdown file (vault likely contains notes)
+    if os.path.isdir(os.path.join(key, ".obsidian")):
+        return True
     try:
-        md_files = list(path.glob("*.md"))
-        if len(md_files) > 0:
-            return True
-    except (PermissionError, OSError):
-        pass
-
-    return False
+        with os.scandir(key) as entries:
+            return any(entry.name.endswith(".md") and entry.is_file() for entry in entries)
+    except OSError:
+        return False
 
 
 def validate_vault(vault_path: str) -> bool:
@@ -132,12 +138,12 @@ def validate_vault(vault_path: str) -> bool:
     """
     path = Path(vault_path).expanduser()
 
-    # Check existence
-    if not path.exists():
-        raise VaultError(f"Vault path does not exist: {vault_path}")
-
-    # Check if it's a directory
-    if not path.is_dir():
+    # Check existence and type with a single stat
+    try:
+        st = os.stat(path)
+    except OSError:
+        raise VaultError(f"Vault path does not exist: {vault_path}") from None
+    if not stat.S_ISDIR(st.st_mode):
         raise VaultError(f"Vault path is not a directory: {vault_path}")
 
     # Check readability
@@ -171,6 +177,70 @@ def get_vault_name(vault_path: str) -> str:
     return path.name
 
 
+def _dump_json(data: dict) -> bytes:
+    """Serialize to indented JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=16)
+def _plugin_config_bytes(interval: int, commit_message: str) -> bytes:
+    """Serialize data.json once per (interval, message) pair."""
+    return _dump_json(
+        {
+            **_DEFAULT_CONFIG_VIEW,
+            "autoBackupInterval": interval,
+            "commitMessage": commit_message,
+        }
+    )
+
+
+# Plugin metadata written to manifest.json when missing
+_MANIFEST_JSON_BYTES = _dump_json(
+    {
+        "id": "obsidian-git",
+        "name": "Obsidian Git",
+        "version": "2.24.1",
+        "minAppVersion": "0.12.0",
+        "description": "Backup your vault with git.",
+        "author": "Vinzent03",
+        "authorUrl": "https://github.com/Vinzent03",
+        "isDesktopOnly": False,
+    }
+)
+
+
+def _write_json_atomic(target: Path, data: dict | bytes) -> None:
+    """Write JSON to a temp file, fsync it, then rename over the target.
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated config.
+
+    Args:
+        target: File to (re)place.
+        data: JSON-serializable object, or already-serialized bytes.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    payload = data if isinstance(data, bytes) else _dump_json(data)
+
+    tmp_file = f"{target}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, target)
+    except OSError:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
 def configure_obsidian_git_plugin(
     vault_path: str,
     interval: int = 10,
@@ -208,41 +278,70 @@ def configure_obsidian_git_plugin(
             f"Failed to create plugin directory: {plugin_dir}\nError: {e}"
         ) from e
 
-    # Build configuration
-    config = DEFAULT_OBSIDIAN_GIT_CONFIG.copy()
-    config["autoBackupInterval"] = interval
-    config["commitMessage"] = commit_message
+    # Build configuration (serialized bytes, shared across vaults)
+    config = _plugin_config_bytes(interval, commit_message)
 
     # Write configuration file
     try:
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        _write_json_atomic(config_file, config)
     except OSError as e:
         raise PluginConfigError(
             f"Failed to write plugin configuration: {config_file}\nError: {e}"
         ) from e
 
-    # Create manifest.json if it doesn't exist (plugin metadata)
+    # Create manifest.json if it doesn't exist (plugin metadata); O_EXCL
+    # makes the existence check and the create a single syscall
     manifest_file = plugin_dir / "manifest.json"
-    if not manifest_file.exists():
-        manifest = {
-            "id": "obsidian-git",
-            "name": "Obsidian Git",
-            "version": "2.24.1",
-            "minAppVersion": "0.12.0",
-            "description": "Backup your vault with git.",
-            "author": "Vinzent03",
-            "authorUrl": "https://github.com/Vinzent03",
-            "isDesktopOnly": False,
-        }
+    try:
+        fd = os.open(manifest_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except OSError:
+        # Already present, or not creatable: the manifest is only needed
+        # for plugin recognition, so this is non-fatal either way
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_MANIFEST_JSON_BYTES)
+    except OSError:
+        # Don't leave a truncated manifest behind to be skipped next time
         try:
-            with open(manifest_file, "w", encoding="utf-8") as f:
-                json.dump(manifest, f, indent=2)
-        except OSError as e:
-            # Non-fatal: manifest is only needed for plugin recognition
+            os.unlink(manifest_file)
+        except OSError:
             pass
 
 
+# Directories never counted as note folders (besides dot-directories)
+_SKIP_DIRS = frozenset({"node_modules"})
+
+
+def _count_md_files(root: Path) -> int:
+    """Count .md files under root without building a list or Path objects.
+
+    Dot-directories (.git, .obsidian, .trash) and node_modules are skipped,
+    and directory symlinks are not followed.
+
+    Args:
+        root: Vault directory to walk.
+
+    Returns:
+        Number of markdown files found.
+    """
+    count = 0
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if not name.startswith(".") and name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif name.endswith(".md") and entry.is_file():
+                        count += 1
+        except OSError:
+            continue
+    return count
+
+
 def get_vault_info(vault_path: str | None = None) -> dict:
     """Get comprehensive information about a vault.
 
@@ -269,11 +368,10 @@ def get_vault_info(vault_path: str | None = None) -> dict:
     path = Path(vault_path).expanduser()
 
     # Count markdown files
-    md_count = len(list(path.glob("**/*.md")))
+    md_count = _count_md_files(path)
 
     # Check if git is initialized
-    git_dir = path / ".git"
-    has_git = git_dir.exists() and git_dir.is_dir()
+    has_git = os.path.isdir(path / ".git")
 
     # Check if obsidian-git plugin is configured
     plugin_config = path / ".obsidian" / "plugins" / "obsidian-git" / "data.json"
@@ -6,10 +6,13 @@ cron entries, and comprehensive setup instructions for obsidian-git-bridge.
 
 from __future__ import annotations
 
+import os
 import textwrap
-from datetime import datetime
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from string import Formatter
+from typing import TYPE_CHECKING, TextIO
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -19,43 +22,12 @@ if TYPE_CHECKING:
 DEFAULT_VPS_VAULT_DIR = "$HOME/obsidian-vaults"
 DEFAULT_VPS_SCRIPT_DIR = "$HOME/.local/bin"
 
+# Section rule used throughout the setup guide
+_SEP79 = "=" * 79
 
-class VPSSetupError(Exception):
-    """Raised when there's an issue generating VPS setup materials."""
-
-
-def generate_vps_script(
-    vault_name: str,
-    repo_url: str,
-    vault_dir: str = DEFAULT_VPS_VAULT_DIR,
-) -> str:
-    """Create sync script content for VPS deployment.
 
-    This script handles:
-    - Cloning the repository if it doesn't exist
-    - Pulling latest changes
-    - Auto-committing any local changes
-    - Pushing to remote
-
-    Args:
-        vault_name: Name of the Obsidian vault (used for directory name).
-        repo_url: Git repository URL.
-        vault_dir: Base directory for vault storage on VPS.
-
-    Returns:
-        Complete bash script content as a string.
-
-    Raises:
-        VPSSetupError: If required parameters are missing or invalid.
-    """
-    if not vault_name:
-        raise VPSSetupError("Vault name is required")
-    if not repo_url:
-        raise VPSSetupError("Repository URL is required")
-
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    script = f'''#!/bin/bash
+# Sync script body; filled in by generate_vps_script
+_VPS_SCRIPT_TEMPLATE = '''#!/bin/bash
 # =============================================================================
 # Obsidian Git Bridge - VPS Sync Script
 # Vault: {vault_name}
@@ -79,6 +51,11 @@ log() {{
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] $*" | tee -a "$LOG_FILE"
 }}
 
+# Run git against the vault without changing the shell's directory
+vault_git() {{
+    git -C "$VAULT_DIR" "$@"
+}}
+
 # =============================================================================
 # MAIN SYNC LOGIC
 # =============================================================================
@@ -95,39 +72,55 @@ if [ ! -d "$VAULT_DIR" ]; then
     fi
     log "Repository cloned successfully"
 else
-    # Vault exists, pull latest changes
-    cd "$VAULT_DIR"
-    
-    # Check if it's a git repository
-    if [ ! -d ".git" ]; then
+    # Vault exists; check it's a git repository, then pull latest changes
+    if [ ! -d "$VAULT_DIR/.git" ]; then
         log "ERROR: Directory exists but is not a git repository"
         exit 1
     fi
     
     # Configure git (if not already configured)
-    if [ -z "$(git config --get user.email 2>/dev/null || true)" ]; then
-        git config user.email "vps-sync@obsidian-git-bridge.local"
-        git config user.name "VPS Sync Bot"
+    if [ -z "$(vault_git config --get user.email 2>/dev/null || true)" ]; then
+        vault_git config user.email "vps-sync@obsidian-git-bridge.local"
+        vault_git config user.name "VPS Sync Bot"
     fi
     
-    # Pull latest changes
+    # Current branch, looked up once for both pull and push
+    BRANCH="$(vault_git branch --show-current)"
+    
+    # Pull latest changes: fetch, then let merge-tree (Git 2.38+) report
+    # conflicts before anything touches the index or working tree
     log "Pulling latest changes..."
-    if ! git pull origin "$(git branch --show-current)" --no-rebase; then
-        log "WARNING: Pull failed or has conflicts, attempting merge"
-        # Try to resolve simple conflicts by favoring incoming changes
-        if ! git diff --name-only --diff-filter=U | head -1 | grep -q .; then
-            log "No conflicts detected, continuing..."
+    if ! vault_git fetch origin "$BRANCH"; then
+        log "WARNING: Fetch failed, skipping merge"
+    else
+        MERGE_RC=0
+        MERGE_OUT="$(vault_git merge-tree --write-tree --name-only HEAD FETCH_HEAD 2>/dev/null)" \\
+            || MERGE_RC=$?
+        if [ "$MERGE_RC" -eq 0 ]; then
+            vault_git merge --no-edit -q FETCH_HEAD \\
+                || log "WARNING: Merge failed (local changes in the way?)"
+        elif [ "$MERGE_RC" -eq 1 ]; then
+            # Conflicted paths follow the tree OID, up to the first blank line
+            log "WARNING: Merge conflicts detected, manual resolution required:"
+            log "$(echo "$MERGE_OUT" | sed -n '2,/^$/p')"
         else
-            log "WARNING: Merge conflicts detected, manual resolution may be required"
+            # Older Git without merge-tree --write-tree: merge, then look
+            if ! vault_git merge --no-edit FETCH_HEAD; then
+                if vault_git diff --name-only --diff-filter=U | head -1 | grep -q .; then
+                    log "WARNING: Merge conflicts detected, manual resolution may be required"
+                else
+                    log "WARNING: Merge failed"
+                fi
+            fi
         fi
     fi
     
     # Check for local changes
-    if [ -n "$(git status --porcelain)" ]; then
+    if [ -n "$(vault_git status --porcelain)" ]; then
         log "Local changes detected, committing..."
-        git add -A
-        git commit -m "vps-sync: auto-commit $(date '+%Y-%m-%d %H:%M:%S')" || true
-        git push origin "$(git branch --show-current)" || log "WARNING: Push failed"
+        vault_git add -A
+        vault_git commit -m "vps-sync: auto-commit $(date '+%Y-%m-%d %H:%M:%S')" || true
+        vault_git push origin "$BRANCH" || log "WARNING: Push failed"
     else
         log "No local changes to commit"
     fi
@@ -136,88 +129,27 @@ fi
 log "Sync completed successfully"
 exit 0
 '''
-    return script
 
 
-def generate_cron_entry(
-    script_path: str,
-    interval_minutes: int = 5,
-) -> str:
-    """Generate cron line for automated sync.
-
-    Args:
-        script_path: Path to the sync script on the VPS.
-        interval_minutes: How often to run the sync (default: 5 minutes).
-
-    Returns:
-        Cron entry string ready to be added to crontab.
-
-    Raises:
-        VPSSetupError: If script_path is empty or interval is invalid.
-    """
-    if not script_path:
-        raise VPSSetupError("Script path is required")
-    if interval_minutes < 1 or interval_minutes > 60:
-        raise VPSSetupError("Interval must be between 1 and 60 minutes")
-
-    # Calculate cron expression
-    # For intervals that divide evenly into 60, use step syntax
-    if 60 % interval_minutes == 0:
-        minute_expr = f"*/{interval_minutes}"
-    else:
-        # Generate comma-separated list
-        minutes = list(range(0, 60, interval_minutes))
-        minute_expr = ",".join(str(m) for m in minutes)
-
-    # Redirect output to log file
-    log_file = f"$HOME/.obsidian-git-bridge/logs/cron-$(basename '{script_path}' .sh).log"
-
-    cron_line = f'{minute_expr} * * * * {script_path} >> {log_file} 2>&1'
-    return cron_line
-
-
-def generate_setup_instructions(
-    vault_name: str,
-    repo_url: str,
-    vault_dir: str = DEFAULT_VPS_VAULT_DIR,
-    sync_interval: int = 5,
-    script_dir: str = DEFAULT_VPS_SCRIPT_DIR,
-) -> str:
-    """Generate full VPS setup guide with copy-paste ready commands.
+# The sync script's literal parts, pre-encoded for generate_vps_script_bytes
+_VPS_SCRIPT_PARTS = [
+    (literal.encode("utf-8"), field)
+    for literal, field, _, _ in Formatter().parse(_VPS_SCRIPT_TEMPLATE)
+]
 
-    Args:
-        vault_name: Name of the Obsidian vault.
-        repo_url: Git repository URL.
-        vault_dir: Base directory for vault storage on VPS.
-        sync_interval: How often to sync (in minutes).
-        script_dir: Directory to store sync scripts on VPS.
-
-    Returns:
-        Complete setup instructions as formatted text.
-
-    Raises:
-        VPSSetupError: If required parameters are missing.
-    """
-    if not vault_name:
-        raise VPSSetupError("Vault name is required")
-    if not repo_url:
-        raise VPSSetupError("Repository URL is required")
-
-    script_path = f"{script_dir}/obsidian-sync-{vault_name.lower().replace(' ', '-')}.sh"
-    script_content = generate_vps_script(vault_name, repo_url, vault_dir)
-    cron_entry = generate_cron_entry(script_path, sync_interval)
-
-    instructions = f"""{'='*79}
+# Setup guide body; filled in by generate_setup_instructions and
+# streamed by write_setup_instructions
+_SETUP_INSTRUCTIONS_TEMPLATE = """{sep}
 OBSIDIAN GIT BRIDGE - VPS SETUP GUIDE
-{'='*79}
+{sep}
 
 Vault Name: {vault_name}
 Repository: {repo_url}
-Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Generated: {timestamp}
 
-{'='*79}
+{sep}
 STEP 1: CREATE SYNC SCRIPT
-{'='*79}
+{sep}
 
 Create the sync script directory:
 
@@ -240,9 +172,9 @@ Make the script executable:
 chmod +x {script_path}
 ---
 
-{'='*79}
+{sep}
 STEP 2: TEST THE SYNC SCRIPT
-{'='*79}
+{sep}
 
 Run the script manually to verify it works:
 
@@ -256,9 +188,9 @@ Check the log output:
 tail -f $HOME/.obsidian-git-bridge/logs/{vault_name}-sync.log
 ---
 
-{'='*79}
+{sep}
 STEP 3: SET UP AUTOMATED SYNC (CRON)
-{'='*79}
+{sep}
 
 Add the following line to your crontab:
 
@@ -279,9 +211,9 @@ To verify the cron entry was added:
 crontab -l | grep obsidian
 ---
 
-{'='*79}
+{sep}
 STEP 4: VERIFY SETUP
-{'='*79}
+{sep}
 
 1. Check that the vault was cloned:
    ls -la {vault_dir}/{vault_name}/
@@ -295,9 +227,9 @@ STEP 4: VERIFY SETUP
 4. Verify cron is running:
    ps aux | grep cron
 
-{'='*79}
+{sep}
 OPTIONAL: MANUAL SYNC COMMANDS
-{'='*79}
+{sep}
 
 Force sync now:
   {script_path}
@@ -311,9 +243,9 @@ Pull latest:
 Push local changes:
   cd {vault_dir}/{vault_name} && git add -A && git commit -m "manual sync" && git push
 
-{'='*79}
+{sep}
 TROUBLESHOOTING
-{'='*79}
+{sep}
 
 Issue: "Permission denied" when running script
   Fix: chmod +x {script_path}
@@ -328,20 +260,259 @@ Issue: Sync conflicts
   Fix: Manually resolve in {vault_dir}/{vault_name}/
         cd {vault_dir}/{vault_name} && git status
 
-{'='*79}
+{sep}
 FILES CREATED
-{'='*79}
+{sep}
 
 Sync Script:   {script_path}
 Vault Location: {vault_dir}/{vault_name}/
 Log Files:     $HOME/.obsidian-git-bridge/logs/
 Cron Entry:    {cron_entry}
 
-{'='*79}
+{sep}
 SETUP COMPLETE
-{'='*79}
+{sep}
 """
-    return instructions
+
+
+# The setup guide split once into (literal, field) pairs for streaming
+_SETUP_INSTRUCTIONS_PARTS = [
+    (literal, field)
+    for literal, field, _, _ in Formatter().parse(_SETUP_INSTRUCTIONS_TEMPLATE)
+]
+
+# docker-compose.yml body; filled in by generate_docker_compose
+_DOCKER_COMPOSE_TEMPLATE = '''version: "3.8"
+
+services:
+  obsidian-git-bridge:
+    image: alpine/git:latest
+    container_name: obsidian-sync
+    environment:
+      - SYNC_INTERVAL={sync_interval}
+{env_vars}
+    volumes:
+      - ./vaults:/vaults
+      - ./scripts:/scripts:ro
+    command: |
+      sh -c "
+        apk add --no-cache bash curl &&
+        while true; do
+          for vault in /vaults/*/; do
+            if [ -d \"$$vault/.git\" ]; then
+              cd \"$$vault\" && git pull && git push
+            fi
+          done
+          sleep {sync_interval}
+        done
+      "
+    restart: unless-stopped
+    logging:
+      driver: "json-file"
+      options:
+        max-size: "10m"
+        max-file: "3"
+
+volumes:
+  vaults:
+    driver: local
+'''
+
+
+class VPSSetupError(Exception):
+    """Raised when there's an issue generating VPS setup materials."""
+
+
+def generate_vps_script(
+    vault_name: str,
+    repo_url: str,
+    vault_dir: str = DEFAULT_VPS_VAULT_DIR,
+) -> str:
+    """Create sync script content for VPS deployment.
+
+    This script handles:
+    - Cloning the repository if it doesn't exist
+    - Pulling latest changes
+    - Auto-committing any local changes
+    - Pushing to remote
+
+    Args:
+        vault_name: Name of the Obsidian vault (used for directory name).
+        repo_url: Git repository URL.
+        vault_dir: Base directory for vault storage on VPS.
+
+    Returns:
+        Complete bash script content as a string.
+
+    Raises:
+        VPSSetupError: If required parameters are missing or invalid.
+    """
+    return _VPS_SCRIPT_TEMPLATE.format_map(_vps_script_fields(vault_name, repo_url, vault_dir))
+
+
+def generate_vps_script_bytes(
+    vault_name: str,
+    repo_url: str,
+    vault_dir: str = DEFAULT_VPS_VAULT_DIR,
+) -> bytes:
+    """Create the VPS sync script as UTF-8 bytes, ready to write to disk.
+
+    Same content as generate_vps_script; the template's literal parts are
+    encoded once at import, so only the substituted values are encoded
+    per call.
+
+    Raises:
+        VPSSetupError: If required parameters are missing or invalid.
+    """
+    fields = _vps_script_fields(vault_name, repo_url, vault_dir)
+    return b"".join([
+        part if field is None else part + fields[field].encode("utf-8")
+        for part, field in _VPS_SCRIPT_PARTS
+    ])
+
+
+def _vps_script_fields(vault_name: str, repo_url: str, vault_dir: str) -> dict[str, str]:
+    """Validate inputs and compute the values for the sync script template."""
+    if not vault_name:
+        raise VPSSetupError("Vault name is required")
+    if not repo_url:
+        raise VPSSetupError("Repository URL is required")
+
+    return {
+        "vault_name": vault_name,
+        "repo_url": repo_url,
+        "vault_dir": vault_dir,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+@lru_cache(maxsize=64)
+def _minute_expr(interval_minutes: int) -> str:
+    """Return the cron minute field for a validated 1-60 minute interval."""
+    # For intervals that divide evenly into 60, use step syntax
+    if 60 % interval_minutes == 0:
+        return f"*/{interval_minutes}"
+    # Otherwise list the minutes explicitly
+    return ",".join(map(str, range(0, 60, interval_minutes)))
+
+
+def generate_cron_entry(
+    script_path: str,
+    interval_minutes: int = 5,
+) -> str:
+    """Generate cron line for automated sync.
+
+    Args:
+        script_path: Path to the sync script on the VPS.
+        interval_minutes: How often to run the sync (default: 5 minutes).
+
+    Returns:
+        Cron entry string ready to be added to crontab.
+
+    Raises:
+        VPSSetupError: If script_path is empty or interval is invalid.
+    """
+    if not script_path:
+        raise VPSSetupError("Script path is required")
+    if interval_minutes < 1 or interval_minutes > 60:
+        raise VPSSetupError("Interval must be between 1 and 60 minutes")
+
+    minute_expr = _minute_expr(interval_minutes)
+
+    # Redirect output to log file
+    log_file = f"$HOME/.obsidian-git-bridge/logs/cron-$(basename '{script_path}' .sh).log"
+
+    cron_line = f'{minute_expr} * * * * {script_path} >> {log_file} 2>&1'
+    return cron_line
+
+
+def generate_setup_instructions(
+    vault_name: str,
+    repo_url: str,
+    vault_dir: str = DEFAULT_VPS_VAULT_DIR,
+    sync_interval: int = 5,
+    script_dir: str = DEFAULT_VPS_SCRIPT_DIR,
+) -> str:
+    """Generate full VPS setup guide with copy-paste ready commands.
+
+    Args:
+        vault_name: Name of the Obsidian vault.
+        repo_url: Git repository URL.
+        vault_dir: Base directory for vault storage on VPS.
+        sync_interval: How often to sync (in minutes).
+        script_dir: Directory to store sync scripts on VPS.
+
+    Returns:
+        Complete setup instructions as formatted text.
+
+    Raises:
+        VPSSetupError: If required parameters are missing.
+    """
+    return _SETUP_INSTRUCTIONS_TEMPLATE.format_map(
+        _setup_instructions_fields(vault_name, repo_url, vault_dir, sync_interval, script_dir)
+    )
+
+
+def write_setup_instructions(
+    fp: TextIO,
+    vault_name: str,
+    repo_url: str,
+    vault_dir: str = DEFAULT_VPS_VAULT_DIR,
+    sync_interval: int = 5,
+    script_dir: str = DEFAULT_VPS_SCRIPT_DIR,
+) -> None:
+    """Write the VPS setup guide to a text stream, piece by piece.
+
+    Same output as generate_setup_instructions, without building the
+    whole guide in memory first.
+
+    Args:
+        fp: Writable text stream (e.g. an open file).
+        vault_name: Name of the Obsidian vault.
+        repo_url: Git repository URL.
+        vault_dir: Base directory for vault storage on VPS.
+        sync_interval: How often to sync (in minutes).
+        script_dir: Directory to store sync scripts on VPS.
+
+    Raises:
+        VPSSetupError: If required parameters are missing.
+    """
+    fields = _setup_instructions_fields(vault_name, repo_url, vault_dir, sync_interval, script_dir)
+    for literal, field in _SETUP_INSTRUCTIONS_PARTS:
+        fp.write(literal)
+        if field is not None:
+            fp.write(str(fields[field]))
+
+
+def _setup_instructions_fields(
+    vault_name: str,
+    repo_url: str,
+    vault_dir: str,
+    sync_interval: int,
+    script_dir: str,
+) -> dict[str, object]:
+    """Validate inputs and compute the values for the setup guide template."""
+    if not vault_name:
+        raise VPSSetupError("Vault name is required")
+    if not repo_url:
+        raise VPSSetupError("Repository URL is required")
+
+    script_path = f"{script_dir}/obsidian-sync-{vault_name.lower().replace(' ', '-')}.sh"
+    script_content = generate_vps_script(vault_name, repo_url, vault_dir)
+    cron_entry = generate_cron_entry(script_path, sync_interval)
+
+    return {
+        "vault_name": vault_name,
+        "repo_url": repo_url,
+        "vault_dir": vault_dir,
+        "sync_interval": sync_interval,
+        "script_dir": script_dir,
+        "script_path": script_path,
+        "script_content": script_content,
+        "cron_entry": cron_entry,
+        "sep": _SEP79,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
 
 
 def write_vps_script_to_file(
@@ -364,16 +535,22 @@ def write_vps_script_to_file(
     Raises:
         VPSSetupError: If the script cannot be written.
     """
-    script_content = generate_vps_script(vault_name, repo_url, vault_dir)
+    script_content = generate_vps_script_bytes(vault_name, repo_url, vault_dir)
 
     output = Path(output_path).expanduser()
 
     try:
         output.parent.mkdir(parents=True, exist_ok=True)
-        with open(output, "w", encoding="utf-8") as f:
-            f.write(script_content)
-        # Make executable
-        output.chmod(0o755)
+        # Created executable, so it is never visible with default permissions
+        fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            view = memoryview(script_content)
+            while view:
+                view = view[os.write(fd, view):]
+            # The umask (or an existing file's mode) may have dropped bits
+            os.fchmod(fd, 0o755)
+        finally:
+            os.close(fd)
     except OSError as e:
         raise VPSSetupError(f"Failed to write script to {output}: {e}") from e
 
@@ -393,47 +570,12 @@ def generate_docker_compose(
     Returns:
         Docker Compose YAML content.
     """
-    vault_configs = []
-    for vault in vaults:
-        name = vault.get("name", "vault")
-        repo = vault.get("repo_url", "")
-        vault_configs.append(f"      - VAULT_{name.upper()}={repo}")
-
-    env_vars = "\n".join(vault_configs)
-
-    compose = f'''version: "3.8"
-
-services:
-  obsidian-git-bridge:
-    image: alpine/git:latest
-    container_name: obsidian-sync
-    environment:
-      - SYNC_INTERVAL={sync_interval}
-{env_vars}
-    volumes:
-      - ./vaults:/vaults
-      - ./scripts:/scripts:ro
-    command: |
-      sh -c "
-        apk add --no-cache bash curl &&
-        while true; do
-          for vault in /vaults/*/; do
-            if [ -d \"$$vault/.git\" ]; then
-              cd \"$$vault\" && git pull && git push
-            fi
-          done
-          sleep {sync_interval}
-        done
-      "
-    restart: unless-stopped
-    logging:
-      driver: "json-file"
-      options:
-        max-size: "10m"
-        max-file: "3"
-
-volumes:
-  vaults:
-    driver: local
-'''
-    return compose
+    env_vars = "\n".join(
+        f"      - VAULT_{vault.get('name', 'vault').upper()}={vault.get('repo_url', '')}"
+        for vault in vaults
+    )
+
+    return _DOCKER_COMPOSE_TEMPLATE.format_map({
+        "sync_interval": sync_interval,
+        "env_vars": env_vars,
+    })
@@ -1,28 +1,96 @@
 """Wrapper classes for obsidian-git-bridge CLI compatibility."""
 
+import os
+import shlex
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
-# Import function modules
+# Import function modules; obsidian_config is only needed by ObsidianConfig
+# and is imported there on first use
 from . import git_ops
-from . import obsidian_config as oc
-from . import vps_setup as vs
+
+
+_GIT_OPERATIONS: dict[Path, "GitOperations"] = {}
+
+# Prefix for progress markers echoed by the sync pipeline
+_SYNC_MARKER = "@@ogb:"
 
 
 class GitOperations:
     """Wrapper for Git operations."""
 
+    __slots__ = ("vault_path", "verbose", "_cat", "_probe")
+
+    # Absolute path of the git executable, resolved once at import
+    GIT_BIN = git_ops._GIT
+    GIT_READ = git_ops._GIT_READ
+
     def __init__(self, vault_path: Path, verbose: bool = False) -> None:
         self.vault_path = vault_path
         self.verbose = verbose
+        self._cat: Optional[git_ops._CatFileBatch] = None
+        self._probe: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def for_vault(cls, vault_path: Path, verbose: bool = False) -> "GitOperations":
+        """Get a shared instance for a vault, reusing its persistent git process."""
+        ops = _GIT_OPERATIONS.get(vault_path)
+        if ops is None:
+            ops = _GIT_OPERATIONS[vault_path] = cls(vault_path, verbose=verbose)
+        ops.verbose = verbose
+        return ops
+
+    def read_object(self, rev: str) -> Optional[tuple[str, str, bytes]]:
+        """Read a Git object through the vault's persistent cat-file process."""
+        if self._cat is None:
+            self._cat = git_ops._cat_file(self.vault_path)
+        return self._cat.read_object(rev)
+
+    def head_sha(self) -> Optional[str]:
+        """Get the SHA of HEAD, or None if there are no commits yet."""
+        obj = self.read_object("HEAD")
+        return obj[0] if obj else None
+
+    def probe(self) -> dict[str, Any]:
+        """
+        Describe the vault's repository without spawning git.
+
+        Reads .git (following a worktree "gitdir:" file) and HEAD directly.
+        The result is cached until the repository is (re)initialized.
+
+        Returns:
+            Dictionary with is_repo, toplevel and branch (None when detached
+            or not a repository).
+        """
+        if self._probe is None:
+            self._probe = self._read_probe()
+        return self._probe
+
+    def _read_probe(self) -> dict[str, Any]:
+        git_dir = os.path.join(self.vault_path, ".git")
+        try:
+            if os.path.isfile(git_dir):
+                with open(git_dir, encoding="utf-8") as f:
+                    gitdir_line = f.read().strip()
+                if gitdir_line.startswith("gitdir:"):
+                    git_dir = os.path.join(self.vault_path, gitdir_line[len("gitdir:"):].strip())
+            with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+                head = f.read().strip()
+        except OSError:
+            return {"is_repo": False, "toplevel": None, "branch": None}
+
+        branch = head[len("ref: refs/heads/"):] if head.startswith("ref: refs/heads/") else None
+        return {"is_repo": True, "toplevel": self.vault_path, "branch": branch}
 
     def is_git_repo(self) -> bool:
         """Check if vault is already a Git repository."""
-        git_dir = self.vault_path / ".git"
-        return git_dir.exists()
+        return bool(self.probe()["is_repo"])
 
     def init_repo(self) -> dict[str, Any]:
         """Initialize Git repository."""
+        self._probe = None
         return git_ops.init_git_repo(self.vault_path)
 
     def configure_gitignore(self) -> dict[str, Any]:
@@ -33,7 +101,7 @@ class GitOperations:
         """Add Git remote (alias for setup_remote for CLI compatibility)."""
         # Determine auth method from URL
         auth_method = "ssh" if url.startswith("git@") else "https"
-        return git_ops.setup_remote(self.vault_path, url, auth_method)
+        return self.setup_remote(url, auth_method)
 
     def setup_remote(self, url: str, auth_method: str = "ssh") -> dict[str, Any]:
         """Setup remote repository."""
@@ -43,20 +111,45 @@ class GitOperations:
         """Create initial commit and push."""
         return git_ops.initial_commit(self.vault_path)
 
-    def get_status(self) -> dict[str, Any]:
-        """Get repository status."""
-        status = git_ops.get_repo_status(self.vault_path)
+    def commit_gitignore(self) -> dict[str, Any]:
+        """Commit .gitignore and exclude local Obsidian state."""
+        return git_ops.initial_commit_with_gitignore(self.vault_path)
+
+    def get_status(self, include_untracked: bool = False) -> dict[str, Any]:
+        """
+        Get repository status.
+
+        Untracked files are only listed when `include_untracked` is set, as
+        finding them means walking the whole working tree.
+        """
+        head = self.head_sha()
+        status = git_ops.get_repo_status(self.vault_path, include_untracked=False)
+        untracked = self.list_untracked() if include_untracked else []
         # Convert RepoStatus to dict for CLI
         return {
             "branch": status.branch,
-            "remote": status.remote_url,
+            "head": head[:8] if head else None,
+            "remote": status.upstream_branch,
             "ahead": status.commits_ahead,
             "behind": status.commits_behind,
             "modified": status.modified_files or [],
-            "untracked": status.untracked_files or [],
-            "is_clean": status.is_clean(),
+            "untracked": untracked,
+            "is_clean": status.is_clean and not untracked,
         }
 
+    def list_untracked(self) -> list[str]:
+        """List untracked, non-ignored files."""
+        result = subprocess.run(
+            [*self.GIT_READ, "-C", str(self.vault_path),
+             "ls-files", "-z", "--others", "--exclude-standard"],
+            capture_output=True,
+            env=git_ops._git_env(),
+            timeout=60,
+        )
+        if result.returncode != 0:
+            return []
+        return [os.fsdecode(p) for p in result.stdout.split(b"\x00") if p]
+
     def pull(self) -> dict[str, Any]:
         """Pull changes from remote."""
         return git_ops.pull_changes(self.vault_path)
@@ -69,62 +162,164 @@ class GitOperations:
         """Quick sync (pull + push)."""
         return git_ops.quick_sync(self.vault_path, message)
 
+    def sync_pipeline(self, message: str, push: bool = True) -> dict[str, Any]:
+        """
+        Pull, stage, commit and optionally push in a single shell invocation.
+
+        The network fetch runs in the background while `add -A` stages the
+        vault (fetch only touches refs and objects, never the index). The
+        local commit is then rebased onto the fetched upstream, as quick_sync
+        does, so diverged history still pushes; a rebase that conflicts is
+        aborted and reported. A failed fetch is not fatal (e.g. no upstream
+        yet); a failed step stops the pipeline and is named in
+        `failed_step`.
+        """
+        git = shlex.quote(self.GIT_BIN)
+        fail = f"{{ echo {_SYNC_MARKER}failed:%s; exit 1; }}"
+        steps = [
+            # No auto-gc from the background fetch while add holds the index
+            f"{git} -c gc.auto=0 fetch --quiet & fetch_pid=$!",
+            f"{git} add -A || {{ wait $fetch_pid; {fail % 'add'}; }}",
+            "wait $fetch_pid && fetched=1",
+            f"if {git} diff --cached --quiet; then echo {_SYNC_MARKER}nothing; "
+            f"else {git} commit -q -m {shlex.quote(message)} || {fail % 'commit'}; "
+            f"echo {_SYNC_MARKER}committed; fi",
+            f"if [ -n \"$fetched\" ] && {git} rev-parse -q --verify '@{{u}}' >/dev/null; then",
+            f"  if ! {git} rev-parse -q --verify HEAD >/dev/null; then",
+            f"    {git} merge --ff-only --quiet '@{{u}}' || {fail % 'pull'}",
+            f"    echo {_SYNC_MARKER}pulled",
+            f"  elif ! {git} merge-base --is-ancestor '@{{u}}' HEAD; then",
+            f"    {git} rebase -q '@{{u}}' || {{ {git} rebase --abort; "
+            "echo 'Local and upstream history have diverged and could not be rebased;"
+            " resolve it manually' >&2; "
+            f"{fail % 'rebase'}; }}",
+            f"    echo {_SYNC_MARKER}pulled",
+            "  fi",
+            "fi",
+        ]
+        if push:
+            steps.append(f"{git} push --quiet origin HEAD || {fail % 'push'}")
+            steps.append(f"echo {_SYNC_MARKER}pushed")
+
+        result = subprocess.run(
+            "\n".join(steps),
+            shell=True,
+            cwd=self.vault_path,
+            capture_output=True,
+            env=git_ops._network_env(str(self.vault_path)),
+            text=True,
+            timeout=180
+        )
+
+        markers = {
+            line[len(_SYNC_MARKER):]
+            for line in result.stdout.splitlines()
+            if line.startswith(_SYNC_MARKER)
+        }
+        failed_step = next(
+            (m[len("failed:"):] for m in markers if m.startswith("failed:")), None
+        )
+        success = result.returncode == 0
+        committed = "committed" in markers
+        stderr = result.stderr.strip() or None
+        return {
+            "success": success,
+            "pulled": "pulled" in markers,
+            "committed": committed,
+            "nothing_to_commit": "nothing" in markers,
+            "pushed": "pushed" in markers,
+            "message": message if committed else None,
+            "failed_step": failed_step if not success else None,
+            # stderr of a successful run only carries warnings (e.g. a failed fetch)
+            "error": (stderr or "unknown error") if not success else None,
+            "warning": stderr if success else None,
+        }
+
 
 class ObsidianConfig:
     """Wrapper for Obsidian configuration."""
 
-    # Common vault locations to check
-    COMMON_VAULT_PATHS = [
+    # Common vault locations to check (instances may override)
+    COMMON_VAULT_PATHS = (
         "~/Documents/Obsidian",
         "~/Obsidian",
         "~/obsidian",
         "~/Dropbox/Obsidian",
         "~/iCloud Drive/Obsidian",
         "~/.obsidian",
-    ]
+    )
+
+    # Subdirectories probed for notes before a candidate is rejected
+    MAX_SUBDIR_PROBES = 32
 
     def __init__(self, vault_path: Optional[Path] = None) -> None:
         self.vault_path = vault_path
 
     def detect_vault_path(self) -> Optional[Path]:
         """Auto-detect Obsidian vault path from common locations."""
+        from . import obsidian_config as oc
+        
         # First try the obsidian_config module
         path_str = oc.find_vault_path()
         if path_str:
             return Path(path_str).expanduser().resolve()
         
-        # Check common locations
-        for path_template in self.COMMON_VAULT_PATHS:
-            path = Path(path_template).expanduser().resolve()
-            if path.exists() and path.is_dir():
-                # Check if it has .obsidian folder or markdown files
-                if self._looks_like_vault(path):
-                    return path
+        # Probe concurrently (slow synced/network homes), but honor the
+        # order: the first hit in list order wins
+        paths = [os.path.expanduser(p) for p in self.COMMON_VAULT_PATHS]
+        if not paths:
+            return None
+        probe = self._probe_candidate
+        executor = ThreadPoolExecutor(max_workers=len(paths))
+        try:
+            futures = [executor.submit(probe, path) for path in paths]
+            for future in futures:
+                hit = future.result()
+                if hit is not None:
+                    return hit
+        finally:
+            # Don't wait for lower-priority probes once there's an answer
+            executor.shutdown(wait=False, cancel_futures=True)
         
         return None
 
+    def _probe_candidate(self, path: str) -> Optional[Path]:
+        """Return the resolved path if it is a directory that looks like a vault."""
+        if os.path.isdir(path) and self._looks_like_vault(Path(path)):
+            return Path(path).resolve()
+        return None
+
     def _looks_like_vault(self, path: Path) -> bool:
         """Check if directory looks like an Obsidian vault."""
         # Has .obsidian folder?
-        if (path / ".obsidian").exists():
-            return True
-        
-        # Has markdown files?
-        md_files = list(path.glob("*.md"))
-        if len(md_files) > 0:
+        if os.path.isdir(os.path.join(path, ".obsidian")):
             return True
         
-        # Has subdirectories with markdown?
-        for subdir in path.iterdir():
-            if subdir.is_dir():
-                md_files = list(subdir.glob("*.md"))
-                if len(md_files) > 0:
-                    return True
+        # Markdown at the top level or in one of the first
+        # MAX_SUBDIR_PROBES subdirectories; stop at the first
+        subdirs_left = self.MAX_SUBDIR_PROBES
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        return True
+                    if subdirs_left and entry.is_dir(follow_symlinks=False):
+                        subdirs_left -= 1
+                        try:
+                            with os.scandir(entry.path) as sub:
+                                if any(s.name.endswith(".md") and s.is_file() for s in sub):
+                                    return True
+                        except OSError:
+                            # Unreadable subdirectory; keep looking
+                            continue
+        except OSError:
+            pass
         
         return False
 
     def validate_vault(self, path: Path) -> bool:
         """Validate if path is a valid Obsidian vault."""
+        from . import obsidian_config as oc
         return oc.validate_vault(str(path))
 
     # Alias for test compatibility
@@ -132,39 +327,106 @@ class ObsidianConfig:
 
     def get_vault_name(self, path: Path) -> str:
         """Get vault name from path."""
+        from . import obsidian_config as oc
         return oc.get_vault_name(str(path))
 
-    def configure_git_plugin(self, path: Optional[Path] = None, interval: int = 10) -> dict[str, Any]:
+    def configure_git_plugin(
+        self, path: Optional[Path] = None, interval: int = 10
+    ) -> dict[str, Any]:
         """Configure Obsidian Git plugin."""
         vault_path = path or self.vault_path
         if vault_path is None:
             raise ValueError("Vault path required")
+        from . import obsidian_config as oc
         return oc.configure_obsidian_git_plugin(str(vault_path), interval)
 
     def create_gitignore(self, path: Optional[Path] = None) -> Path:
         """Create Obsidian-specific .gitignore file."""
-        from .git_ops import configure_gitignore
-        
         vault_path = path or self.vault_path
         if vault_path is None:
             raise ValueError("Vault path required")
         
-        result = configure_gitignore(str(vault_path))
+        result = git_ops.configure_gitignore(str(vault_path))
         return Path(result["path"])
 
 
 class VPSSetupGenerator:
     """Wrapper for VPS setup generation."""
 
+    __slots__ = (
+        "vault_path", "vault_name", "output_dir", "last_generated_content",
+        "_script", "_instructions", "_written",
+    )
+
     def __init__(self, vault_path: Path, output_dir: Path) -> None:
         self.vault_path = vault_path
         self.vault_name = vault_path.name
         self.output_dir = output_dir
+        # Text of the file most recently written by a generate_* method
+        self.last_generated_content: Optional[str] = None
+        # Rendered on first use; the inputs are fixed per instance
+        self._script: Optional[str] = None
+        self._instructions: Optional[str] = None
+        # Path -> stat stamp of the file as this instance last wrote it
+        self._written: dict[Path, tuple[int, int, int]] = {}
 
     def generate_cron_script(self, schedule: str = "*/15 * * * *") -> Path:
         """Generate cron script (alias for generate_setup_script for CLI compatibility)."""
-        # Create the script content
-        script_content = f'''#!/bin/bash
+        script_path = self._script_path()
+        self.last_generated_content = self._script_text()
+        self._write_once(script_path, self.last_generated_content, executable=True)
+        return script_path
+
+    def _script_path(self) -> Path:
+        """Path of the generated sync script."""
+        return self.output_dir / f"{self.vault_name}-sync.sh"
+
+    def _script_text(self) -> str:
+        if self._script is None:
+            self._script = self._cron_script_content()
+        return self._script
+
+    def _instructions_text(self) -> str:
+        if self._instructions is None:
+            self._instructions = self._setup_instructions_content()
+        return self._instructions
+
+    def _write_once(self, path: Path, content: str, executable: bool = False) -> None:
+        """Write a generated file unless it is untouched since this instance wrote it."""
+        stamp = self._written.get(path)
+        if stamp is not None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is not None and (st.st_ino, st.st_mtime_ns, st.st_size) == stamp:
+                return
+        
+        st = self._write_file(path, content, executable)
+        self._written[path] = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _write_file(path: Path, content: str, executable: bool = False) -> os.stat_result:
+        """Write a file with bare os calls, marking scripts executable.
+        
+        Returns the fstat of the written file.
+        """
+        mode = 0o755 if executable else 0o644
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            view = memoryview(content.encode("utf-8"))
+            while view:
+                view = view[os.write(fd, view):]
+            if executable:
+                # The umask (or an existing file's mode) may have dropped bits
+                os.fchmod(fd, mode)
+            return os.fstat(fd)
+        finally:
+            os.close(fd)
+
+    def _cron_script_content(self) -> str:
+        """Render the sync script."""
+        return f'''#!/bin/bash
 # Obsidian Vault Sync Script for VPS
 # Auto-generated by obsidian-git-bridge
 
@@ -183,13 +445,6 @@ if ! git diff-index --quiet HEAD --; then
     git push origin main >> "$LOG_FILE" 2>&1
 fi
 '''
-        
-        # Write script
-        script_path = self.output_dir / f"{self.vault_name}-sync.sh"
-        script_path.write_text(script_content)
-        script_path.chmod(0o755)  # Make executable
-        
-        return script_path
 
     def generate_cron_job(self) -> str:
         """Generate cron job entry."""
@@ -197,7 +452,14 @@ fi
 
     def generate_setup_instructions(self) -> Path:
         """Generate setup instructions file."""
-        instructions = f'''# VPS Setup Instructions for {self.vault_name}
+        instructions_path = self.output_dir / "VPS_SETUP.md"
+        self.last_generated_content = self._instructions_text()
+        self._write_once(instructions_path, self.last_generated_content)
+        return instructions_path
+
+    def _setup_instructions_content(self) -> str:
+        """Render VPS_SETUP.md."""
+        return f'''# VPS Setup Instructions for {self.vault_name}
 
 ## 1. Clone the Repository on VPS
 
@@ -239,15 +501,25 @@ tail -f /var/log/obsidian-{self.vault_name}-sync.log
 ---
 *Generated by obsidian-git-bridge*
 '''
-        
-        instructions_path = self.output_dir / "VPS_SETUP.md"
-        instructions_path.write_text(instructions)
-        return instructions_path
 
     def get_full_setup(self) -> dict[str, Any]:
         """Get complete VPS setup package."""
+        script_path = self._script_path()
+        instructions_path = self.output_dir / "VPS_SETUP.md"
+        # Render both files first, then write them concurrently
+        script = self._script_text()
+        instructions = self._instructions_text()
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._write_once, script_path, script, True),
+                executor.submit(self._write_once, instructions_path, instructions),
+            ]
+            for future in futures:
+                future.result()
+        
         return {
-            "script": self.generate_cron_script(),
+            "script": script_path,
             "cron": self.generate_cron_job(),
-            "instructions": self.generate_setup_instructions(),
+            "instructions": instructions_path,
         }
@@ -0,0 +1,52 @@
+"""Shared pytest fixtures."""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from obsidian_git_bridge import init_git_repo
+
+
+def pytest_configure(config):
+    """Put pytest's tmp_path on tmpfs (/dev/shm) when the host has one.
+
+    Only pytest's base temp directory moves; tempfile, and so the code
+    under test, keeps the system default. --basetemp or TMPDIR wins.
+    """
+    if config.option.basetemp or "TMPDIR" in os.environ:
+        return
+    if not (os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)):
+        return
+    basetemp = tempfile.mkdtemp(prefix="pytest-", dir="/dev/shm")
+    config.option.basetemp = basetemp
+    config.add_cleanup(lambda: shutil.rmtree(basetemp, ignore_errors=True))
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory):
+    """Initialize one pristine repository per session to copy from."""
+    template = tmp_path_factory.mktemp("template") / "vault"
+    init_git_repo(template)
+    return template
+
+
+@pytest.fixture
+def vault_path(git_template, tmp_path):
+    """Provide a fresh, initialized vault without running `git init` again."""
+    vault = tmp_path / "test_vault"
+    shutil.copytree(git_template, vault, symlinks=True)
+    return vault
+
+
+@pytest.fixture
+def git_identity(monkeypatch):
+    """Give git an author and committer without touching any config file."""
+    for var, value in (
+        ("GIT_AUTHOR_NAME", "Test"),
+        ("GIT_AUTHOR_EMAIL", "test@example.com"),
+        ("GIT_COMMITTER_NAME", "Test"),
+        ("GIT_COMMITTER_EMAIL", "test@example.com"),
+    ):
+        monkeypatch.setenv(var, value)
@@ -35,3 +35,183 @@ def test_init_help(runner):
     result = runner.invoke(cli, ["init", "--help"])
     assert result.exit_code == 0
     assert "Initialize" in result.output
+
+
+def test_vault_path_uses_persisted_detection(tmp_path, monkeypatch):
+    """Test auto-detection reuses the last detected vault from the cache file."""
+    from obsidian_git_bridge import cli as cli_module
+
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    cli_module._store_cached_vault(vault)
+
+    assert cli_module.get_vault_path(None) == vault
+
+
+def test_vault_path_ignores_stale_cache(tmp_path, monkeypatch):
+    """Test a cached vault that no longer exists is not returned."""
+    from obsidian_git_bridge import cli as cli_module
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    cli_module._store_cached_vault(tmp_path / "gone")
+
+    assert cli_module._load_cached_vault() is None
+
+
+def test_status_requires_git_repo(runner, tmp_path):
+    """Test status refuses a vault without a repository."""
+    result = runner.invoke(cli, ["--vault-path", str(tmp_path), "status"])
+    assert result.exit_code == 1
+    assert "Not a Git repository" in result.output
+
+
+def test_status_reports_branch(runner, tmp_path):
+    """Test status on a freshly initialized vault."""
+    import subprocess
+
+    subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True)
+    result = runner.invoke(cli, ["--vault-path", str(tmp_path), "status"])
+    assert result.exit_code == 0
+    assert "main" in result.output
+    assert "No commits yet" in result.output
+
+
+def test_status_sees_tracked_edit(runner, tmp_path, git_identity):
+    """Test an edit to a tracked file shows up on the very next status call."""
+    import subprocess
+
+    subprocess.run(["git", "init", "-q", "-b", "main", str(tmp_path)], check=True)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.md").write_text("a\n")
+    subprocess.run(["git", "-C", str(tmp_path), "add", "-A"], check=True)
+    subprocess.run(["git", "-C", str(tmp_path), "commit", "-q", "-m", "init"], check=True)
+
+    result = runner.invoke(cli, ["--vault-path", str(tmp_path), "status"])
+    assert "No uncommitted changes" in result.output
+
+    with open(tmp_path / "sub" / "a.md", "a") as f:
+        f.write("z\n")
+    result = runner.invoke(cli, ["--vault-path", str(tmp_path), "status"])
+    assert result.exit_code == 0
+    assert "sub/a.md" in result.output
+
+
+def test_init_commits_gitignore(runner, tmp_path, git_identity):
+    """Test init creates the repo and commits .gitignore in one go."""
+    import subprocess
+
+    result = runner.invoke(cli, ["--vault-path", str(tmp_path), "init"])
+    assert result.exit_code == 0
+    assert "Committed .gitignore" in result.output
+
+    tracked = subprocess.run(
+        ["git", "-C", str(tmp_path), "ls-files"], capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert tracked == [".gitignore"]
+    assert ".obsidian/workspace.json" in (tmp_path / ".git" / "info" / "exclude").read_text()
+
+
+def test_commit_gitignore_skips_empty_commit(tmp_path, git_identity):
+    """Test committing .gitignore twice doesn't create an empty commit."""
+    import subprocess
+
+    from obsidian_git_bridge import initial_commit_with_gitignore
+
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text(".trash/\n")
+
+    assert initial_commit_with_gitignore(tmp_path)["commit_sha"] is not None
+    again = initial_commit_with_gitignore(tmp_path)
+    assert again["success"] is True
+    assert again["commit_sha"] is None
+    count = subprocess.run(
+        ["git", "-C", str(tmp_path), "rev-list", "--count", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert count == "1"
+
+
+def test_sync_now_pulls_commits_and_pushes(runner, tmp_path, git_identity):
+    """Test sync-now merges upstream changes and pushes local edits."""
+    import subprocess
+
+    def git(*args, cwd=tmp_path):
+        return subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout
+
+    remote, vault, other = tmp_path / "remote.git", tmp_path / "vault", tmp_path / "other"
+    git("init", "-q", "--bare", "-b", "main", str(remote))
+    git("clone", "-q", str(remote), str(vault))
+    (vault / "a.md").write_text("a\n")
+    git("add", "a.md", cwd=vault)
+    git("commit", "-q", "-m", "init", cwd=vault)
+    git("push", "-q", "origin", "HEAD", cwd=vault)
+    git("clone", "-q", str(remote), str(other))
+    (other / "b.md").write_text("b\n")
+    git("add", "b.md", cwd=other)
+    git("commit", "-q", "-m", "other", cwd=other)
+    git("push", "-q", "origin", "HEAD", cwd=other)
+
+    (vault / "c.md").write_text("c\n")
+    result = runner.invoke(cli, ["--vault-path", str(vault), "sync-now", "-m", "local edit"])
+
+    assert result.exit_code == 0, result.output
+    assert "Pulled latest changes" in result.output
+    assert "Pushed to remote" in result.output
+    assert (vault / "b.md").exists()
+    assert git("log", "-1", "--format=%s", "main", cwd=remote).strip() == "local edit"
+
+
+def _diverged_vault(tmp_path, conflict):
+    """Set up a vault with an unpushed commit behind a newer upstream commit."""
+    import subprocess
+
+    def git(*args, cwd=tmp_path):
+        return subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout
+
+    remote, vault, other = tmp_path / "remote.git", tmp_path / "vault", tmp_path / "other"
+    git("init", "-q", "--bare", "-b", "main", str(remote))
+    git("clone", "-q", str(remote), str(vault))
+    (vault / "a.md").write_text("a\n")
+    git("add", "a.md", cwd=vault)
+    git("commit", "-q", "-m", "init", cwd=vault)
+    git("push", "-q", "origin", "HEAD", cwd=vault)
+    git("clone", "-q", str(remote), str(other))
+    (other / ("a.md" if conflict else "b.md")).write_text("other\n")
+    git("add", "-A", cwd=other)
+    git("commit", "-q", "-m", "other", cwd=other)
+    git("push", "-q", "origin", "HEAD", cwd=other)
+
+    (vault / "a.md").write_text("local\n")
+    git("commit", "-q", "-am", "unpushed", cwd=vault)
+    return git, remote, vault
+
+
+def test_sync_now_rebases_diverged_history(runner, tmp_path, git_identity):
+    """Test sync-now rebases a local commit onto a diverged upstream and pushes."""
+    git, remote, vault = _diverged_vault(tmp_path, conflict=False)
+
+    result = runner.invoke(cli, ["--vault-path", str(vault), "sync-now", "-m", "local edit"])
+
+    assert result.exit_code == 0, result.output
+    assert "Pushed to remote" in result.output
+    assert git("log", "--format=%s", "main", cwd=remote).split("\n")[:2] == ["unpushed", "other"]
+
+
+def test_sync_now_reports_conflicting_rebase(runner, tmp_path, git_identity):
+    """Test a conflicting rebase is aborted and reported instead of a bare push failure."""
+    git, remote, vault = _diverged_vault(tmp_path, conflict=True)
+
+    result = runner.invoke(cli, ["--vault-path", str(vault), "sync-now", "-m", "local edit"])
+
+    assert result.exit_code == 1
+    assert "Rebase failed" in result.output
+    assert "diverged" in result.output
+    assert "Push" not in result.output
+    assert git("status", "--porcelain", cwd=vault) == ""
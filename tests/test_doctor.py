@@ -0,0 +1,157 @@
+"""Tests for Doctor diagnostics."""
+
+import subprocess
+from pathlib import Path
+
+from obsidian_git_bridge.doctor import Doctor, LARGE_FILE_THRESHOLD
+
+
+def _large_file_issue(issues):
+    return next((i for i in issues if "large file" in i["message"]), None)
+
+
+class TestDoctorLargeFiles:
+    """Test large-file detection."""
+
+    def test_flags_large_media_in_git_repo(self, tmp_path):
+        """Test large media files are flagged, small ones are not."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        with open(tmp_path / "video.mp4", "wb") as f:
+            f.truncate(LARGE_FILE_THRESHOLD + 1)
+        (tmp_path / "paper.pdf").write_bytes(b"%PDF")
+        (tmp_path / "note.md").write_text("# Note")
+
+        issue = _large_file_issue(Doctor(tmp_path)._check_large_files())
+        assert issue is not None
+        assert issue["details"] == ["video.mp4"]
+
+    def test_extension_match_is_case_insensitive(self, tmp_path):
+        """Test upper-case extensions are flagged."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        with open(tmp_path / "CLIP.MOV", "wb") as f:
+            f.truncate(LARGE_FILE_THRESHOLD + 1)
+
+        issue = _large_file_issue(Doctor(tmp_path)._check_large_files())
+        assert issue is not None
+        assert issue["details"] == ["CLIP.MOV"]
+
+    def test_respects_gitignore(self, tmp_path):
+        """Test ignored large files are not reported."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / ".gitignore").write_text("*.mp4\n")
+        with open(tmp_path / "video.mp4", "wb") as f:
+            f.truncate(LARGE_FILE_THRESHOLD + 1)
+
+        assert _large_file_issue(Doctor(tmp_path)._check_large_files()) is None
+
+    def test_walks_non_git_vault(self, tmp_path):
+        """Test detection falls back to walking a vault without Git."""
+        vault = tmp_path / "vault"
+        (vault / "media").mkdir(parents=True)
+        with open(vault / "media" / "archive.zip", "wb") as f:
+            f.truncate(LARGE_FILE_THRESHOLD + 1)
+
+        issue = _large_file_issue(Doctor(vault)._check_large_files())
+        assert issue is not None
+        assert issue["details"] == [str(Path("media") / "archive.zip")]
+
+
+class TestDoctorRunChecks:
+    """Test the full diagnostic run."""
+
+    def test_uninitialized_vault(self, tmp_path):
+        """Test an empty directory reports missing repo and .gitignore."""
+        issues = Doctor(tmp_path).run_checks()
+
+        actions = {i["fix_action"] for i in issues}
+        assert "init" in actions
+        assert "gitignore" in actions
+
+    def test_fix_initializes_repo(self, tmp_path):
+        """Test --fix initializes Git and writes .gitignore."""
+        issues = Doctor(tmp_path).run_checks(fix=True)
+
+        fixed = {i["fix_action"] for i in issues if i.get("fixed")}
+        assert {"init", "gitignore"} <= fixed
+        assert (tmp_path / ".git").is_dir()
+        assert (tmp_path / ".gitignore").is_file()
+
+    def test_configured_repo_has_no_metadata_issues(self, tmp_path):
+        """Test a repo with a remote and local user config passes metadata checks."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        for args in (
+            ["config", "user.name", "Test"],
+            ["config", "user.email", "test@example.com"],
+            ["remote", "add", "origin", "git@github.com:user/vault.git"],
+        ):
+            subprocess.run(["git", "-C", str(tmp_path), *args], check=True)
+
+        assert Doctor(tmp_path)._check_repo_metadata() == []
+
+    def test_user_config_falls_back_to_global(self, tmp_path, monkeypatch):
+        """Test user identity is read from ~/.gitconfig when not set locally."""
+        home = tmp_path / "home"
+        home.mkdir()
+        (home / ".gitconfig").write_text("[user]\n\tname = Global\n\temail = global@example.com\n")
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        vault = tmp_path / "vault"
+        subprocess.run(["git", "init", "-q", str(vault)], check=True)
+
+        messages = {i["message"] for i in Doctor(vault)._check_repo_metadata()}
+        assert messages == {"No remote repository configured"}
+
+    def test_user_config_from_include(self, tmp_path, monkeypatch):
+        """Test an identity pulled in through [include] counts as configured."""
+        home = tmp_path / "home"
+        home.mkdir()
+        (home / "identity").write_text("[user]\n\tname = Included\n\temail = inc@example.com\n")
+        (home / ".gitconfig").write_text("[include]\n\tpath = ~/identity\n")
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+        vault = tmp_path / "vault"
+        subprocess.run(["git", "init", "-q", str(vault)], check=True)
+
+        issues = Doctor(vault).run_checks(fix=True)
+        assert "user_config" not in {i["fix_action"] for i in issues}
+        local = subprocess.run(
+            ["git", "-C", str(vault), "config", "--local", "user.name"], capture_output=True
+        )
+        assert local.returncode == 1  # --fix left the local config alone
+
+    def test_missing_user_config(self, tmp_path, monkeypatch):
+        """Test missing user.name/user.email are reported as fixable."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+        vault = tmp_path / "vault"
+        subprocess.run(["git", "init", "-q", str(vault)], check=True)
+
+        issues = Doctor(vault)._check_repo_metadata()
+        assert {i["fix_action"] for i in issues} == {None, "user_config"}
+        assert len(issues) == 3
+
+    def test_fix_sets_local_user_config(self, tmp_path, monkeypatch):
+        """Test --fix writes user.name/user.email to the repo config."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+        vault = tmp_path / "vault"
+        subprocess.run(["git", "init", "-q", str(vault)], check=True)
+
+        issues = Doctor(vault).run_checks(fix=True)
+
+        assert all(i.get("fixed") for i in issues if i["fix_action"] == "user_config")
+        messages = [i["message"] for i in Doctor(vault)._check_repo_metadata()]
+        assert messages == ["No remote repository configured"]
+
+    def test_ssh_key_detection(self, tmp_path, monkeypatch):
+        """Test an id_* file in ~/.ssh clears the missing-key notice."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert len(Doctor(tmp_path)._check_ssh_key()) == 1
+
+        (tmp_path / ".ssh").mkdir()
+        (tmp_path / ".ssh" / "known_hosts").write_text("")
+        assert len(Doctor(tmp_path)._check_ssh_key()) == 1
+
+        (tmp_path / ".ssh" / "id_ed25519").write_text("")
+        assert Doctor(tmp_path)._check_ssh_key() == []
@@ -1,18 +1,8 @@
-#!/usr/bin/env python3
 """
-Manual test script for git_ops.py
-Tests all core functions.
+Tests for git_ops.py
+Covers all core functions.
 """
 
-import os
-import sys
-import tempfile
-import shutil
-from pathlib import Path
-
-# Add the source to path
-sys.path.insert(0, '/tmp/obsidian-git-bridge/src')
-
 from obsidian_git_bridge import (
     init_git_repo,
     configure_gitignore,
@@ -22,330 +12,640 @@ from obsidian_git_bridge import (
     pull_changes,
     push_changes,
     quick_sync,
+    quick_sync_many,
     get_git_info,
-    RepoStatus,
     GitError,
     NotAGitRepoError,
 )
 
-def test_init_git_repo():
+def test_init_git_repo(tmp_path):
     """Test 1: Initialize Git repository"""
     print("\n" + "="*60)
     print("TEST 1: init_git_repo()")
     print("="*60)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        vault_path = Path(tmpdir) / "test_vault"
-        
-        # Test creating new repo
-        result = init_git_repo(vault_path)
-        print(f"✓ Init new repo: {result['message']}")
-        assert result['success'] is True
-        assert result['was_already_init'] is False
-        assert (vault_path / ".git").exists()
-        
-        # Test idempotent (already initialized)
-        result2 = init_git_repo(vault_path)
-        print(f"✓ Init existing repo: {result2['message']}")
-        assert result2['was_already_init'] is True
-        
+    vault_path = tmp_path / "test_vault"
+    
+    # Test creating new repo
+    result = init_git_repo(vault_path)
+    print(f"✓ Init new repo: {result['message']}")
+    assert result['success'] is True
+    assert result['was_already_init'] is False
+    assert (vault_path / ".git").exists()
+    assert result['git_dir'] == str(vault_path / ".git")
+    
+    # Test idempotent (already initialized)
+    result2 = init_git_repo(vault_path)
+    print(f"✓ Init existing repo: {result2['message']}")
+    assert result2['was_already_init'] is True
+    
     print("✅ TEST 1 PASSED")
 
-def test_configure_gitignore():
+def test_init_honors_user_config(tmp_path, monkeypatch):
+    """Test 1b: init.defaultBranch and init.templateDir from the user's config win"""
+    import subprocess
+    
+    home = tmp_path / "home"
+    templates = tmp_path / "templates"
+    (templates / "info").mkdir(parents=True)
+    (templates / "info" / "exclude").write_text("from-template\n")
+    home.mkdir()
+    (home / ".gitconfig").write_text(
+        f"[init]\n\tdefaultBranch = trunk\n\ttemplateDir = {templates}\n"
+    )
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+    
+    vault_path = tmp_path / "vault"
+    assert init_git_repo(vault_path)['success'] is True
+    head = subprocess.run(
+        ["git", "-C", str(vault_path), "symbolic-ref", "--short", "HEAD"],
+        capture_output=True, text=True, check=True
+    )
+    assert head.stdout.strip() == "trunk"
+    assert (vault_path / ".git" / "info" / "exclude").read_text() == "from-template\n"
+    print("✅ TEST 1b PASSED")
+
+def test_configure_gitignore(tmp_path):
     """Test 2: Configure .gitignore"""
     print("\n" + "="*60)
     print("TEST 2: configure_gitignore()")
     print("="*60)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        vault_path = Path(tmpdir) / "test_vault"
-        vault_path.mkdir()
-        
-        # Test creating .gitignore
-        result = configure_gitignore(vault_path)
-        print(f"✓ Create .gitignore: {result['message']}")
-        assert result['success'] is True
-        assert result['created'] is True
-        
-        gitignore_path = vault_path / ".gitignore"
-        assert gitignore_path.exists()
-        
-        content = gitignore_path.read_text()
-        assert ".obsidian/workspace.json" in content
-        assert ".DS_Store" in content
-        print(f"✓ Content verified (patterns: {result['patterns_count']})")
-        
-        # Test idempotent
-        result2 = configure_gitignore(vault_path)
-        assert result2['created'] is False
-        print(f"✓ Idempotent check: {result2['message']}")
-        
-        # Test with custom patterns
-        result3 = configure_gitignore(
-            vault_path, 
-            custom_patterns=["*.secret", "private/"],
-            overwrite=True
-        )
-        content3 = gitignore_path.read_text()
-        assert "*.secret" in content3
-        assert "private/" in content3
-        print(f"✓ Custom patterns added")
-        
+    vault_path = tmp_path / "test_vault"
+    vault_path.mkdir()
+    
+    # Test creating .gitignore
+    result = configure_gitignore(vault_path)
+    print(f"✓ Create .gitignore: {result['message']}")
+    assert result['success'] is True
+    assert result['created'] is True
+    
+    gitignore_path = vault_path / ".gitignore"
+    assert gitignore_path.exists()
+    
+    content = result['content']
+    assert ".obsidian/workspace.json" in content
+    assert ".DS_Store" in result['patterns']
+    assert ".DS_Store" in content
+    print(f"✓ Content verified (patterns: {result['patterns_count']})")
+    
+    # Test idempotent
+    result2 = configure_gitignore(vault_path)
+    assert result2['created'] is False
+    print(f"✓ Idempotent check: {result2['message']}")
+    
+    # Test with custom patterns
+    result3 = configure_gitignore(
+        vault_path, 
+        custom_patterns=["*.secret", "private/"],
+        overwrite=True
+    )
+    content3 = result3['content']
+    assert "*.secret" in content3
+    assert "private/" in content3
+    print(f"✓ Custom patterns added")
+    
     print("✅ TEST 2 PASSED")
 
-def test_setup_remote():
+def test_setup_remote(vault_path):
     """Test 3: Setup remote"""
     print("\n" + "="*60)
     print("TEST 3: setup_remote()")
     print("="*60)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        vault_path = Path(tmpdir) / "test_vault"
-        init_git_repo(vault_path)
-        
-        # Test adding remote
-        result = setup_remote(vault_path, "https://github.com/user/repo.git")
-        print(f"✓ Add remote: {result['message']}")
-        assert result['success'] is True
-        assert result['created'] is True
-        assert result['remote_name'] == "origin"
-        
-        # Test idempotent (same URL)
-        result2 = setup_remote(vault_path, "https://github.com/user/repo.git")
-        assert result2['created'] is False
-        print(f"✓ Idempotent check: {result2['message']}")
-        
-        # Test update (different URL)
-        result3 = setup_remote(vault_path, "https://github.com/user/repo2.git")
-        assert result3.get('updated') is True
-        print(f"✓ Update remote: {result3['message']}")
-        
-        # Test SSH conversion
-        result4 = setup_remote(
-            vault_path, 
-            "https://github.com/user/ssh-repo.git",
-            remote_name="ssh-origin",
-            auth_method="ssh"
-        )
-        assert "git@github.com:" in result4['url']
-        print(f"✓ SSH conversion: {result4['url']}")
-        
+    
+    # Test adding remote
+    result = setup_remote(vault_path, "https://github.com/user/repo.git")
+    print(f"✓ Add remote: {result['message']}")
+    assert result['success'] is True
+    assert result['created'] is True
+    assert result['remote_name'] == "origin"
+    
+    # Test idempotent (same URL)
+    result2 = setup_remote(vault_path, "https://github.com/user/repo.git")
+    assert result2['created'] is False
+    print(f"✓ Idempotent check: {result2['message']}")
+    
+    # Test update (different URL)
+    result3 = setup_remote(vault_path, "https://github.com/user/repo2.git")
+    assert result3.get('updated') is True
+    print(f"✓ Update remote: {result3['message']}")
+    
+    # Test SSH conversion
+    result4 = setup_remote(
+        vault_path, 
+        "https://github.com/user/ssh-repo.git",
+        remote_name="ssh-origin",
+        auth_method="ssh"
+    )
+    assert result4['url'] == "git@github.com:user/ssh-repo.git"
+    assert result4['all_remotes'] == {
+        "origin": "git@github.com:user/repo2.git",
+        "ssh-origin": "git@github.com:user/ssh-repo.git",
+    }
+    print(f"✓ SSH conversion: {result4['url']}")
+    
+    # Missing .git suffix and trailing slash are normalized
+    result5 = setup_remote(
+        vault_path, 
+        "https://bitbucket.org/user/ssh-repo/",
+        remote_name="ssh-bitbucket",
+        auth_method="ssh"
+    )
+    assert result5['url'] == "git@bitbucket.org:user/ssh-repo.git"
+    print(f"✓ SSH conversion (Bitbucket): {result5['url']}")
+    
     print("✅ TEST 3 PASSED")
 
-def test_initial_commit():
+def test_setup_remote_config(vault_path):
+    """Test 3b: Setup remote writes the repository config"""
+    from obsidian_git_bridge import git_ops
+    
+    result = setup_remote(vault_path, "git@github.com:user/repo.git")
+    assert result['created'] is True
+    origin = git_ops._remote_config(str(vault_path))["origin"]
+    assert origin["url"] == "git@github.com:user/repo.git"
+    
+    assert setup_remote(vault_path, "git@github.com:user/repo.git")['created'] is False
+    assert setup_remote(vault_path, "git@github.com:user/repo2.git").get('updated') is True
+    origin = git_ops._remote_config(str(vault_path))["origin"]
+    assert origin["url"] == "git@github.com:user/repo2.git"
+    print("✅ TEST 3b PASSED")
+
+def test_status_backends_agree(vault_path):
+    """Test 5b: pygit2 and porcelain v2 status report the same state"""
+    import subprocess
+    import pytest
+    from obsidian_git_bridge import git_ops
+    if git_ops._pygit2() is None:
+        pytest.skip("pygit2 not installed")
+    
+    (vault_path / "note.md").write_text("# Note")
+    initial_commit(vault_path, push=False)
+    # Staged deletion that is also untracked in the work tree
+    subprocess.run(["git", "-C", str(vault_path), "rm", "-q", "--cached", "note.md"], check=True)
+    
+    for include_untracked in (True, False):
+        returncode, stdout = git_ops._fast_git(
+            [git_ops._GIT, "-C", str(vault_path), "status", "--porcelain=v2", "--branch", "-z",
+             f"--untracked-files={'all' if include_untracked else 'no'}"],
+            timeout=10
+        )
+        assert returncode == 0
+        expected = git_ops._parse_status_v2(stdout)
+        actual = git_ops._status_pygit2(str(vault_path), include_untracked, True)
+        assert actual == expected
+        assert actual['staged_files'] == ["note.md"]
+    print("✅ TEST 5b PASSED")
+
+def test_initial_commit(vault_path):
     """Test 4: Initial commit"""
     print("\n" + "="*60)
     print("TEST 4: initial_commit()")
     print("="*60)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        vault_path = Path(tmpdir) / "test_vault"
-        init_git_repo(vault_path)
-        
-        # Create a test file
-        (vault_path / "note.md").write_text("# Test Note")
-        
-        # Test initial commit (no remote, so won't push)
-        result = initial_commit(vault_path, message="Test initial commit", push=False)
-        print(f"✓ Initial commit: {result['message']}")
-        assert result['success'] is True
-        assert result['committed'] is True
-        assert result['commit_sha'] is not None
-        assert result['pushed'] is False  # No remote
-        
-        # Test idempotent (no changes)
-        result2 = initial_commit(vault_path, push=False)
-        assert result2['committed'] is False
-        print(f"✓ No changes: {result2['message']}")
-        
+    
+    # Create a test file
+    (vault_path / "note.md").write_text("# Test Note")
+    
+    # Test initial commit (no remote, so won't push)
+    result = initial_commit(vault_path, message="Test initial commit", push=False)
+    print(f"✓ Initial commit: {result['message']}")
+    assert result['success'] is True
+    assert result['committed'] is True
+    assert result['commit_sha'] is not None
+    assert result['pushed'] is False  # No remote
+    
+    # Test idempotent (no changes)
+    result2 = initial_commit(vault_path, push=False)
+    assert result2['committed'] is False
+    print(f"✓ No changes: {result2['message']}")
+    
     print("✅ TEST 4 PASSED")
 
-def test_get_repo_status():
+def test_get_repo_status(tmp_path):
     """Test 5: Get repo status"""
     print("\n" + "="*60)
     print("TEST 5: get_repo_status()")
     print("="*60)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        vault_path = Path(tmpdir) / "test_vault"
-        
-        # Test non-git directory
-        vault_path.mkdir()
-        status = get_repo_status(vault_path)
-        assert status.is_git_repo is False
-        print("✓ Non-git directory: correctly identified")
-        
-        # Init and test empty repo
-        init_git_repo(vault_path)
-        status = get_repo_status(vault_path)
-        assert status.is_git_repo is True
-        assert status.is_clean is True
-        print(f"✓ Empty repo status: clean={status.is_clean}")
-        
-        # Create files
-        (vault_path / "note1.md").write_text("# Note 1")
-        (vault_path / "note2.md").write_text("# Note 2")
-        
-        status = get_repo_status(vault_path)
-        assert status.is_clean is False
-        assert len(status.untracked_files) == 2
-        print(f"✓ Untracked files: {len(status.untracked_files)}")
-        
-        # Stage one file
+    vault_path = tmp_path / "test_vault"
+    
+    # Test non-git directory
+    vault_path.mkdir()
+    status = get_repo_status(vault_path)
+    assert status.is_git_repo is False
+    print("✓ Non-git directory: correctly identified")
+    
+    # Init and test empty repo
+    init_git_repo(vault_path)
+    status = get_repo_status(vault_path)
+    assert status.is_git_repo is True
+    assert status.is_clean is True
+    print(f"✓ Empty repo status: clean={status.is_clean}")
+    
+    # Create files
+    (vault_path / "note1.md").write_text("# Note 1")
+    (vault_path / "note2.md").write_text("# Note 2")
+    
+    status = get_repo_status(vault_path)
+    assert status.is_clean is False
+    assert len(status.untracked_files) == 2
+    print(f"✓ Untracked files: {len(status.untracked_files)}")
+    
+    status = get_repo_status(vault_path, include_untracked=False)
+    assert status.untracked_files == []
+    print("✓ Untracked scan skipped")
+    
+    # Stage one file, in-process when pygit2 is available
+    from obsidian_git_bridge import git_ops
+    pygit2 = git_ops._pygit2()
+    if pygit2 is not None:
+        index = pygit2.Repository(str(vault_path)).index
+        index.add("note1.md")
+        index.write()
+    else:
         import subprocess
-        subprocess.run(["git", "-C", str(vault_path), "add", "note1.md"], check=True)
-        
-        status = get_repo_status(vault_path)
-        assert len(status.staged_files) == 1
-        assert len(status.untracked_files) == 1
-        print(f"✓ Staged files: {len(status.staged_files)}")
-        
-        # Commit and check clean
-        initial_commit(vault_path, push=False)
-        status = get_repo_status(vault_path)
-        assert status.is_clean is True
-        print(f"✓ After commit: clean={status.is_clean}")
-        
-        print(f"\nStatus display:\n{status}")
-        
+        subprocess.run(
+            ["git", "-C", str(vault_path), "add", "note1.md"],
+            check=True, close_fds=False, stdin=subprocess.DEVNULL
+        )
+    
+    status = get_repo_status(vault_path)
+    assert len(status.staged_files) == 1
+    assert len(status.untracked_files) == 1
+    print(f"✓ Staged files: {len(status.staged_files)}")
+    
+    # Commit and check clean
+    initial_commit(vault_path, push=False)
+    status = get_repo_status(vault_path)
+    assert status.is_clean is True
+    print(f"✓ After commit: clean={status.is_clean}")
+    
+    print(f"\nStatus display:\n{status}")
+    
     print("✅ TEST 5 PASSED")
 
-def test_pull_and_push():
+def test_pull_and_push(vault_path):
     """Test 6: Pull and push changes"""
     print("\n" + "="*60)
     print("TEST 6: pull_changes() and push_changes()")
     print("="*60)
     
     # Note: These require actual remotes, so we test error cases
-    with tempfile.TemporaryDirectory() as tmpdir:
-        vault_path = Path(tmpdir) / "test_vault"
-        init_git_repo(vault_path)
-        
-        # Test pull on repo without remote
-        try:
-            pull_changes(vault_path)
-            print("✗ Should have raised error")
-        except GitError as e:
-            print(f"✓ Pull without remote: {e.message}")
-        
-        # Test push on repo without remote
-        try:
-            push_changes(vault_path)
-            print("✗ Should have raised error")
-        except GitError as e:
-            print(f"✓ Push without remote: {e.message}")
-        
+    
+    # Test pull on repo without remote
+    try:
+        pull_changes(vault_path)
+        print("✗ Should have raised error")
+    except GitError as e:
+        print(f"✓ Pull without remote: {e.message}")
+    
+    # Test push on repo without remote
+    try:
+        push_changes(vault_path)
+        print("✗ Should have raised error")
+    except GitError as e:
+        print(f"✓ Push without remote: {e.message}")
+    
     print("✅ TEST 6 PASSED (error handling)")
 
-def test_quick_sync():
+def test_quick_sync(vault_path, tmp_path):
     """Test 7: Quick sync"""
     print("\n" + "="*60)
     print("TEST 7: quick_sync()")
     print("="*60)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        vault_path = Path(tmpdir) / "test_vault"
-        init_git_repo(vault_path)
-        configure_gitignore(vault_path)
-        
-        # Create some files
-        (vault_path / "note.md").write_text("# Test")
-        initial_commit(vault_path, push=False)
-        
-        # Test quick_sync (will fail on pull without remote)
-        result = quick_sync(vault_path, message="Quick sync test")
-        print(f"✓ Quick sync attempted")
-        print(f"  Pull result: {result['operations'].get('pull', {}).get('error', 'success')}")
-        
+    configure_gitignore(vault_path)
+    
+    # Create some files
+    (vault_path / "note.md").write_text("# Test")
+    initial_commit(vault_path, push=False)
+    
+    # Test quick_sync (will fail on pull without remote)
+    result = quick_sync(vault_path, message="Quick sync test")
+    print(f"✓ Quick sync attempted")
+    print(f"  Pull result: {result['operations'].get('pull', {}).get('error', 'success')}")
+    
+    # Batch sync keeps input order and isolates per-vault failures
+    missing = tmp_path / "missing"
+    results = quick_sync_many([vault_path, missing], message="Batch sync test")
+    assert [r['path'] for r in results] == [str(vault_path), str(missing)]
+    assert results[1]['success'] is False
+    print(f"✓ Batch sync returned {len(results)} results")
+    
     print("✅ TEST 7 PASSED")
 
-def test_get_git_info():
+def test_quick_sync_with_remote(vault_path, tmp_path):
+    """Test 7b: Quick sync against a local bare remote"""
+    import subprocess
+    remote = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    (vault_path / "note.md").write_text("# Test")
+    initial_commit(vault_path, push=False)
+    subprocess.run(
+        ["git", "-C", str(vault_path), "remote", "add", "origin", str(remote)], check=True
+    )
+    subprocess.run(["git", "-C", str(vault_path), "push", "-q", "-u", "origin", "HEAD"], check=True)
+    
+    (vault_path / "note2.md").write_text("# Second")
+    result = quick_sync(vault_path, message="Quick sync test")
+    assert result['success'] is True
+    assert result['operations']['push']['committed'] is True
+    
+    log = subprocess.run(
+        ["git", "-C", str(remote), "log", "-1", "--all", "--format=%s"],
+        capture_output=True, text=True, check=True
+    )
+    assert log.stdout.strip() == "Quick sync test"
+    print("✅ TEST 7b PASSED")
+
+def test_quick_sync_reports_fast_path_commit(vault_path, tmp_path):
+    """Test 7c: A commit made before a failed push is still reported"""
+    import subprocess
+    remote = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    (vault_path / "note.md").write_text("# Test")
+    initial_commit(vault_path, push=False)
+    subprocess.run(
+        ["git", "-C", str(vault_path), "remote", "add", "origin", str(remote)], check=True
+    )
+    subprocess.run(["git", "-C", str(vault_path), "push", "-q", "-u", "origin", "HEAD"], check=True)
+    hook = remote / "hooks" / "pre-receive"
+    hook.write_text("#!/bin/sh\nexit 1\n")
+    hook.chmod(0o755)
+    
+    (vault_path / "note2.md").write_text("# Second")
+    result = quick_sync(vault_path, message="Rejected sync")
+    assert result['success'] is False
+    assert result['operations']['pull']['success'] is True
+    assert result['operations']['push']['committed'] is True
+    assert "error" in result['operations']['push']
+    
+    log = subprocess.run(
+        ["git", "-C", str(vault_path), "log", "--format=%s"],
+        capture_output=True, text=True, check=True
+    )
+    assert log.stdout.split("\n")[0] == "Rejected sync"
+    assert "Rejected sync" not in log.stdout.split("\n")[1:]
+    print("✅ TEST 7c PASSED")
+
+def test_get_git_info(vault_path):
     """Test 8: Get git info"""
     print("\n" + "="*60)
     print("TEST 8: get_git_info()")
     print("="*60)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        vault_path = Path(tmpdir) / "test_vault"
-        init_git_repo(vault_path)
-        setup_remote(vault_path, "https://github.com/user/repo.git")
-        
-        info = get_git_info(vault_path)
-        assert info['is_git_repo'] is True
-        assert info['git_installed'] is True
-        assert info['git_version'] is not None
-        assert 'remotes' in info
-        print(f"✓ Git installed: {info['git_version']}")
-        print(f"✓ Remotes: {info['remotes']}")
-        print(f"✓ Status: {info['status']}")
-        
+    setup_remote(vault_path, "https://github.com/user/repo.git")
+    
+    info = get_git_info(vault_path)
+    assert info['is_git_repo'] is True
+    assert info['git_installed'] is True
+    assert info['git_version'] is not None
+    assert 'remotes' in info
+    print(f"✓ Git installed: {info['git_version']}")
+    print(f"✓ Remotes: {info['remotes']}")
+    print(f"✓ Status: {info['status']}")
+    
     print("✅ TEST 8 PASSED")
 
-def test_error_handling():
+def test_error_handling(tmp_path):
     """Test 9: Error handling"""
     print("\n" + "="*60)
     print("TEST 9: Error handling")
     print("="*60)
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        non_git_path = Path(tmpdir) / "not_a_repo"
-        non_git_path.mkdir()
-        
-        # Test operations on non-git directory
-        try:
-            setup_remote(non_git_path, "https://github.com/user/repo.git")
-        except NotAGitRepoError as e:
-            print(f"✓ NotAGitRepoError: {e.message}")
-        
-        try:
-            initial_commit(non_git_path)
-        except NotAGitRepoError as e:
-            print(f"✓ NotAGitRepoError: {e.message}")
-        
-        try:
-            pull_changes(non_git_path)
-        except NotAGitRepoError as e:
-            print(f"✓ NotAGitRepoError: {e.message}")
-        
-        try:
-            push_changes(non_git_path)
-        except NotAGitRepoError as e:
-            print(f"✓ NotAGitRepoError: {e.message}")
-        
-        # Test status on non-git (should return not-git status, not raise)
-        status = get_repo_status(non_git_path)
-        assert status.is_git_repo is False
-        print(f"✓ Status on non-git: is_git_repo=False")
-        
+    non_git_path = tmp_path / "not_a_repo"
+    non_git_path.mkdir()
+    
+    # Test operations on non-git directory
+    try:
+        setup_remote(non_git_path, "https://github.com/user/repo.git")
+    except NotAGitRepoError as e:
+        print(f"✓ NotAGitRepoError: {e.message}")
+    
+    try:
+        initial_commit(non_git_path)
+    except NotAGitRepoError as e:
+        print(f"✓ NotAGitRepoError: {e.message}")
+    
+    try:
+        pull_changes(non_git_path)
+    except NotAGitRepoError as e:
+        print(f"✓ NotAGitRepoError: {e.message}")
+    
+    try:
+        push_changes(non_git_path)
+    except NotAGitRepoError as e:
+        print(f"✓ NotAGitRepoError: {e.message}")
+    
+    # Test status on non-git (should return not-git status, not raise)
+    status = get_repo_status(non_git_path)
+    assert status.is_git_repo is False
+    print(f"✓ Status on non-git: is_git_repo=False")
+    
     print("✅ TEST 9 PASSED")
 
-def main():
-    """Run all tests"""
+def test_fast_commit_runs_hooks(vault_path, git_identity):
+    """Test 9b: Commits go through git commit when a hook is enabled"""
+    import subprocess
+    from obsidian_git_bridge import git_ops
+    
+    
+    (vault_path / "note.md").write_text("# Note")
+    sha = git_ops._fast_commit(vault_path, "  plumbing  \n\n\n  body\n\n")
+    body = subprocess.run(
+        ["git", "-C", str(vault_path), "log", "-1", "--format=%B", sha],
+        capture_output=True, text=True, check=True
+    ).stdout
+    assert body == "  plumbing\n\n  body\n\n"
+    print("✓ Plumbing commit cleans up the message")
+    
+    hooks = vault_path / "hooks"
+    hooks.mkdir()
+    (hooks / "pre-commit").write_text("#!/bin/sh\necho rejected >&2\nexit 1\n")
+    (hooks / "pre-commit").chmod(0o755)
+    subprocess.run(["git", "-C", str(vault_path), "config", "core.hooksPath", "hooks"], check=True)
+    (vault_path / "note.md").write_text("# Edited")
+    try:
+        git_ops._fast_commit(vault_path, "blocked")
+        assert False, "pre-commit hook should have rejected the commit"
+    except GitError as e:
+        assert "rejected" in str(e)
+    print("✓ pre-commit hook from core.hooksPath ran")
+    
+    print("✅ TEST 9b PASSED")
+
+def test_cat_file_batch(vault_path):
+    """Test 10: Persistent cat-file batch process"""
+    print("\n" + "="*60)
+    print("TEST 10: _cat_file()")
+    print("="*60)
+
+    from obsidian_git_bridge.git_ops import _cat_file
+
+    (vault_path / "note.md").write_text("# Note\n")
+    initial_commit(vault_path, push=False)
+
+    batch = _cat_file(vault_path)
+    assert _cat_file(vault_path) is batch
+
+    head = batch.resolve("HEAD")
+    assert head is not None and len(head) == 40
+    print(f"✓ HEAD resolved: {head[:8]}")
+
+    sha, obj_type, content = batch.read_object("HEAD:note.md")
+    assert obj_type == "blob"
+    assert content == b"# Note\n"
+    print(f"✓ Blob read: {sha[:8]}")
+
+    assert batch.read_object("does-not-exist") is None
+    print("✓ Missing object returns None")
+
+    assert batch.read_object("HEAD:a b.md") is None
+    assert batch.read_object("HEAD:a b c.md") is None
+    assert batch.resolve("HEAD") == head
+    print("✓ Missing path with spaces returns None")
+
+    batch.close()
+
+    print("✅ TEST 10 PASSED")
+
+def test_parse_status_v2():
+    """Test 11: Porcelain v2 status parsing"""
     print("\n" + "="*60)
-    print("OBSIDIAN GIT BRIDGE - MANUAL TEST SUITE")
+    print("TEST 11: _parse_status_v2()")
     print("="*60)
     
-    try:
-        test_init_git_repo()
-        test_configure_gitignore()
-        test_setup_remote()
-        test_initial_commit()
-        test_get_repo_status()
-        test_pull_and_push()
-        test_quick_sync()
-        test_get_git_info()
-        test_error_handling()
-        
-        print("\n" + "="*60)
-        print("✅ ALL TESTS PASSED!")
-        print("="*60)
-        return 0
-        
-    except Exception as e:
-        print(f"\n❌ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
+    from obsidian_git_bridge.git_ops import _parse_status_v2
+    
+    output = b"\x00".join([
+        b"# branch.oid 1111111111111111111111111111111111111111",
+        b"# branch.head main",
+        b"# branch.upstream origin/main",
+        b"# branch.ab +2 -1",
+        b"1 .M N... 100644 100644 100644 aaaa aaaa notes/a b.md",
+        b"1 A. N... 000000 100644 100644 0000 bbbb new.md",
+        b"2 R. N... 100644 100644 100644 cccc cccc R100 renamed.md",
+        b"old.md",
+        b"u UU N... 100644 100644 100644 100644 dddd eeee ffff conflict.md",
+        b"? draft.md",
+        b"",
+    ])
+    fields = _parse_status_v2(output)
+    assert fields["branch"] == "main"
+    assert fields["upstream_branch"] == "origin/main"
+    assert (fields["commits_ahead"], fields["commits_behind"]) == (2, 1)
+    assert fields["can_fast_forward"] is False
+    assert fields["modified_files"] == ["notes/a b.md"]
+    assert fields["staged_files"] == ["new.md", "renamed.md"]
+    assert fields["untracked_files"] == ["draft.md"]
+    assert fields["has_conflicts"] is True
+    print("✓ Branch, ahead/behind and file states parsed")
+    
+    fields = _parse_status_v2(output, limit=1)
+    assert fields["staged_files"] == ["new.md"]
+    assert fields["modified_files"] == ["notes/a b.md"]
+    assert fields["truncated"] is True
+    assert fields["has_uncommitted_changes"] is True
+    print("✓ File lists capped with truncated flag")
+    
+    fields = _parse_status_v2(
+        b"# branch.head main\x00# branch.upstream origin/main\x00# branch.ab +? -?\x00"
+    )
+    assert (fields["commits_ahead"], fields["commits_behind"]) == (0, 0)
+    assert fields["can_fast_forward"] is False
+    print("✓ Unknown ahead/behind (--no-ahead-behind)")
+    
+    detached = _parse_status_v2(b"# branch.oid (initial)\x00# branch.head (detached)\x00")
+    assert detached["branch"] is None
+    print("✓ Detached HEAD")
+    
+    print("✅ TEST 11 PASSED")
 
-if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+def test_is_git_repo_fast_path(vault_path, tmp_path):
+    """Test 12: Filesystem-only repository detection"""
+    print("\n" + "="*60)
+    print("TEST 12: _is_git_repo()")
+    print("="*60)
+    
+    from obsidian_git_bridge.git_ops import _is_git_repo
+    
+    assert _is_git_repo(vault_path) is True
+    print("✓ .git directory detected")
+    
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {vault_path / '.git'}\n")
+    assert _is_git_repo(worktree) is True
+    print("✓ .git file detected")
+    
+    nested = vault_path / "subfolder"
+    nested.mkdir()
+    assert _is_git_repo(nested) is False
+    assert _is_git_repo(nested, allow_bare=True) is True
+    print("✓ rev-parse only with allow_bare")
+    
+    import shutil
+    import subprocess
+    parent = tmp_path / "parent"
+    inner = parent / "inner"
+    inner.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(parent)], check=True)
+    assert _is_git_repo(inner, allow_bare=True) is True
+    shutil.rmtree(parent / ".git")
+    assert _is_git_repo(inner, allow_bare=True) is False
+    print("✓ Nested vault follows its parent repository")
+    
+    print("✅ TEST 12 PASSED")
+
+def test_repo_status_cache(vault_path):
+    """Test 13: In-process status cache"""
+    print("\n" + "="*60)
+    print("TEST 13: get_repo_status() caching")
+    print("="*60)
+    
+    (vault_path / "note.md").write_text("# Note")
+    
+    status = get_repo_status(vault_path)
+    assert get_repo_status(vault_path) is not status
+    print("✓ Uncached by default")
+    
+    status = get_repo_status(vault_path, max_age=60)
+    assert get_repo_status(vault_path, max_age=60) is status
+    print("✓ Repeated call served from cache with max_age")
+    
+    assert get_repo_status(vault_path, include_untracked=False, max_age=60) is not status
+    print("✓ Options are part of the cache key")
+    
+    (vault_path / "sub").mkdir()
+    (vault_path / "sub" / "a.md").write_text("a")
+    initial_commit(vault_path, push=False)
+    status = get_repo_status(vault_path, max_age=60)
+    assert status.is_clean is True
+    print("✓ Write operation invalidated the cache")
+    
+    # Neither change moves the index or vault root mtime
+    with open(vault_path / "note.md", "a") as f:
+        f.write("\nedited")
+    status = get_repo_status(vault_path)
+    assert status.is_clean is False
+    assert "note.md" in status.modified_files
+    print("✓ Tracked-file edit seen on the next default call")
+    
+    (vault_path / "sub" / "new.md").write_text("new")
+    status = get_repo_status(vault_path)
+    assert "sub/new.md" in status.untracked_files
+    print("✓ New file in a subdirectory seen on the next default call")
+    
+    try:
+        status.branch = "other"
+        assert False, "cached RepoStatus should be immutable"
+    except AttributeError:
+        pass
+    assert str(status) is str(status)
+    print("✓ Cached status is frozen and renders once")
+    
+    print("✅ TEST 13 PASSED")
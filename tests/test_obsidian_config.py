@@ -1,8 +1,10 @@
 """Tests for Obsidian config module."""
 
+import json
+
 import pytest
-from pathlib import Path
 
+from obsidian_git_bridge.obsidian_config import configure_obsidian_git_plugin, get_vault_info
 from obsidian_git_bridge.wrappers import ObsidianConfig
 
 
@@ -36,6 +38,29 @@ class TestObsidianConfig:
         assert result is not None
         assert result.name == "Obsidian"
     
+    def test_detect_vault_path_prefers_list_order(self, tmp_path, monkeypatch):
+        """Test the first matching location wins although probes run concurrently."""
+        for name in ("first", "second"):
+            (tmp_path / name / ".obsidian").mkdir(parents=True)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        
+        config = ObsidianConfig()
+        config.COMMON_VAULT_PATHS = ["~/missing", "~/second", "~/first"]
+        assert config.detect_vault_path() == (tmp_path / "second").resolve()
+    
+    def test_detect_vault_path_sees_new_vault(self, tmp_path, monkeypatch):
+        """Test a vault created after a negative lookup is found in-process."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        config = ObsidianConfig()
+        config.COMMON_VAULT_PATHS = ["~/later"]
+        assert config.detect_vault_path() is None
+        
+        (tmp_path / "later" / ".obsidian").mkdir(parents=True)
+        assert config.detect_vault_path() == (tmp_path / "later").resolve()
+        
+        (tmp_path / "Obsidian" / ".obsidian").mkdir(parents=True)
+        assert config.detect_vault_path() == (tmp_path / "Obsidian").resolve()
+    
     def test_validate_vault_true(self, tmp_path):
         """Test valid vault detection."""
         vault = tmp_path / "test-vault"
@@ -64,3 +89,43 @@ class TestObsidianConfig:
         config = ObsidianConfig()
         name = config.get_vault_name(vault)
         assert name == "My Vault"
+    
+    def test_get_vault_info_counts_notes(self, tmp_path):
+        """Test markdown counting recurses but skips dot-dirs and node_modules."""
+        vault = tmp_path / "vault"
+        (vault / ".obsidian").mkdir(parents=True)
+        (vault / "daily" / "2024").mkdir(parents=True)
+        (vault / ".trash").mkdir()
+        (vault / "node_modules").mkdir()
+        (vault / "index.md").write_text("# Index")
+        (vault / "daily" / "2024" / "01-01.md").write_text("# Day")
+        (vault / "daily" / "image.png").write_bytes(b"")
+        (vault / ".trash" / "old.md").write_text("# Old")
+        (vault / "node_modules" / "README.md").write_text("# Pkg")
+        
+        info = get_vault_info(str(vault))
+        assert info["markdown_files"] == 2
+    
+    def test_configure_plugin_keeps_existing_manifest(self, tmp_path):
+        """Test data.json is rewritten but an existing manifest.json is left alone."""
+        vault = tmp_path / "vault"
+        plugin_dir = vault / ".obsidian" / "plugins" / "obsidian-git"
+        plugin_dir.mkdir(parents=True)
+        (vault / "note.md").write_text("# Note")
+        
+        configure_obsidian_git_plugin(str(vault))
+        manifest = json.loads((plugin_dir / "manifest.json").read_text())
+        assert manifest["id"] == "obsidian-git"
+        
+        (plugin_dir / "manifest.json").write_text('{"id": "obsidian-git", "version": "9.9.9"}')
+        configure_obsidian_git_plugin(str(vault), interval=5)
+        
+        assert json.loads((plugin_dir / "manifest.json").read_text())["version"] == "9.9.9"
+        assert json.loads((plugin_dir / "data.json").read_text())["autoBackupInterval"] == 5
+    
+    def test_default_plugin_config_is_plain_dict(self):
+        """Test the public default config stays a JSON-serializable dict."""
+        from obsidian_git_bridge.obsidian_config import DEFAULT_OBSIDIAN_GIT_CONFIG
+        
+        assert isinstance(DEFAULT_OBSIDIAN_GIT_CONFIG, dict)
+        assert json.loads(json.dumps(DEFAULT_OBSIDIAN_GIT_CONFIG))["autoPush"] is True
@@ -1,11 +1,20 @@
 """Tests for VPS setup generator."""
 
-import pytest
-from pathlib import Path
+import os
 
 from obsidian_git_bridge.wrappers import VPSSetupGenerator
 
 
+def _slurp_and_stat(path):
+    """Read a file and stat it through one descriptor (raises if missing)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        return os.read(fd, st.st_size), st
+    finally:
+        os.close(fd)
+
+
 class TestVPSSetupGenerator:
     """Test VPSSetupGenerator class."""
     
@@ -31,9 +40,10 @@ class TestVPSSetupGenerator:
         vps = VPSSetupGenerator(vault_path, output_dir)
         script_path = vps.generate_cron_script()
         
-        assert script_path.exists()
-        assert script_path.stat().st_mode & 0o111  # Executable
-        content = script_path.read_text()
+        data, st = _slurp_and_stat(script_path)
+        assert st.st_mode & 0o111  # Executable
+        content = data.decode()
+        assert content == vps.last_generated_content
         assert "#!/bin/bash" in content
         assert "test-vault" in content
     
@@ -60,8 +70,9 @@ class TestVPSSetupGenerator:
         vps = VPSSetupGenerator(vault_path, output_dir)
         instructions_path = vps.generate_setup_instructions()
         
-        assert instructions_path.exists()
-        content = instructions_path.read_text()
+        data, _ = _slurp_and_stat(instructions_path)
+        content = data.decode()
+        assert content == vps.last_generated_content
         assert "test-vault" in content
         assert "VPS Setup Instructions" in content
     
@@ -80,3 +91,19 @@ class TestVPSSetupGenerator:
         assert "instructions" in setup
         assert setup["script"].exists()
         assert setup["instructions"].exists()
+    
+    def test_regenerate_skips_untouched_files(self, tmp_path):
+        """Test repeat generation leaves untouched files alone but restores edited ones."""
+        vault_path = tmp_path / "test-vault"
+        vault_path.mkdir()
+        
+        vps = VPSSetupGenerator(vault_path, tmp_path)
+        script_path = vps.generate_cron_script()
+        mtime = script_path.stat().st_mtime_ns
+        
+        vps.get_full_setup()
+        assert script_path.stat().st_mtime_ns == mtime
+        
+        script_path.write_text("edited")
+        vps.generate_cron_script()
+        assert script_path.read_text() == vps.last_generated_content